@@ -0,0 +1,235 @@
+"""Timing, calibration and baselines for the benchmarks.
+
+A benchmark is a function, registered with :func:`benchmark`, that returns a
+list of times in seconds, one for each repetition of a unit of work: a frame
+of a game, or slicing a sprite sheet. Its result is the median, and the 95th
+percentile for information. A benchmark that can't run here, for want of an
+optional package, returns None.
+
+Times differ from one computer to the next, and on one computer from one
+minute to the next, so medians are divided by the median time of a fixed
+calibration workload, measured just before each benchmark runs. That ratio,
+the score, is what baselines.json stores and compares. A benchmark has
+regressed when its score is more than its threshold above the baseline, on
+its best of a few runs.
+"""
+
+import contextlib
+import json
+import math
+import os
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import pygame
+
+from jtlgames import assets, text
+from jtlgames.sim import RandomInput, Simulation
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINES = Path(__file__).resolve().parent / "baselines.json"
+
+# How far above its baseline a benchmark may be before it fails
+THRESHOLD = float(os.environ.get("JTL_BENCH_THRESHOLD", 0.25))
+
+# The keys random input mashes in game benchmarks
+KEYS = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_SPACE, pygame.K_RETURN]
+
+BENCHMARKS = {}
+
+
+def benchmark(func=None, threshold=None):
+    """Registers a benchmark function. A threshold given here overrides THRESHOLD
+    for a benchmark that is noisier than most."""
+
+    def register(func):
+        func.threshold = threshold
+        BENCHMARKS[func.__name__] = func
+        return func
+
+    return register(func) if func is not None else register
+
+
+def repeat(func, rounds, warmup=5):
+    """Calls func warmup + rounds times and returns the times of the last rounds calls"""
+
+    times = []
+    for i in range(warmup + rounds):
+        start = perf_counter()
+        func()
+        if i >= warmup:
+            times.append(perf_counter() - start)
+    return times
+
+
+def game_frames(script, frames=600, seed=1, argv=(), keys=KEYS, warmup=30):
+    """Runs a game script headless and returns the times of its frames after the first warmup"""
+
+    times = []
+    last = None
+
+    def on_frame(sim):
+        nonlocal last
+        now = perf_counter()
+        if last is not None and sim.frame > warmup:
+            times.append(now - last)
+        last = now
+
+    inputs = RandomInput(keys, seed) if keys else None
+    Simulation(seed, frames, inputs, on_frame=on_frame).run_script(ROOT / script, argv)
+    return times
+
+
+@contextlib.contextmanager
+def game_dir(directory):
+    """Lets a benchmark import a game's modules and load its assets, as if it ran from its directory.
+
+    The modules are forgotten afterwards, as Simulation.run_script does.
+    """
+
+    directory = str(Path(ROOT / directory).resolve())
+    cwd = os.getcwd()
+    modules = set(sys.modules)
+    sys.path.insert(0, directory)
+    os.chdir(directory)
+    assets.registry.clear()
+
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+        sys.path.remove(directory)
+        for name in set(sys.modules) - modules:
+            if (getattr(sys.modules[name], "__file__", None) or "").startswith(directory):
+                del sys.modules[name]
+        pygame.quit()
+        text.clear()
+
+
+def percentile(times, q):
+    """The q-th percentile, by nearest rank"""
+
+    times = sorted(times)
+    return times[max(0, math.ceil(q / 100 * len(times)) - 1)]
+
+
+def calibrate(rounds=101):
+    """Returns the median time of a fixed mix of interpreter and pygame work, in seconds"""
+
+    surface = pygame.Surface((320, 240))
+    tile = pygame.Surface((16, 16))
+    tile.fill((200, 100, 50))
+    rng = random.Random(0)
+    points = [(rng.randrange(304), rng.randrange(224)) for _ in range(400)]
+
+    def work():
+        cells = {}
+        for x, y in points:
+            cells.setdefault((x // 32, y // 32), []).append((x, y))
+            surface.blit(tile, (x, y))
+        sum(len(v) for v in cells.values())
+        sorted(points, key=lambda p: p[0] * p[0] + p[1] * p[1])
+
+    return percentile(repeat(work, rounds), 50)
+
+
+class Result(object):
+    """A benchmark's times, summarized and compared with its baseline.
+
+    Attributes:
+        name (str): The benchmark's name.
+        median (float): Median time, in ms.
+        p95 (float): 95th percentile time, in ms.
+        score (float): The median divided by the calibration time.
+        baseline (float): The baseline score, or None if there isn't one.
+        threshold (float): The fraction above the baseline that fails.
+    """
+
+    def __init__(self, name, times, calibration, baseline=None, threshold=THRESHOLD):
+        self.name = name
+        self.samples = len(times)
+        self.median = percentile(times, 50) * 1000
+        self.p95 = percentile(times, 95) * 1000
+        self.score = self.median / (calibration * 1000)
+        self.baseline = baseline
+        self.threshold = threshold
+
+    @property
+    def ratio(self):
+        """The score relative to the baseline, or None"""
+        return self.score / self.baseline if self.baseline else None
+
+    @property
+    def regressed(self):
+        return self.ratio is not None and self.ratio > 1 + self.threshold
+
+    def __str__(self) -> str:
+        if self.ratio is None:
+            verdict = "no baseline"
+        else:
+            verdict = f"{self.ratio:5.2f}x baseline" + (" REGRESSED" if self.regressed else "")
+        return (f"{self.name:<28} {self.median:8.3f} ms  p95 {self.p95:8.3f} ms  "
+                f"score {self.score:7.3f}  {verdict}")
+
+
+def load_baselines(path=BASELINES):
+    path = Path(path)
+    return json.loads(path.read_text())["benchmarks"] if path.exists() else {}
+
+
+def save_baselines(results, path=BASELINES):
+    """Writes the scores of results into the baselines file, keeping other benchmarks' baselines"""
+
+    path = Path(path)
+    data = json.loads(path.read_text()) if path.exists() else {"benchmarks": {}}
+    for r in results:
+        data["benchmarks"][r.name] = {"score": round(r.score, 4), "median_ms": round(r.median, 4),
+                                      "p95_ms": round(r.p95, 4)}
+    data["benchmarks"] = dict(sorted(data["benchmarks"].items()))
+    path.write_text(json.dumps(data, indent=2) + "\n")
+    return path
+
+
+def measure(name, baselines=None):
+    """Runs one registered benchmark once and returns its Result, or None if it was skipped"""
+
+    func = BENCHMARKS[name]
+    baseline = (baselines or {}).get(name, {}).get("score")
+    threshold = func.threshold if func.threshold is not None else THRESHOLD
+
+    calibration = calibrate()
+    times = func()
+    return Result(name, times, calibration, baseline, threshold) if times else None
+
+
+def run_benchmark(name, baselines, attempts=3):
+    """Runs one registered benchmark and returns its Result, or None if it was skipped.
+
+    A run that looks like a regression is repeated, up to attempts runs in
+    all, and the best one is returned, so one slow run on a busy computer
+    doesn't fail the suite.
+    """
+
+    best = None
+    for _ in range(attempts):
+        result = measure(name, baselines)
+        if result is None:
+            return None
+        if best is None or result.score < best.score:
+            best = result
+        if not best.regressed:
+            break
+
+    return best
+
+
+def baseline_run(name, runs=5):
+    """Runs one registered benchmark several times and returns the Result with
+    the median score, to store as its baseline, or None if it was skipped"""
+
+    results = [measure(name) for _ in range(runs)]
+    if None in results:
+        return None
+    return sorted(results, key=lambda r: r.score)[runs // 2]
@@ -0,0 +1,70 @@
+"""Runs the benchmarks headless and compares them with the stored baselines.
+
+    python benchmarks/run.py                  # all of them
+    python benchmarks/run.py invaders text    # the ones whose names contain a word given
+    python benchmarks/run.py --update         # and store the results as the baselines
+    python -m pytest benchmarks               # as tests, which fail on a regression
+
+The exit status is 1 if any benchmark regressed by more than its threshold
+(25% by default, or JTL_BENCH_THRESHOLD). See harness.py for how the times
+are normalized so baselines carry over between computers.
+
+Update the baselines when a change makes something faster on purpose, so
+the gain is protected from then on, and in the same commit.
+"""
+
+import argparse
+import sys
+
+import harness
+import scenarios  # noqa: F401  registers the benchmarks
+
+
+def parse_args(args):
+    """Parse command line parameters
+
+    Args:
+      args (List[str]): command line parameters as list of strings
+
+    Returns:
+      :obj:`argparse.Namespace`: command line parameters namespace
+    """
+    parser = argparse.ArgumentParser(description="Run the jtlgames benchmarks")
+    parser.add_argument("names", help="Only run benchmarks whose names contain one of these", nargs="*")
+    parser.add_argument("-u", "--update", help="Store the median of five runs as the new baselines",
+                        action="store_true")
+    parser.add_argument("-l", "--list", help="List the benchmarks and exit", action="store_true")
+    return parser.parse_args(args)
+
+
+def main(args):
+    args = parse_args(args)
+    names = [n for n in harness.BENCHMARKS if not args.names or any(word in n for word in args.names)]
+
+    if args.list:
+        for name in names:
+            print(f"{name:<28} {(harness.BENCHMARKS[name].__doc__ or '').strip()}")
+        return 0
+
+    baselines = harness.load_baselines()
+    results = []
+    for name in names:
+        if args.update:
+            result = harness.baseline_run(name)
+        else:
+            result = harness.run_benchmark(name, baselines)
+        if result is None:
+            print(f"{name:<28} skipped")
+            continue
+        results.append(result)
+        print(result)
+
+    if args.update:
+        print(f"baselines saved to {harness.save_baselines(results)}")
+        return 0
+
+    return 1 if any(r.regressed for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
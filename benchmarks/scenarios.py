@@ -0,0 +1,236 @@
+"""The benchmarks: jtlgames building blocks, and whole frames of the bundled games.
+
+Game benchmarks run the game scripts headless on jtlgames.sim's virtual
+clock with seeded random input, so every run plays the same frames.
+"""
+
+import random
+
+import pygame
+
+from harness import ROOT, benchmark, game_dir, game_frames, repeat
+from jtlgames import text
+from jtlgames.spritesheet import SpriteSheet
+from jtlgames.terrain import ChunkedTerrain
+
+SHEET = ROOT / "src/jtlgames/tests/images/spritesheet.png"
+
+
+# Library
+
+@benchmark
+def spritesheet_slice():
+    """Slicing every cell of a sheet, scaled and flipped, with an empty cache"""
+
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    sheet = SpriteSheet(SHEET, (16, 16))
+
+    def slice_all():
+        sheet.clear_cache()
+        for i in range(sheet.num_sprites):
+            sheet.image_at(i, colorkey=-1, scale=(32, 32), flip=(True, False))
+
+    times = repeat(slice_all, 100)
+    pygame.quit()
+    return times
+
+
+@benchmark
+def spritesheet_cached():
+    """Looking up every cell of a sheet, ten times, once it is cached"""
+
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    sheet = SpriteSheet(SHEET, (16, 16))
+
+    def lookup_all():
+        for _ in range(10):
+            for i in range(sheet.num_sprites):
+                sheet.image_at(i, colorkey=-1, scale=(32, 32))
+
+    times = repeat(lookup_all, 100)
+    pygame.quit()
+    return times
+
+
+@benchmark
+def text_render():
+    """Ten frames of HUD text: a few fixed labels and a score that changes every frame"""
+
+    pygame.init()
+    font = text.font(None, 24)
+    score = 0
+
+    def hud():
+        nonlocal score
+        for _ in range(10):
+            score += 10
+            for label in ("Lives: 3", "Wave 4", "Fuel", "Altitude"):
+                text.render(font, label, (255, 255, 255))
+            font.render(f"Score: {score}", True, (255, 255, 255))
+
+    times = repeat(hud, 300)
+    pygame.quit()
+    text.clear()
+    return times
+
+
+@benchmark
+def text_counter():
+    """Ten frames of a score drawn from a glyph atlas, changing every frame"""
+
+    pygame.init()
+    font = text.font(None, 24)
+    counter = text.Counter(font, (255, 255, 255), "Score: {}", text.GlyphAtlas(font, (255, 255, 255)))
+    score = iter(range(0, 10 ** 9, 10))
+
+    def hud():
+        for _ in range(10):
+            counter.render(next(score))
+
+    times = repeat(hud, 300)
+    pygame.quit()
+    text.clear()
+    return times
+
+
+@benchmark
+def terrain_scroll():
+    """Ten frames of flying over chunked terrain: drawing it and asking its height"""
+
+    pygame.init()
+    screen = pygame.display.set_mode((600, 600))
+    terrain = ChunkedTerrain(seed=1, chunk_width=300, base_y=520)
+    camera_x = 0
+
+    def fly():
+        nonlocal camera_x
+        for _ in range(10):
+            camera_x += 7.5
+            terrain.draw(screen, camera_x)
+            for dx in range(0, 600, 20):
+                terrain.height_at(camera_x + dx)
+
+    times = repeat(fly, 300)
+    pygame.quit()
+    return times
+
+
+# Games: whole update + draw frames
+
+@benchmark
+def invaders_formation():
+    """Space Invaders from the first wave's full formation on"""
+    return game_frames("games/Space_Invaders_Classic/main.py", frames=600)
+
+
+@benchmark
+def asteroids_late_wave():
+    """Asteroids with 30 rocks and their pieces, as in a late wave"""
+    return game_frames("lessons/07_Projects/04_Asteroids/main.py", frames=360, keys=None,
+                       argv=["--asteroids", "30"])
+
+
+@benchmark
+def asteroids_numpy_300():
+    """Asteroids in --numpy mode with 300 rocks. Skipped without NumPy."""
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return None
+    return game_frames("lessons/07_Projects/04_Asteroids/main.py", frames=300, keys=None,
+                       argv=["--numpy", "--asteroids", "300"])
+
+
+@benchmark
+def lunar_lander():
+    """Lunar Lander's fixed-step loop, with random thrust and steering"""
+    return game_frames("lessons/07_Projects/05_Lunar_Lander/main.py", frames=600)
+
+
+@benchmark
+def mars_meteor_storm():
+    """One tick of Mars Lander's mission loop, with 300 meteors falling"""
+
+    with game_dir("games/Mars-lander"):
+        import game as mars
+
+        random.seed(1)
+        g = mars.Game()
+        g.spawn_pads()
+        g.spawn_obstacles()
+        g.spawn_meteors(300, random_height=True)
+
+        def tick():
+            g.update_all_elements()
+            g.replace_off_screen_meteors()
+            g.spawn_meteors(len(pygame.sprite.groupcollide(g.pad_sprites, g.meteor_sprites, False, True)))
+            g.spawn_meteors(len(pygame.sprite.groupcollide(g.obstacle_sprites, g.meteor_sprites, False, True)))
+            pygame.sprite.spritecollide(g.lander, g.meteor_sprites, False)
+
+        return repeat(tick, 300)
+
+
+def mars_storm(meteors):
+    """One tick of Mars Lander's mission loop in --storm mode, or None without NumPy"""
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return None
+
+    with game_dir("games/Mars-lander"):
+        import game as mars
+
+        random.seed(1)
+        g = mars.Game(storm=meteors)
+        g.spawn_pads()
+        g.spawn_obstacles()
+        g.storm.start()
+
+        def tick():
+            g.update_all_elements()
+            g.replace_off_screen_meteors()
+            g.storm.replace_hits(g.pad_sprites)
+            g.storm.replace_hits(g.obstacle_sprites)
+            g.storm.hit(g.lander)
+
+        return repeat(tick, 300)
+
+
+@benchmark
+def mars_storm_1000():
+    """Mars Lander's mission loop with a storm of 1000 meteors. Skipped without NumPy."""
+    return mars_storm(1000)
+
+
+@benchmark
+def mars_storm_5000():
+    """Mars Lander's mission loop with a storm of 5000 meteors. Skipped without NumPy."""
+    return mars_storm(5000)
+
+
+@benchmark
+def mars_hud():
+    """Ten ticks of Mars Lander's instrument panel, with the lander falling"""
+
+    with game_dir("games/Mars-lander"):
+        import game as mars
+
+        random.seed(1)
+        g = mars.Game()
+
+        def ticks():
+            for _ in range(10):
+                g.lander.update()
+                if g.lander.current_altitude() < 0:
+                    g.lander = mars.Lander()
+                g.ticks += 1
+                g.time = g.ticks / 30
+                g.update_lander_meters()
+                g.hud.draw(g.screen)
+                g.counters.draw(g.screen)
+
+        return repeat(ticks, 300)
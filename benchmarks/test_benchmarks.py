@@ -0,0 +1,26 @@
+"""The benchmarks as pytest tests: each fails if it regressed past its threshold.
+
+    python -m pytest benchmarks -v
+"""
+
+import pytest
+
+import harness
+import scenarios  # noqa: F401  registers the benchmarks
+
+
+@pytest.fixture(scope="module")
+def baselines():
+    return harness.load_baselines()
+
+
+@pytest.mark.parametrize("name", list(harness.BENCHMARKS))
+def test_benchmark(name, baselines):
+    result = harness.run_benchmark(name, baselines)
+    if result is None:
+        pytest.skip("can't run here")
+    print(result)
+
+    if result.baseline is None:
+        pytest.skip(f"no baseline; run benchmarks/run.py --update {name}")
+    assert not result.regressed, str(result)
@@ -0,0 +1,49 @@
+"""Space Invaders' formation bookkeeping, checked against a scan of the enemies left.
+
+    python -m pytest benchmarks -v
+"""
+
+import random
+
+import pygame
+
+from harness import game_dir
+
+
+def test_formation_taller_than_five_rows():
+    with game_dir("games/Space_Invaders_Classic"):
+        pygame.init()
+        import main as invaders
+
+        invaders.prebake()
+        columns, rows = 12, 9
+        formation = invaders.EnemiesGroup(columns, rows, 157, 65)
+        for row in range(rows):
+            for column in range(columns):
+                formation.add(invaders.Enemy(row, column, rows))
+
+        assert {enemy.artRow for enemy in formation} == set(range(5))
+
+        rnd = random.Random(1)
+        order = list(formation)
+        rnd.shuffle(order)
+        for enemy in order[:-1]:
+            formation.remove(enemy)
+            # A move down, so bottom is brought up to date
+            formation.moveNumber = 1000
+            formation.update(formation.timer + formation.moveTime + 1)
+
+            left = list(formation)
+            alive_columns = {e.column for e in left}
+            assert formation.bottom == max(e.rect.bottom for e in left)
+            for column in range(columns):
+                assert formation.is_column_dead(column) == (column not in alive_columns)
+            assert formation._leftAliveColumn == min(alive_columns)
+            assert formation._rightAliveColumn == max(alive_columns)
+            assert formation.leftAddMove == 5 * min(alive_columns)
+            assert formation.rightAddMove == 5 * (columns - 1 - max(alive_columns))
+
+            for _ in range(5):
+                bottom = formation.random_bottom()
+                assert bottom in formation
+                assert bottom.row == max(e.row for e in left if e.column == bottom.column)
@@ -20,6 +20,8 @@ MAX_OBSTACLES = 15
 # Meteors
 MIN_METEORS = 5
 MAX_METEORS = 10
+# Meteors in the meteor storm mode, main.py --storm
+STORM_METEORS = 2000
 
 # Physics
 GRAVITY = 0.1 / 30
@@ -1,31 +1,58 @@
 import sys
+import images
+from jtlgames import formats, text
+from jtlgames.hud import Hud
+from jtlgames.rotation import RotationCache
 from lander import *
 from pad import *
 from obstacle import *
 from meteor import *
 from config import *
 
+try:
+    # Keeps the meteors in NumPy arrays, for the meteor storm mode
+    from storm import MeteorStorm
+except ImportError:
+    MeteorStorm = None
+
 
 class Game:
 
-    def __init__(self):
+    def __init__(self, storm=0):
+        """With storm > 0, the game is a meteor storm of that many meteors, which are kept in a MeteorStorm
+           instead of meteor_sprites."""
         pygame.init()
         pygame.display.set_caption('Mars Lander')
         self.ticks, self.time, self.score, self.failure_ticks, self.non_collision_ticks, self.failure = 0, 0, 0, 0, 0, 0
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        self.background_image = pygame.image.load("resources/mars_background.png")
-        self.instruments = pygame.image.load("resources/instruments.png")
-        self.alert_instruments = pygame.image.load("resources/instruments_alert.png")
+        # Every image is loaded after set_mode(), so it is converted to the display's pixel format
+        self.background_image = images.load("mars_background.png")
+        self.instruments = images.load("instruments.png")
+        self.alert_instruments = images.load("instruments_alert.png")
         # I made the thrust_image same resolution as lander image. As a result,
         # they rotate around the same axis and the flame is always where it should be.
-        self.thrust_image_original = pygame.image.load('resources/thrust.png')
+        self.thrust_image_original = images.load('thrust.png')
+        self.thrust_images = RotationCache(self.thrust_image_original)
         self.pad_sprites = pygame.sprite.Group()
         self.obstacle_sprites = pygame.sprite.Group()
         self.meteor_sprites = pygame.sprite.Group()
         self.player_sprite = pygame.sprite.GroupSingle()
+        self.storm = MeteorStorm(storm) if storm else None
         self.lander = Lander()
         self.lander_lives = 0
+        self.image_formats_checked = False
         self.player_sprite.add(self.lander)
+        # The instrument panel and the counters in the top right corner. Their text is only
+        # rendered again when a value changes; see update_lander_meters.
+        font = text.sysfont('Arial', 20)
+        self.hud = Hud(self.instruments.get_rect(), self.instruments)
+        for name, location in [("time", (72, 10)), ("fuel", (72, 32)), ("damage", (94, 54)),
+                               ("altitude", (258, 10)), ("veloc_x", (278, 32)), ("veloc_y", (278, 54)),
+                               ("score", (75, 82)), ("status", (120, 82))]:
+            self.hud.add(name, location, font, WHITE)
+        self.counters = Hud((1110, 10, WIDTH - 1110, 50))
+        self.counters.add("lives", (0, 0), font, WHITE, "Lives: {}")
+        self.counters.add("meteors", (0, 22), font, WHITE, "Meteors: {}")
 
     def spawn_pads(self):
         """NUMBER_OF_PADS times spawns a pad randomly on the screen. The pad may be tall or regular.
@@ -55,16 +82,19 @@ class Game:
            in this game is at the beginning of each mission, so the game looks more naturally with the meteors already
            flying on the screen."""
         for _ in range(count):
-            new_meteor = Meteor(random.randrange(0, WIDTH), random.randrange(0, HEIGHT - 400) if random_height else 0)
-            self.meteor_sprites.add(new_meteor)
+            METEOR_POOL.get(random.randrange(0, WIDTH), random.randrange(0, HEIGHT - 400) if random_height else 0,
+                            groups=(self.meteor_sprites,))
 
     def replace_off_screen_meteors(self):
-        """Deletes a meteor once it flies off the screen, replaces it with a new one."""
+        """Kills a meteor once it flies off the screen, replaces it with a new one.
+           Killed meteors go back to METEOR_POOL, so the replacement is usually the same sprite, reset."""
+        if self.storm is not None:
+            self.storm.replace_off_screen()
+            return
         for meteor in self.meteor_sprites:
             if meteor.is_off_screen():
                 meteor.kill()
                 self.spawn_meteors(1)
-                del meteor
 
     def lander_has_both_legs_on_pad(self, pad_list):
         """Returns True if the lander has both legs on the pad it has landed on and False otherwise."""
@@ -115,48 +145,52 @@ class Game:
             return True
 
     def update_lander_meters(self):
-        """Variables stored in hud_components_locations are reassigned to represent actual values
-           and then displayed on the screen at their respective coordinates."""
-        hud_components_locations = [
-            [int(self.time), (72, 10)],
-            [self.lander.current_fuel(), (72, 32)],
-            [self.lander.current_damage(), (94, 54)],
-            [self.lander.current_altitude(), (258, 10)],
-            [self.lander.current_veloc_x(), (278, 32)],
-            [self.lander.current_veloc_y(), (278, 54)],
-            [self.score, (75, 82)],
-            ["Lives: " + str(self.lander_lives), (1110, 10)],
-            ["Meteors: " + str(len(self.meteor_sprites)), (1110, 32)]
-        ]
-        for instrument in hud_components_locations:
-            self.show_on_screen(instrument[0], instrument[1])
+        """Sets the instruments on the HUD to their actual values. Only the ones whose text changed
+           are rendered again; fuel, damage, score, lives and meteors rarely do."""
+        self.hud.update({"time": int(self.time),
+                         "fuel": self.lander.current_fuel(),
+                         "damage": self.lander.current_damage(),
+                         "altitude": self.lander.current_altitude(),
+                         "veloc_x": self.lander.current_veloc_x(),
+                         "veloc_y": self.lander.current_veloc_y(),
+                         "score": self.score})
+        meteors = len(self.storm) if self.storm is not None else len(self.meteor_sprites)
+        self.counters.update({"lives": self.lander_lives, "meteors": meteors})
 
     def show_on_screen(self, string, location, font='Arial', font_size=20, colour=WHITE):
         """Shortcut do display a string on a location, with the possibility
            to modify font-face, font-size, and colour."""
-        msg = pygame.font.SysFont(font, font_size).render(str(string), True, colour)
+        msg = text.render(text.sysfont(font, font_size), string, colour)
         self.screen.blit(msg, location)
 
     def update_all_elements(self):
         """Renders background image, draws every group of sprites on the screen and calls update method where necessary.
            If the lander is faulty or uncontrollable, an error message is displayed and red instrument panel
-           is rendered. If the lander is fully functional, the panel is grey. Finally, all instruments are displayed."""
+           is rendered. If the lander is fully functional, the panel is grey. Finally, all instruments are displayed.
+           The whole screen is drawn again every tick, so the dirty rects the HUD reports are not needed."""
         self.screen.blit(self.background_image, (0, 0))
         self.pad_sprites.draw(self.screen)
         self.obstacle_sprites.draw(self.screen)
-        self.meteor_sprites.update()
-        self.meteor_sprites.draw(self.screen)
+        if self.storm is not None:
+            self.storm.update()
+            self.storm.draw(self.screen)
+        else:
+            self.meteor_sprites.update()
+            self.meteor_sprites.draw(self.screen)
         self.player_sprite.update()
         self.player_sprite.draw(self.screen)
         if not self.lander.is_controllable():
-            self.screen.blit(self.alert_instruments, (0, 0))
-            self.show_on_screen("UNCONTROLLABLE", (120, 82))
+            self.hud.background = self.alert_instruments
+            self.hud.set("status", "UNCONTROLLABLE")
         elif self.lander_failure():
-            self.screen.blit(self.alert_instruments, (0, 0))
-            self.show_on_screen("Failure of " + str(self.failure), (120, 82))
+            self.hud.background = self.alert_instruments
+            self.hud.set("status", "Failure of " + str(self.failure))
         else:
-            self.screen.blit(self.instruments, (0, 0))
+            self.hud.background = self.instruments
+            self.hud.set("status", "")
         self.update_lander_meters()
+        self.hud.draw(self.screen)
+        self.counters.draw(self.screen)
 
     def pause(self, msg=""):
         """Pauses the game. A small 'menu' is displayed on a transparent overlay. The player has two options:
@@ -186,6 +220,19 @@ class Game:
                 elif e.key == pygame.K_ESCAPE:
                     self.end_game()
 
+    def check_image_formats(self, msg=""):
+        """Pauses the game like pause(), with every blit of the paused frame checked. An image that is not in the
+           display's pixel format, and so is slow to draw, gets a warning. This runs once, at the start."""
+        self.image_formats_checked = True
+        screen = self.screen
+        self.screen = formats.BlitAudit(screen)
+        try:
+            # the flame is only drawn while thrusting
+            self.screen.check(self.thrust_images.get(0))
+            self.pause(msg)
+        finally:
+            self.screen = screen
+
     def end_game(self):
         """A menu with black background displayed when the player ends the game manually from pause menu or loses every
            life. Previous score is displayed along with a menu which allows the player to start a new game or exit
@@ -228,19 +275,32 @@ class Game:
             # Spawn static sprites and a set of meteors. The game is paused, a message is displayed.
             self.spawn_pads()
             self.spawn_obstacles()
-            self.meteor_sprites.empty()
-            self.spawn_meteors(random_height=True)
-            self.pause("New game")
+            if self.storm is not None:
+                self.storm.start()
+            else:
+                # kill rather than empty() the group, so the meteors go back to METEOR_POOL
+                for meteor in self.meteor_sprites:
+                    meteor.kill()
+                self.spawn_meteors(random_height=True)
+            if not self.image_formats_checked:
+                self.check_image_formats("New game")
+            else:
+                self.pause("New game")
             while True:
                 # This block denotes one tick of a game.
                 self.update_all_elements()
                 self.replace_off_screen_meteors()
 
                 # when meteor collides with a landing pad, the meteor gets destroyed and replaced.
-                self.spawn_meteors(len(pygame.sprite.groupcollide(self.pad_sprites, self.meteor_sprites, False, True)))
                 # when meteor collides with an obstacle, the meteor gets destroyed and replaced.
-                self.spawn_meteors(
-                    len(pygame.sprite.groupcollide(self.obstacle_sprites, self.meteor_sprites, False, True)))
+                if self.storm is not None:
+                    self.storm.replace_hits(self.pad_sprites)
+                    self.storm.replace_hits(self.obstacle_sprites)
+                else:
+                    self.spawn_meteors(
+                        len(pygame.sprite.groupcollide(self.pad_sprites, self.meteor_sprites, False, True)))
+                    self.spawn_meteors(
+                        len(pygame.sprite.groupcollide(self.obstacle_sprites, self.meteor_sprites, False, True)))
 
                 # checks for pressed keys
                 pygame.event.pump()
@@ -258,7 +318,7 @@ class Game:
                         and self.lander.current_fuel() >= THRUST_COST:
                     self.lander.thrust()
                     # rotates thrust_image so it corresponds to lander sprite, then displays it.
-                    thrust_image = pygame.transform.rotozoom(self.thrust_image_original, self.lander.get_rotation(), 1)
+                    thrust_image = self.thrust_images.get(self.lander.get_rotation())
                     self.screen.blit(thrust_image, (self.lander.rect.x, self.lander.rect.y))
                 # checks for exit command
                 for event in pygame.event.get():
@@ -276,7 +336,10 @@ class Game:
                     # If a meteor is hit by the player, it is not replaced.
                     # This is done on purpose as it lowers the game's difficulty
                     # as the lander gets damaged. Otherwise it was too complicated to land safely.
-                    meteor_collision = pygame.sprite.spritecollide(self.lander, self.meteor_sprites, True)
+                    if self.storm is not None:
+                        meteor_collision = self.storm.hit(self.lander)
+                    else:
+                        meteor_collision = pygame.sprite.spritecollide(self.lander, self.meteor_sprites, True)
                     if meteor_collision:
                         # 25 damage for meteor collision
                         self.lander_collided(25)
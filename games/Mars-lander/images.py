@@ -0,0 +1,46 @@
+"""Loads the game's images in the display's pixel format.
+
+An image that is not in the display's format is converted pixel by pixel every time it is drawn. jtlgames.assets
+converts the images it loads, but only once the display mode is set, so every image is loaded through load(), by code
+that runs after Game() has called set_mode(). The background has no transparent pixels, so it is loaded without alpha
+and copied to the screen rather than blended.
+
+Run "python main.py --benchmark" to see how fast each image is drawn, loaded as it was and as it is now.
+"""
+import glob
+import os
+import pygame
+from jtlgames import assets, formats
+from config import *
+
+RESOURCES = 'resources'
+
+# Images without a single transparent pixel
+OPAQUE = {'mars_background.png'}
+
+
+def load(name):
+    """Returns the image resources/name, converted to the display's pixel format.
+       Raises pygame.error if the display mode is not set yet."""
+    if pygame.display.get_surface() is None:
+        raise pygame.error(f"Load {name} after pygame.display.set_mode()")
+    return formats.normalize(assets.image(os.path.join(RESOURCES, name), alpha=name not in OPAQUE))
+
+
+def benchmark():
+    """Prints how many times a second each image can be drawn, loaded with pygame.image.load() and with load()."""
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    print(f"{'image':36} {'size':>9} {'loaded':>12} {'converted':>12}")
+    before = after = 0
+    for path in sorted(glob.glob(os.path.join(RESOURCES, '**', '*.png'), recursive=True)):
+        name = os.path.relpath(path, RESOURCES).replace(os.sep, '/')
+        raw, converted = pygame.image.load(path), load(name)
+        raw_rate, converted_rate = formats.blit_rate(raw, screen), formats.blit_rate(converted, screen)
+        # The time to draw every image once, before and after
+        before += 1 / raw_rate
+        after += 1 / converted_rate
+        print(f"{name:36} {'%dx%d' % raw.get_size():>9} {raw_rate:10.0f}/s {converted_rate:10.0f}/s")
+    print(f"every image once: {before * 1000:.2f} ms loaded, {after * 1000:.2f} ms converted "
+          f"({before / after:.1f}x faster)")
+    pygame.quit()
@@ -1,13 +1,20 @@
 import pygame
 import math
 import random
+import images
+from jtlgames.rotation import RotationCache
 from config import *
 
 
 class Lander(pygame.sprite.Sprite):
+    # Rotated lander images, shared by every lander so they survive a reset.
+    rotations = None
+
     def __init__(self):
         pygame.sprite.Sprite.__init__(self)
-        self._original_image = pygame.image.load('resources/lander.png')
+        self._original_image = images.load('lander.png')
+        if Lander.rotations is None or Lander.rotations.image is not self._original_image:
+            Lander.rotations = RotationCache(self._original_image)
         self.image = self._original_image
         self.rect = self.image.get_rect()
         self.rect.center = (600, 60)
@@ -26,12 +33,12 @@ class Lander(pygame.sprite.Sprite):
     def rotate_right(self):
         """Rotates lander 1° clockwise."""
         self._rotation -= 1
-        self.image = pygame.transform.rotozoom(self._original_image, self._rotation, 1)
+        self.image = Lander.rotations.get(self._rotation)
 
     def rotate_left(self):
         """Rotates lander 1° counterclockwise."""
         self._rotation += 1
-        self.image = pygame.transform.rotozoom(self._original_image, self._rotation, 1)
+        self.image = Lander.rotations.get(self._rotation)
 
     def get_rotation(self):
         """Returns lander's current rotation in degrees."""
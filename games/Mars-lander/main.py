@@ -1,3 +1,17 @@
+import argparse
+import images
 from game import *
 
-Game().play()
+parser = argparse.ArgumentParser(description="Mars Lander")
+parser.add_argument("--benchmark", action="store_true",
+                    help="Show how fast every image is drawn, before and after converting it to the display's format")
+parser.add_argument("--storm", type=int, nargs="?", const=STORM_METEORS, default=0, metavar="METEORS",
+                    help=f"Meteor storm: fly through METEORS meteors, {STORM_METEORS} by default. Needs NumPy.")
+args = parser.parse_args()
+
+if args.benchmark:
+    images.benchmark()
+elif args.storm and MeteorStorm is None:
+    parser.error("--storm needs NumPy, pip install numpy")
+else:
+    Game(args.storm).play()
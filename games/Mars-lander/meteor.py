@@ -1,19 +1,22 @@
-import pygame
 import random
+import images
+from jtlgames.pool import PooledSprite, SpritePool
 from config import *
 
 
-class Meteor(pygame.sprite.Sprite):
-    # all meteor images are loaded here, so the game does not load an image on every meteor spawn.
-    meteors = [
-        pygame.image.load('resources/meteors/spaceMeteors_001.png'),
-        pygame.image.load('resources/meteors/spaceMeteors_002.png'),
-        pygame.image.load('resources/meteors/spaceMeteors_003.png'),
-        pygame.image.load('resources/meteors/spaceMeteors_004.png'),
-    ]
+class Meteor(PooledSprite):
+    # all meteor images are loaded once, so the game does not load an image on every meteor spawn.
+    # That happens on the first spawn rather than on import, once the display is set and they can be converted.
+    meteors = None
 
     def __init__(self, x, y):
-        pygame.sprite.Sprite.__init__(self)
+        PooledSprite.__init__(self)
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Sets the meteor up to fall from (x, y), with a new image and velocity."""
+        if Meteor.meteors is None:
+            Meteor.meteors = [images.load('meteors/spaceMeteors_00%d.png' % i) for i in range(1, 5)]
         self.image = random.choice(Meteor.meteors)
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
@@ -53,3 +56,7 @@ class Meteor(pygame.sprite.Sprite):
         # delete meteor if it flies off the screen or hits surface
         if self.rect.top > HEIGHT or self.rect.left > WIDTH or self.rect.right < 0:
             self._off_screen = True
+
+
+# Meteors are replaced all through a mission, so the ones that are gone are recycled.
+METEOR_POOL = SpritePool(Meteor)
@@ -1,5 +1,6 @@
 import pygame
 import random
+import images
 
 
 class Obstacle(pygame.sprite.Sprite):
@@ -17,6 +18,6 @@ class Obstacle(pygame.sprite.Sprite):
             'satellite_SW'
         ]
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.image.load('resources/obstacles/' + random.choice(obstacles_list) + '.png')
+        self.image = images.load('obstacles/' + random.choice(obstacles_list) + '.png')
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
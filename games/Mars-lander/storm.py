@@ -0,0 +1,68 @@
+"""Meteor storm mode: thousands of meteors, kept in NumPy arrays rather than one sprite each.
+
+The meteors fall and collide as in the normal game, but a jtlgames SpriteBatch moves all of them at once, checks
+collisions through its grid of meteor positions, and meteors that leave the screen or hit the ground are reused in
+place instead of being killed and spawned again. Run it with "python main.py --storm [METEORS]". It needs NumPy.
+"""
+import random
+import numpy as np
+import images
+from jtlgames.batch import SpriteBatch
+from config import *
+
+
+class MeteorStorm:
+    def __init__(self, count=STORM_METEORS):
+        self.count = count
+        # seeded from random, so a seeded game plays out the same
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        self.meteors = SpriteBatch([images.load('meteors/spaceMeteors_00%d.png' % i) for i in range(1, 5)],
+                                   (WIDTH, HEIGHT), capacity=count)
+
+    def __len__(self):
+        return len(self.meteors)
+
+    def new_meteors(self, count, random_height=False):
+        """Centers, velocities and images for count meteors, as Meteor.reset picks them: at the top of the screen,
+           or anywhere above its bottom 400 pixels if random_height is True."""
+        x = self.rng.integers(0, WIDTH, count)
+        y = self.rng.integers(0, HEIGHT - 400, count) if random_height else np.zeros(count, dtype=int)
+        velocities = np.column_stack((self.rng.uniform(-3, 3, count), self.rng.uniform(0, 3, count)))
+        return np.column_stack((x, y)), velocities, self.rng.integers(0, len(self.meteors.images), count)
+
+    def start(self):
+        """Fills the screen with a new storm, for the start of a mission."""
+        self.meteors.clear()
+        self.meteors.add(*self.new_meteors(self.count, random_height=True))
+
+    def update(self):
+        self.meteors.step()
+
+    def draw(self, screen):
+        self.meteors.draw(screen)
+
+    def replace(self, which):
+        """Sends meteors back to the top of the screen as new ones. Returns how many."""
+        which = np.asarray(which)
+        count = int(which.sum()) if which.dtype == bool else len(which)
+        if count:
+            self.meteors.place(which, *self.new_meteors(count))
+        return count
+
+    def replace_off_screen(self):
+        """Replaces the meteors that flew off the screen."""
+        meteors = self.meteors
+        return self.replace((meteors.top > HEIGHT) | (meteors.left > WIDTH) | (meteors.right < 0))
+
+    def replace_hits(self, sprites):
+        """Replaces the meteors that hit any of sprites, e.g. the landing pads. Returns how many."""
+        hit = np.zeros(len(self.meteors), dtype=bool)
+        for sprite in sprites:
+            hit[self.meteors.collide_rect(sprite.rect)] = True
+        return self.replace(hit)
+
+    def hit(self, sprite):
+        """Removes the meteors that hit sprite, without replacing them. Returns how many."""
+        which = self.meteors.collide_rect(sprite.rect)
+        self.meteors.remove(which)
+        return len(which)
@@ -4,13 +4,17 @@ Main module for the Space Invaders game using Pygame.
 
 import sys
 
-from pygame import sprite, transform, mixer, time, Surface, font, K_RIGHT, K_LEFT, display, image, \
-    event, KEYUP, KEYDOWN, K_ESCAPE, K_SPACE, QUIT, init, key
+from pygame import sprite, transform, mixer, time, Surface, K_RIGHT, K_LEFT, display, \
+    event, KEYUP, KEYDOWN, K_ESCAPE, K_SPACE, QUIT, init, key, mask, draw, SRCALPHA
 
 from os.path import abspath, dirname
 from random import choice
 import asyncio
 
+from jtlgames import assets, text
+from jtlgames.dirty import DirtyScreen
+from jtlgames.pool import PooledSprite, SpritePool
+
 BASE_PATH = abspath(dirname(__file__))
 FONT_PATH = BASE_PATH + "/fonts/"
 IMAGE_PATH = BASE_PATH + "/images/"
@@ -45,11 +49,66 @@ IMG_NAMES = [
     "enemylaser",
 ]
 IMAGES = {
-    name: image.load(IMAGE_PATH + "{}.png".format(name)).convert_alpha()
+    name: assets.image(IMAGE_PATH + "{}.png".format(name))
     for name in IMG_NAMES
 }
 
+# Scaled sprite frames and sounds, made once by prebake() and shared by every sprite
+FRAMES = {}
+SOUNDS = {}
+
+ENEMY_FRAMES = {
+    0: ["1_2", "1_1"],
+    1: ["2_2", "2_1"],
+    2: ["2_2", "2_1"],
+    3: ["3_1", "3_2"],
+    4: ["3_1", "3_2"],
+}
+EXPLOSION_COLORS = ["purple", "blue", "blue", "green", "green"]
+ENEMY_SCORES = [30, 20, 20, 10, 10]
+SOUND_VOLUMES = {
+    "shoot": 0.2,
+    "shoot2": 0.2,
+    "invaderkilled": 0.2,
+    "mysterykilled": 0.2,
+    "shipexplosion": 0.2,
+    "mysteryentered": 0.3,
+    "0": 0.5,
+    "1": 0.5,
+    "2": 0.5,
+    "3": 0.5,
+}
+
+
+def prebake():
+    """Scales the sprite frames and loads the sounds, the first time it is called.
+
+    Sprites are made all through the game, a whole formation of them at the
+    start of each round, so they take their frames and sounds from here
+    rather than scaling and loading their own.
+    """
+    if FRAMES:
+        return
+
+    for row, names in ENEMY_FRAMES.items():
+        FRAMES["enemy", row] = [transform.scale(IMAGES["enemy" + name], (40, 35)) for name in names]
+        explosion = IMAGES["explosion" + EXPLOSION_COLORS[row]]
+        FRAMES["explosion", row] = (transform.scale(explosion, (40, 35)), transform.scale(explosion, (50, 45)))
+    FRAMES["mystery"] = transform.scale(IMAGES["mystery"], (75, 35))
+    FRAMES["life"] = transform.scale(IMAGES["ship"], (23, 23))
+
+    for name, volume in SOUND_VOLUMES.items():
+        SOUNDS[name] = mixer.Sound(SOUND_PATH + "{}.{}".format(name, SOUND_FORMAT))
+        SOUNDS[name].set_volume(volume)
+
+
+def art_row(row, rows):
+    """The row of the classic five row formation whose art and score an enemy in row, of rows, gets"""
+    return row * len(ENEMY_FRAMES) // rows
+
+
 BLOCKERS_POSITION = 450
+BUNKER_SIZE = (90, 40)
 ENEMY_DEFAULT_POSITION = 65  # Initial value for a new game
 ENEMY_MOVE_DOWN = 35
 DIFFICULTY_LEVEL = 5  # a value between 1 to 10 - number of enemy bullets
@@ -70,9 +129,12 @@ class Ship(sprite.Sprite):
         game.screen.blit(self.image, self.rect)
 
 
-class Bullet(sprite.Sprite):
+class Bullet(PooledSprite):
     def __init__(self, xpos, ypos, direction, speed, filename, side):
-        sprite.Sprite.__init__(self)
+        PooledSprite.__init__(self)
+        self.reset(xpos, ypos, direction, speed, filename, side)
+
+    def reset(self, xpos, ypos, direction, speed, filename, side):
         self.image = IMAGES[filename]
         self.rect = self.image.get_rect(topleft=(xpos, ypos))
         self.speed = speed
@@ -87,45 +149,78 @@ class Bullet(sprite.Sprite):
             self.kill()
 
 
+# Bullets and explosions come and go all game, so the dead ones are recycled
+BULLET_POOL = SpritePool(Bullet)
+
+
 class Enemy(sprite.Sprite):
-    def __init__(self, row, column):
+    def __init__(self, row, column, rows=5):
         sprite.Sprite.__init__(self)
         self.row = row
         self.column = column
-        self.images = []
-        self.load_images()
-        self.index = 0
-        self.image = self.images[self.index]
-        self.rect = self.image.get_rect()
-
-    def toggle_image(self):
-        self.index += 1
-        if self.index >= len(self.images):
-            self.index = 0
-        self.image = self.images[self.index]
+        self.artRow = art_row(row, rows)
+        self.images = FRAMES["enemy", self.artRow]
+        # The EnemiesGroup the enemy is in moves and animates it
+        self.formation = None
+        self._version = None
+        self._image = self.images[0]
+        self._rect = self._image.get_rect()
+
+    @property
+    def rect(self):
+        # Only worked out when used, and only after the formation moved
+        formation = self.formation
+        if formation is not None and self._version != formation.version:
+            self._rect.topleft = formation.position(self.row, self.column)
+            self._version = formation.version
+        return self._rect
+
+    @rect.setter
+    def rect(self, value):
+        self._rect = value
+
+    @property
+    def image(self):
+        if self.formation is not None:
+            return self.images[self.formation.frame]
+        return self._image
+
+    @image.setter
+    def image(self, value):
+        self._image = value
 
     def update(self, *args):
         game.screen.blit(self.image, self.rect)
 
-    def load_images(self):
-        images = {
-            0: ["1_2", "1_1"],
-            1: ["2_2", "2_1"],
-            2: ["2_2", "2_1"],
-            3: ["3_1", "3_2"],
-            4: ["3_1", "3_2"],
-        }
-        img1, img2 = (IMAGES["enemy{}".format(img_num)] for img_num in images[self.row])
-        self.images.append(transform.scale(img1, (40, 35)))
-        self.images.append(transform.scale(img2, (40, 35)))
-
 
 class EnemiesGroup(sprite.Group):
-    def __init__(self, columns, rows):
+    """The invaders' formation.
+
+    The formation moves as a whole, so the enemies don't each store a
+    position: they're a grid of cells at a common offset, x and y, plus an
+    alive map and alive counts per row and column. Moving the formation
+    only changes the offset, and an enemy's rect is worked out from its cell
+    when it is next used.
+    """
+
+    def __init__(self, columns, rows, x, y):
         sprite.Group.__init__(self)
         self.enemies = [[None] * columns for _ in range(rows)]
         self.columns = columns
         self.rows = rows
+        # Top left of the formation, the cell of row 0, column 0
+        self.x = x
+        self.y = y
+        # Bumped whenever the formation moves, so the enemies know to update their rects
+        self.version = 0
+        # The animation frame every enemy shows
+        self.frame = 0
+        self.alive = bytearray(columns * rows)
+        self.columnCounts = [0] * columns
+        self.rowCounts = [0] * rows
+        # The lowest row with an enemy left in it, overall and per column
+        self._bottomRow = rows - 1
+        self._columnBottom = [rows - 1] * columns
         self.leftAddMove = 0
         self.rightAddMove = 0
         self.moveTime = 600
@@ -134,7 +229,7 @@ class EnemiesGroup(sprite.Group):
         self.leftMoves = 30
         self.moveNumber = 15
         self.timer = time.get_ticks()
-        self.bottom = game.enemyPosition + ((rows - 1) * 45) + 35
+        self.bottom = y + ((rows - 1) * 45) + 35
         self._aliveColumns = list(range(columns))
         self._leftAliveColumn = 0
         self._rightAliveColumn = columns - 1
@@ -151,25 +246,29 @@ class EnemiesGroup(sprite.Group):
                 self.rightMoves = 30 + self.leftAddMove
                 self.direction *= -1
                 self.moveNumber = 0
-                self.bottom = 0
-                for enemy in self:
-                    enemy.rect.y += ENEMY_MOVE_DOWN
-                    enemy.toggle_image()
-                    if self.bottom < enemy.rect.y + 35:
-                        self.bottom = enemy.rect.y + 35
+                self.y += ENEMY_MOVE_DOWN
+                self.bottom = self.y + self._bottomRow * 45 + 35 if self else 0
             else:
-                velocity = 10 if self.direction == 1 else -10
-                for enemy in self:
-                    enemy.rect.x += velocity
-                    enemy.toggle_image()
+                self.x += 10 if self.direction == 1 else -10
                 self.moveNumber += 1
 
+            self.frame = 1 - self.frame
+            self.version += 1
             self.timer += self.moveTime
 
+    def position(self, row, column):
+        """Returns the screen position of a cell of the formation"""
+        return self.x + column * 50, self.y + row * 45
+
     def add_internal(self, *sprites):
         super(EnemiesGroup, self).add_internal(*sprites)
         for s in sprites:
             self.enemies[s.row][s.column] = s
+            self.alive[s.row * self.columns + s.column] = 1
+            self.columnCounts[s.column] += 1
+            self.rowCounts[s.row] += 1
+            s.formation = self
+            s._version = None
 
     def remove_internal(self, *sprites):
         super(EnemiesGroup, self).remove_internal(*sprites)
@@ -177,13 +276,15 @@ class EnemiesGroup(sprite.Group):
             self.kill(s)
         self.update_speed()
 
+    def is_alive(self, row, column):
+        return self.alive[row * self.columns + column] == 1
+
     def is_column_dead(self, column):
-        return not any(self.enemies[row][column] for row in range(self.rows))
+        return self.columnCounts[column] == 0
 
     def random_bottom(self):
         col = choice(self._aliveColumns)
-        col_enemies = (self.enemies[row - 1][col] for row in range(self.rows, 0, -1))
-        return next((en for en in col_enemies if en is not None), None)
+        return self.enemies[self._columnBottom[col]][col]
 
     def update_speed(self):
         if len(self) == 1:
@@ -192,8 +293,21 @@ class EnemiesGroup(sprite.Group):
             self.moveTime = 400
 
     def kill(self, enemy):
-        self.enemies[enemy.row][enemy.column] = None
-        is_column_dead = self.is_column_dead(enemy.column)
+        # The enemy stays where it was killed, for its explosion
+        enemy.rect, enemy.image = enemy.rect, enemy.image
+        enemy.formation = None
+
+        row, column = enemy.row, enemy.column
+        self.enemies[row][column] = None
+        self.alive[row * self.columns + column] = 0
+        self.columnCounts[column] -= 1
+        self.rowCounts[row] -= 1
+        while self._columnBottom[column] > 0 and not self.is_alive(self._columnBottom[column], column):
+            self._columnBottom[column] -= 1
+        while self._bottomRow > 0 and self.rowCounts[self._bottomRow] == 0:
+            self._bottomRow -= 1
+
+        is_column_dead = self.is_column_dead(column)
         if is_column_dead:
             self._aliveColumns.remove(enemy.column)
 
@@ -210,17 +324,69 @@ class EnemiesGroup(sprite.Group):
                 is_column_dead = self.is_column_dead(self._leftAliveColumn)
 
 
-class Blocker(sprite.Sprite):
-    def __init__(self, size, color, row, column):
+# Collision masks of the bullet images, made once per image
+MASKS = {}
+
+
+def mask_of(surface):
+    m = MASKS.get(surface)
+    if m is None:
+        m = MASKS[surface] = mask.from_surface(surface)
+    return m
+
+
+def make_crater(radius):
+    """A round mask of the bunker pixels a bullet blows away"""
+    crater = Surface((radius * 2, radius * 2), SRCALPHA)
+    draw.circle(crater, WHITE, (radius, radius), radius)
+    return mask.from_surface(crater)
+
+
+class Bunker(sprite.Sprite):
+    """A destructible bunker: one surface, and a mask of the pixels left.
+
+    Bullets that hit it blow a crater out of it, and invaders that reach it
+    erase what they touch.
+    """
+
+    CRATER = None
+
+    def __init__(self, number):
         sprite.Sprite.__init__(self)
-        self.height = size
-        self.width = size
-        self.color = color
-        self.image = Surface((self.width, self.height))
-        self.image.fill(self.color)
-        self.rect = self.image.get_rect()
-        self.row = row
-        self.column = column
+        if Bunker.CRATER is None:
+            Bunker.CRATER = make_crater(6)
+        self.mask = mask.Mask(BUNKER_SIZE, fill=True)
+        self.image = self.render()
+        self.rect = self.image.get_rect(topleft=(50 + 200 * number, BLOCKERS_POSITION))
+
+    def render(self):
+        # A new surface rather than drawing on the old one, which the
+        # screen's dirty rect tracking compares by identity
+        return self.mask.to_surface(setcolor=GREEN, unsetcolor=(0, 0, 0, 0))
+
+    def hit_point(self, other):
+        """Returns the screen position of a bunker pixel another sprite
+        touches, or None if it touches none"""
+        if not self.rect.colliderect(other.rect):
+            return None
+        point = self.mask.overlap(mask_of(other.image),
+                                  (other.rect.x - self.rect.x, other.rect.y - self.rect.y))
+        if point is None:
+            return None
+        return point[0] + self.rect.x, point[1] + self.rect.y
+
+    def erase(self, area, topleft):
+        """Erases the pixels under a mask whose top left is at a screen position"""
+        self.mask.erase(area, (topleft[0] - self.rect.x, topleft[1] - self.rect.y))
+        if self.mask.count():
+            self.image = self.render()
+        else:
+            self.kill()
+
+    def blast(self, point):
+        """Blows a crater around a screen position"""
+        radius = self.CRATER.get_size()[0] // 2
+        self.erase(self.CRATER, (point[0] - radius, point[1] - radius))
 
     def update(self, keys, *args):
         game.screen.blit(self.image, self.rect)
@@ -229,15 +395,13 @@ class Blocker(sprite.Sprite):
 class Mystery(sprite.Sprite):
     def __init__(self):
         sprite.Sprite.__init__(self)
-        self.image = IMAGES["mystery"]
-        self.image = transform.scale(self.image, (75, 35))
+        self.image = FRAMES["mystery"]
         self.rect = self.image.get_rect(topleft=(-80, 45))
         self.row = 5
         self.moveTime = 25000
         self.direction = 1
         self.timer = time.get_ticks()
-        self.mysteryEntered = mixer.Sound(SOUND_PATH + f"mysteryentered.{SOUND_FORMAT}")
-        self.mysteryEntered.set_volume(0.3)
+        self.mysteryEntered = SOUNDS["mysteryentered"]
         self.playSound = True
 
     def update(self, keys, currentTime, *args):
@@ -268,19 +432,16 @@ class Mystery(sprite.Sprite):
             self.timer = currentTime
 
 
-class EnemyExplosion(sprite.Sprite):
+class EnemyExplosion(PooledSprite):
     def __init__(self, enemy, *groups):
         super(EnemyExplosion, self).__init__(*groups)
-        self.image = transform.scale(self.get_image(enemy.row), (40, 35))
-        self.image2 = transform.scale(self.get_image(enemy.row), (50, 45))
+        self.reset(enemy)
+
+    def reset(self, enemy):
+        self.image, self.image2 = FRAMES["explosion", enemy.artRow]
         self.rect = self.image.get_rect(topleft=(enemy.rect.x, enemy.rect.y))
         self.timer = time.get_ticks()
 
-    @staticmethod
-    def get_image(row):
-        img_colors = ["purple", "blue", "blue", "green", "green"]
-        return IMAGES["explosion{}".format(img_colors[row])]
-
     def update(self, current_time, *args):
         passed = current_time - self.timer
         if passed <= 100:
@@ -291,6 +452,9 @@ class EnemyExplosion(sprite.Sprite):
             self.kill()
 
 
+EXPLOSION_POOL = SpritePool(EnemyExplosion)
+
+
 class MysteryExplosion(sprite.Sprite):
     def __init__(self, mystery, score, *groups):
         super(MysteryExplosion, self).__init__(*groups)
@@ -325,8 +489,7 @@ class ShipExplosion(sprite.Sprite):
 class Life(sprite.Sprite):
     def __init__(self, xpos, ypos):
         sprite.Sprite.__init__(self)
-        self.image = IMAGES["ship"]
-        self.image = transform.scale(self.image, (23, 23))
+        self.image = FRAMES["life"]
         self.rect = self.image.get_rect(topleft=(xpos, ypos))
 
     def update(self, *args):
@@ -335,8 +498,8 @@ class Life(sprite.Sprite):
 
 class Text(object):
     def __init__(self, textFont, size, message, color, xpos, ypos):
-        self.font = font.Font(textFont, size)
-        self.surface = self.font.render(message, True, color)
+        self.font = text.font(textFont, size)
+        self.surface = text.render(self.font, message, color)
         self.rect = self.surface.get_rect(topleft=(xpos, ypos))
 
     def draw(self, surface):
@@ -344,15 +507,18 @@ class Text(object):
 
 
 class SpaceInvaders(object):
-    def __init__(self):
+    def __init__(self, full_frame=False, show_stats=False):
         # It seems, in Linux buffersize=512 is not enough, use 4096 to prevent:
         #   ALSA lib pcm.c:7963:(snd_pcm_recover) underrun occurred
         mixer.pre_init(44100, -16, 1, 4096)
         init()
         self.clock = time.Clock()
         self.caption = display.set_caption("Space Invaders")
-        self.screen = SCREEN
-        self.background = image.load(IMAGE_PATH + "background.jpg").convert()
+        prebake()
+        self.background = assets.image(IMAGE_PATH + "background.jpg", alpha=False)
+        # Only the parts of the window that changed are redrawn, unless full_frame is set
+        self.screen = DirtyScreen(SCREEN, self.background, full_frame)
+        self.showStats = show_stats
         self.startGame = False
         self.mainScreen = True
         self.gameOver = False
@@ -368,16 +534,28 @@ class SpaceInvaders(object):
         self.enemy4Text = Text(FONT, 25, "   =  ?????", RED, 368, 420)
         self.scoreText = Text(FONT, 20, "Score", WHITE, 5, 5)
         self.livesText = Text(FONT, 20, "Lives ", WHITE, 640, 5)
+        self.scoreCounter = text.Counter(text.font(FONT, 20), GREEN,
+                                         glyphs=text.GlyphAtlas(text.font(FONT, 20), GREEN))
         
         self.creator_name = Text(FONT, 20, "Sandy Inspires", GREEN, 600, 570)
         self.jtl = Text(FONT, 20, "THE LEAGUE", ORANGE, 10, 570)
 
+        self.menuEnemy1 = assets.image(IMAGE_PATH + "enemy3_1.png", size=(40, 40))
+        self.menuEnemy2 = assets.image(IMAGE_PATH + "enemy2_2.png", size=(40, 40))
+        self.menuEnemy3 = assets.image(IMAGE_PATH + "enemy1_2.png", size=(40, 40))
+        self.menuEnemy4 = assets.image(IMAGE_PATH + "mystery.png", size=(80, 40))
+
         self.life1 = Life(715, 3)
         self.life2 = Life(742, 3)
         self.life3 = Life(769, 3)
         self.livesGroup = sprite.Group(self.life1, self.life2, self.life3)
 
     def reset(self, score):
+        if hasattr(self, "allSprites"):
+            # Hand the bullets and explosions left over from the last round back to their pools
+            for group in (self.bullets, self.enemyBullets, self.explosionsGroup):
+                for leftover in group.sprites():
+                    leftover.kill()
         self.player = Ship()
         self.playerGroup = sprite.Group(self.player)
         self.explosionsGroup = sprite.Group()
@@ -399,36 +577,22 @@ class SpaceInvaders(object):
         self.makeNewShip = False
         self.shipAlive = True
 
-    def make_blockers(self, number):
-        blockerGroup = sprite.Group()
-        for row in range(4):
-            for column in range(9):
-                blocker = Blocker(10, GREEN, row, column)
-                blocker.rect.x = 50 + (200 * number) + (column * blocker.width)
-                blocker.rect.y = BLOCKERS_POSITION + (row * blocker.height)
-                blockerGroup.add(blocker)
-        return blockerGroup
-
-    def create_audio(self):
-        self.sounds = {}
-        for sound_name in [
-            "shoot",
-            "shoot2",
-            "invaderkilled",
-            "mysterykilled",
-            "shipexplosion",
-        ]:
-            self.sounds[sound_name] = mixer.Sound(
-                SOUND_PATH + "{}.{}".format(sound_name, SOUND_FORMAT)
-            )
-            self.sounds[sound_name].set_volume(0.2)
+    def make_bunkers(self):
+        return sprite.Group(*(Bunker(number) for number in range(4)))
 
-        self.musicNotes = [
-            mixer.Sound(SOUND_PATH + "{}.{}".format(i, SOUND_FORMAT)) for i in range(4)
-        ]
-        for sound in self.musicNotes:
-            sound.set_volume(0.5)
+    def shoot_bunkers(self, bullets):
+        """Bullets that hit a bunker blow a crater in it and are destroyed"""
+        for bullet in bullets.sprites():
+            for bunker in self.bunkers:
+                point = bunker.hit_point(bullet)
+                if point is not None:
+                    bunker.blast(point)
+                    bullet.kill()
+                    break
 
+    def create_audio(self):
+        self.sounds = SOUNDS
+        self.musicNotes = [SOUNDS[str(i)] for i in range(4)]
         self.noteIndex = 0
 
     def play_main_music(self, currentTime):
@@ -442,6 +606,11 @@ class SpaceInvaders(object):
             self.note.play()
             self.noteTimer += self.enemies.moveTime
 
+    def exit(self):
+        if self.showStats:
+            print(self.screen.stats())
+        sys.exit()
+
     @staticmethod
     def should_exit(evt):
         # type: (pygame.event.EventType) -> bool
@@ -451,12 +620,12 @@ class SpaceInvaders(object):
         self.keys = key.get_pressed()
         for e in event.get():
             if self.should_exit(e):
-                sys.exit()
+                self.exit()
             if e.type == KEYDOWN:
                 if e.key == K_SPACE:
                     if len(self.bullets) == 0 and self.shipAlive:
                         if self.score <= 100:
-                            bullet = Bullet(
+                            bullet = BULLET_POOL.get(
                                 self.player.rect.x + 23,
                                 self.player.rect.y + 5,
                                 -1,
@@ -468,7 +637,7 @@ class SpaceInvaders(object):
                             self.allSprites.add(self.bullets)
                             self.sounds["shoot"].play()
                         elif self.score > 100 and self.score <= 200:
-                            leftbullet = Bullet(
+                            leftbullet = BULLET_POOL.get(
                                 self.player.rect.x + 8,
                                 self.player.rect.y + 5,
                                 -1,
@@ -476,7 +645,7 @@ class SpaceInvaders(object):
                                 "laser",
                                 "left",
                             )
-                            right_bullet = Bullet(
+                            right_bullet = BULLET_POOL.get(
                                 self.player.rect.x + 38,
                                 self.player.rect.y + 5,
                                 -1,
@@ -490,7 +659,7 @@ class SpaceInvaders(object):
                             self.sounds["shoot2"].play()
 
                         else:
-                            left_bullet = Bullet(
+                            left_bullet = BULLET_POOL.get(
                                 self.player.rect.x + 8,
                                 self.player.rect.y + 5,
                                 -1,
@@ -498,7 +667,7 @@ class SpaceInvaders(object):
                                 "laser",
                                 "left",
                             )
-                            right_bullet = Bullet(
+                            right_bullet = BULLET_POOL.get(
                                 self.player.rect.x + 38,
                                 self.player.rect.y + 5,
                                 -1,
@@ -506,7 +675,7 @@ class SpaceInvaders(object):
                                 "laser",
                                 "right",
                             )
-                            center_bullet = Bullet(
+                            center_bullet = BULLET_POOL.get(
                                 self.player.rect.x + 23,
                                 self.player.rect.y + 5,
                                 -1,
@@ -520,14 +689,11 @@ class SpaceInvaders(object):
                             self.allSprites.add(self.bullets)
                             self.sounds["shoot2"].play()
 
-    def make_enemies(self):
-        enemies = EnemiesGroup(10, 5)
-        for row in range(5):
-            for column in range(10):
-                enemy = Enemy(row, column)
-                enemy.rect.x = 157 + (column * 50)
-                enemy.rect.y = self.enemyPosition + (row * 45)
-                enemies.add(enemy)
+    def make_enemies(self, columns=10, rows=5):
+        enemies = EnemiesGroup(columns, rows, 157, self.enemyPosition)
+        for row in range(rows):
+            for column in range(columns):
+                enemies.add(Enemy(row, column, rows))
 
         self.enemies = enemies
 
@@ -535,7 +701,7 @@ class SpaceInvaders(object):
         if (time.get_ticks() - self.timer) > 700 and self.enemies:
             enemy = self.enemies.random_bottom()
             self.enemyBullets.add(
-                Bullet(
+                BULLET_POOL.get(
                     enemy.rect.x + 14, enemy.rect.y + 20, 1, 5, "enemylaser", "center"
                 )
             )
@@ -543,33 +709,26 @@ class SpaceInvaders(object):
             self.timer = time.get_ticks()
 
     def calculate_score(self, row):
-        scores = {0: 30, 1: 20, 2: 20, 3: 10, 4: 10, 5: choice([50, 100, 150, 300])}
+        """Adds the score for an enemy of the given art row, or for the mystery ship's row 5"""
+        scores = ENEMY_SCORES + [choice([50, 100, 150, 300])]
 
         score = scores[row]
         self.score += score
         return score
 
     def create_main_menu(self):
-        self.enemy1 = IMAGES["enemy3_1"]
-        self.enemy1 = transform.scale(self.enemy1, (40, 40))
-        self.enemy2 = IMAGES["enemy2_2"]
-        self.enemy2 = transform.scale(self.enemy2, (40, 40))
-        self.enemy3 = IMAGES["enemy1_2"]
-        self.enemy3 = transform.scale(self.enemy3, (40, 40))
-        self.enemy4 = IMAGES["mystery"]
-        self.enemy4 = transform.scale(self.enemy4, (80, 40))
-        self.screen.blit(self.enemy1, (318, 270))
-        self.screen.blit(self.enemy2, (318, 320))
-        self.screen.blit(self.enemy3, (318, 370))
-        self.screen.blit(self.enemy4, (299, 420))
+        self.screen.blit(self.menuEnemy1, (318, 270))
+        self.screen.blit(self.menuEnemy2, (318, 320))
+        self.screen.blit(self.menuEnemy3, (318, 370))
+        self.screen.blit(self.menuEnemy4, (299, 420))
 
     def check_collisions(self):
         sprite.groupcollide(self.bullets, self.enemyBullets, True, True)
 
         for enemy in sprite.groupcollide(self.enemies, self.bullets, True, True).keys():
             self.sounds["invaderkilled"].play()
-            self.calculate_score(enemy.row)
-            EnemyExplosion(enemy, self.explosionsGroup)
+            self.calculate_score(enemy.artRow)
+            EXPLOSION_POOL.get(enemy, groups=(self.explosionsGroup,))
             self.gameTimer = time.get_ticks()
 
         for mystery in sprite.groupcollide(
@@ -607,10 +766,13 @@ class SpaceInvaders(object):
                 self.gameOver = True
                 self.startGame = False
 
-        sprite.groupcollide(self.bullets, self.allBlockers, True, True)
-        sprite.groupcollide(self.enemyBullets, self.allBlockers, True, True)
+        self.shoot_bunkers(self.bullets)
+        self.shoot_bunkers(self.enemyBullets)
         if self.enemies.bottom >= BLOCKERS_POSITION:
-            sprite.groupcollide(self.enemies, self.allBlockers, False, True)
+            # Invaders that reach the bunkers erase the parts they touch
+            for enemy in self.enemies:
+                for bunker in sprite.spritecollide(enemy, self.bunkers, False):
+                    bunker.erase(mask.Mask(enemy.rect.size, fill=True), enemy.rect.topleft)
 
     def create_new_ship(self, createShip, currentTime):
         if createShip and (currentTime - self.shipTimer > 900):
@@ -621,27 +783,23 @@ class SpaceInvaders(object):
             self.shipAlive = True
 
     def create_game_over(self, currentTime):
-        self.screen.blit(self.background, (0, 0))
+        self.screen.clear()
         passed = currentTime - self.timer
         if passed < 750:
             self.gameOverText.draw(self.screen)
-        elif 750 < passed < 1500:
-            self.screen.blit(self.background, (0, 0))
         elif 1500 < passed < 2250:
             self.gameOverText.draw(self.screen)
-        elif 2250 < passed < 2750:
-            self.screen.blit(self.background, (0, 0))
         elif passed > 3000:
             self.mainScreen = True
 
         for e in event.get():
             if self.should_exit(e):
-                sys.exit()
+                self.exit()
 
     async def main(self):
         while True:
             if self.mainScreen:
-                self.screen.blit(self.background, (0, 0))
+                self.screen.clear()
                 self.titleText.draw(self.screen)
                 self.titleText2.draw(self.screen)
                 self.enemy1Text.draw(self.screen)
@@ -653,15 +811,10 @@ class SpaceInvaders(object):
                 self.create_main_menu()
                 for e in event.get():
                     if self.should_exit(e):
-                        sys.exit()
+                        self.exit()
                     if e.type == KEYUP:
                         # Only create blockers on a new game, not a new round
-                        self.allBlockers = sprite.Group(
-                            self.make_blockers(0),
-                            self.make_blockers(1),
-                            self.make_blockers(2),
-                            self.make_blockers(3),
-                        )
+                        self.bunkers = self.make_bunkers()
                         self.livesGroup.add(self.life1, self.life2, self.life3)
                         self.reset(0)
                         self.startGame = True
@@ -671,10 +824,9 @@ class SpaceInvaders(object):
                 if not self.enemies and not self.explosionsGroup:
                     currentTime = time.get_ticks()
                     if currentTime - self.gameTimer < 3000:
-                        self.screen.blit(self.background, (0, 0))
-                        self.scoreText2 = Text(FONT, 20, str(self.score), GREEN, 85, 5)
+                        self.screen.clear()
                         self.scoreText.draw(self.screen)
-                        self.scoreText2.draw(self.screen)
+                        self.screen.blit(self.scoreCounter.render(self.score), (85, 5))
                         self.nextRoundText.draw(self.screen)
                         self.livesText.draw(self.screen)
                         self.livesGroup.update()
@@ -689,11 +841,10 @@ class SpaceInvaders(object):
                 else:
                     currentTime = time.get_ticks()
                     self.play_main_music(currentTime)
-                    self.screen.blit(self.background, (0, 0))
-                    self.allBlockers.update(self.screen)
-                    self.scoreText2 = Text(FONT, 20, str(self.score), GREEN, 85, 5)
+                    self.screen.clear()
+                    self.bunkers.update(self.screen)
                     self.scoreText.draw(self.screen)
-                    self.scoreText2.draw(self.screen)
+                    self.screen.blit(self.scoreCounter.render(self.score), (85, 5))
                     self.livesText.draw(self.screen)
                     self.check_input()
                     self.enemies.update(currentTime)
@@ -711,11 +862,13 @@ class SpaceInvaders(object):
                 self.enemyPosition = ENEMY_DEFAULT_POSITION
                 self.create_game_over(currentTime)
 
-            display.update()
+            self.screen.update()
             self.clock.tick(60)
             await asyncio.sleep(0)
 
 
 if __name__ == "__main__":
-    game = SpaceInvaders()
+    # --full-frame redraws the whole window every frame, --stats prints the
+    # number of pixels pushed to the display per frame on exit.
+    game = SpaceInvaders(full_frame="--full-frame" in sys.argv, show_stats="--stats" in sys.argv)
     asyncio.run(game.main())
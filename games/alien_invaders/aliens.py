@@ -30,6 +30,9 @@ from typing import List
 # import basic pygame modules
 import pygame as pg
 
+from jtlgames import assets
+from jtlgames.pool import PooledSprite, SpritePool
+
 # see if we can load more than standard BMP
 if not pg.image.get_extended():
     raise SystemExit("Sorry, extended image module required")
@@ -50,10 +53,9 @@ def load_image(file):
     """loads an image, prepares it for play"""
     file = os.path.join(main_dir, "data", file)
     try:
-        surface = pg.image.load(file)
-    except pg.error:
-        raise SystemExit(f'Could not load image "{file}" {pg.get_error()}')
-    return surface.convert()
+        return assets.image(file, alpha=False)
+    except FileNotFoundError as e:
+        raise SystemExit(f'Could not load image "{file}" {e}')
 
 
 def load_sound(file):
@@ -135,7 +137,7 @@ class Alien(pg.sprite.Sprite):
         self.image = self.images[self.frame // self.animcycle % 3]
 
 
-class Explosion(pg.sprite.Sprite):
+class Explosion(PooledSprite):
     """An explosion. Hopefully the Alien and not the player!"""
 
     defaultlife = 12
@@ -143,7 +145,10 @@ class Explosion(pg.sprite.Sprite):
     images: List[pg.Surface] = []
 
     def __init__(self, actor, *groups):
-        pg.sprite.Sprite.__init__(self, *groups)
+        PooledSprite.__init__(self, *groups)
+        self.reset(actor)
+
+    def reset(self, actor):
         self.image = self.images[0]
         self.rect = self.image.get_rect(center=actor.rect.center)
         self.life = self.defaultlife
@@ -162,14 +167,21 @@ class Explosion(pg.sprite.Sprite):
             self.kill()
 
 
-class Shot(pg.sprite.Sprite):
+# Explosions, shots and bombs are recycled from these when they are killed
+EXPLOSION_POOL = SpritePool(Explosion)
+
+
+class Shot(PooledSprite):
     """a bullet the Player sprite fires."""
 
     speed = -11
     images: List[pg.Surface] = []
 
     def __init__(self, pos, *groups):
-        pg.sprite.Sprite.__init__(self, *groups)
+        PooledSprite.__init__(self, *groups)
+        self.reset(pos)
+
+    def reset(self, pos):
         self.image = self.images[0]
         self.rect = self.image.get_rect(midbottom=pos)
 
@@ -183,14 +195,20 @@ class Shot(pg.sprite.Sprite):
             self.kill()
 
 
-class Bomb(pg.sprite.Sprite):
+SHOT_POOL = SpritePool(Shot)
+
+
+class Bomb(PooledSprite):
     """A bomb the aliens drop."""
 
     speed = 9
     images: List[pg.Surface] = []
 
     def __init__(self, alien, explosion_group, *groups):
-        pg.sprite.Sprite.__init__(self, *groups)
+        PooledSprite.__init__(self, *groups)
+        self.reset(alien, explosion_group)
+
+    def reset(self, alien, explosion_group):
         self.image = self.images[0]
         self.rect = self.image.get_rect(midbottom=alien.rect.move(0, 5).midbottom)
         self.explosion_group = explosion_group
@@ -206,10 +224,13 @@ class Bomb(pg.sprite.Sprite):
         """
         self.rect.move_ip(0, self.speed)
         if self.rect.bottom >= 470:
-            Explosion(self, self.explosion_group)
+            EXPLOSION_POOL.get(self, groups=(self.explosion_group,))
             self.kill()
 
 
+BOMB_POOL = SpritePool(Bomb)
+
+
 class Score(pg.sprite.Sprite):
     """to keep track of the score."""
 
@@ -337,7 +358,7 @@ def main(winstyle=0):
         player.move(direction)
         firing = keystate[pg.K_SPACE]
         if not player.reloading and firing and len(shots) < MAX_SHOTS:
-            Shot(player.gunpos(), shots, all)
+            SHOT_POOL.get(player.gunpos(), groups=(shots, all))
             if pg.mixer and shoot_sound is not None:
                 shoot_sound.play()
         player.reloading = firing
@@ -351,14 +372,14 @@ def main(winstyle=0):
 
         # Drop bombs
         if lastalien and not int(random.random() * BOMB_ODDS):
-            Bomb(lastalien.sprite, all, bombs, all)
+            BOMB_POOL.get(lastalien.sprite, all, groups=(bombs, all))
 
         # Detect collisions between aliens and players.
         for alien in pg.sprite.spritecollide(player, aliens, 1):
             if pg.mixer and boom_sound is not None:
                 boom_sound.play()
-            Explosion(alien, all)
-            Explosion(player, all)
+            EXPLOSION_POOL.get(alien, groups=(all,))
+            EXPLOSION_POOL.get(player, groups=(all,))
             SCORE = SCORE + 1
             player.kill()
 
@@ -366,15 +387,15 @@ def main(winstyle=0):
         for alien in pg.sprite.groupcollide(aliens, shots, 1, 1).keys():
             if pg.mixer and boom_sound is not None:
                 boom_sound.play()
-            Explosion(alien, all)
+            EXPLOSION_POOL.get(alien, groups=(all,))
             SCORE = SCORE + 1
 
         # See if alien bombs hit the player.
         for bomb in pg.sprite.spritecollide(player, bombs, 1):
             if pg.mixer and boom_sound is not None:
                 boom_sound.play()
-            Explosion(player, all)
-            Explosion(bomb, all)
+            EXPLOSION_POOL.get(player, groups=(all,))
+            EXPLOSION_POOL.get(bomb, groups=(all,))
             player.kill()
 
         # draw the scene
@@ -1,6 +1,7 @@
 import pygame, random, time
 from pygame.locals import *
 from pathlib import Path
+from jtlgames import assets
 
 #VARIABLES
 SCREEN_WIDHT = 400
@@ -31,14 +32,14 @@ class Bird(pygame.sprite.Sprite):
     def __init__(self):
         pygame.sprite.Sprite.__init__(self)
 
-        self.images =  [pygame.image.load(dd/'assets/sprites/bluebird-upflap.png').convert_alpha(),
-                        pygame.image.load(dd/'assets/sprites/bluebird-midflap.png').convert_alpha(),
-                        pygame.image.load(dd/'assets/sprites/bluebird-downflap.png').convert_alpha()]
+        self.images =  [assets.image(dd/'assets/sprites/bluebird-upflap.png'),
+                        assets.image(dd/'assets/sprites/bluebird-midflap.png'),
+                        assets.image(dd/'assets/sprites/bluebird-downflap.png')]
 
         self.speed = SPEED
 
         self.current_image = 0
-        self.image = pygame.image.load(dd/'assets/sprites/bluebird-upflap.png').convert_alpha()
+        self.image = self.images[0]
         self.mask = pygame.mask.from_surface(self.image)
 
         self.rect = self.image.get_rect()
@@ -68,15 +69,14 @@ class Pipe(pygame.sprite.Sprite):
     def __init__(self, inverted, xpos, ysize):
         pygame.sprite.Sprite.__init__(self)
 
-        self. image = pygame.image.load(dd/'assets/sprites/pipe-green.png').convert_alpha()
-        self.image = pygame.transform.scale(self.image, (PIPE_WIDHT, PIPE_HEIGHT))
+        self.image = assets.image(dd/'assets/sprites/pipe-green.png', size=(PIPE_WIDHT, PIPE_HEIGHT),
+                                  flip=(False, inverted))
 
 
         self.rect = self.image.get_rect()
         self.rect[0] = xpos
 
         if inverted:
-            self.image = pygame.transform.flip(self.image, False, True)
             self.rect[1] = - (self.rect[3] - ysize)
         else:
             self.rect[1] = SCREEN_HEIGHT - ysize
@@ -94,8 +94,7 @@ class Ground(pygame.sprite.Sprite):
     
     def __init__(self, xpos):
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.image.load(dd/'assets/sprites/base.png').convert_alpha()
-        self.image = pygame.transform.scale(self.image, (GROUND_WIDHT, GROUND_HEIGHT))
+        self.image = assets.image(dd/'assets/sprites/base.png', size=(GROUND_WIDHT, GROUND_HEIGHT))
 
         self.mask = pygame.mask.from_surface(self.image)
 
@@ -121,9 +120,8 @@ screen = pygame.display.set_mode((SCREEN_WIDHT, SCREEN_HEIGHT))
 pygame.display.set_caption('Flappy Bird')
 
 
-BACKGROUND = pygame.image.load(dd / 'assets/sprites/background-day.png')
-BACKGROUND = pygame.transform.scale(BACKGROUND, (SCREEN_WIDHT, SCREEN_HEIGHT))
-BEGIN_IMAGE = pygame.image.load(dd/ 'assets/sprites/message.png').convert_alpha()
+BACKGROUND = assets.image(dd / 'assets/sprites/background-day.png', size=(SCREEN_WIDHT, SCREEN_HEIGHT), alpha=False)
+BEGIN_IMAGE = assets.image(dd/ 'assets/sprites/message.png')
 
 
     
@@ -2,6 +2,8 @@ import pygame
 import random
 import time
 
+from jtlgames import indexed
+
 pygame.init()
 
 SCREEN_WIDTH = 800
@@ -228,11 +230,12 @@ def main():
     clock = pygame.time.Clock()
 
     all_sprites = pygame.sprite.Group()
-    aliens = pygame.sprite.Group()
+    # Indexed groups, so the collision tests only look at nearby aliens and shields
+    aliens = indexed.IndexedGroup()
     projectiles = pygame.sprite.Group()
     mega_shots = pygame.sprite.Group()
     bombs = pygame.sprite.Group()
-    shields = pygame.sprite.Group()
+    shields = indexed.IndexedGroup()
     ufo_group = pygame.sprite.Group()
     boss_group = pygame.sprite.Group()
     boss = None
@@ -417,6 +420,7 @@ def main():
                         alien.rect.y += 24
                         if alien.rect.bottom >= SCREEN_HEIGHT - 120:
                             game_over = True
+                aliens.reindex()
                 if len(aliens) > 0:
                     alien_move_delay = max(80, 600 - (50 * (ALIEN_ROWS * ALIEN_COLS - len(aliens))))
 
@@ -433,33 +437,33 @@ def main():
         ufo_group.update()
 
         for proj in projectiles:
-            hit_aliens = pygame.sprite.spritecollide(proj, aliens, True)
+            hit_aliens = indexed.spritecollide(proj, aliens, True)
             if hit_aliens:
                 proj.kill()
                 for alien in hit_aliens:
                     score += 10 + (ALIEN_ROWS - alien.row) * 10
 
         for mega in mega_shots:
-            hit_aliens = pygame.sprite.spritecollide(mega, aliens, True)
+            hit_aliens = indexed.spritecollide(mega, aliens, True)
             if hit_aliens:
                 for alien in hit_aliens:
                     score += 10 + (ALIEN_ROWS - alien.row) * 10
 
         for proj in projectiles:
-            hit_shields = pygame.sprite.spritecollide(proj, shields, False)
+            hit_shields = indexed.spritecollide(proj, shields, False)
             if hit_shields:
                 proj.kill()
                 for shield in hit_shields:
                     shield.hit()
 
         for mega in mega_shots:
-            hit_shields = pygame.sprite.spritecollide(mega, shields, False)
+            hit_shields = indexed.spritecollide(mega, shields, False)
             if hit_shields:
                 for shield in hit_shields:
                     shield.hit()
 
         for bomb in bombs:
-            hit_shields = pygame.sprite.spritecollide(bomb, shields, False)
+            hit_shields = indexed.spritecollide(bomb, shields, False)
             if hit_shields:
                 bomb.kill()
                 for shield in hit_shields:
@@ -470,7 +474,7 @@ def main():
             if rocket.lives <= 0:
                 game_over = True
 
-        if pygame.sprite.spritecollide(rocket, aliens, False):
+        if indexed.spritecollide(rocket, aliens, False):
             game_over = True
 
         for ufo in ufo_group:
@@ -1,7 +1,17 @@
+import argparse
 import math
 import random
 import pygame
 
+from jtlgames.pool import SpritePool
+from jtlgames.spatial import SpatialHash
+
+try:
+    # Stores bullets and asteroids in NumPy arrays, for --numpy
+    from jtlgames.entities import EntityStore
+except ImportError:
+    EntityStore = None
+
 # --- Game Constants ---
 WIDTH, HEIGHT = 800, 600
 FPS = 60
@@ -52,6 +62,9 @@ class GodCube:
 
 LIVES = 3
 
+# Spatial hash cell size, about the diameter of a large asteroid
+CELL_SIZE = 64
+
 # --- Helper Functions ---
 def wrap_position(pos):
     x, y = pos
@@ -119,7 +132,7 @@ class Ship:
     def shoot(self):
         vec = angle_to_vector(self.angle)
         bullet_vel = [self.vel[0] + vec[0] * BULLET_SPEED, self.vel[1] + vec[1] * BULLET_SPEED]
-        return Bullet(self.pos, bullet_vel)
+        return BULLET_POOL.get(self.pos, bullet_vel)
 
     def hyperspace(self):
         if self.hyperspace_timer == 0:
@@ -130,6 +143,9 @@ class Ship:
 
 class Bullet:
     def __init__(self, pos, vel):
+        self.reset(pos, vel)
+
+    def reset(self, pos, vel):
         self.pos = pos
         self.vel = vel
         self.lifetime = BULLET_LIFETIME
@@ -144,6 +160,9 @@ class Bullet:
     def alive(self):
         return self.lifetime > 0
 
+# Spent bullets go back to the pool and are fired again
+BULLET_POOL = SpritePool(Bullet)
+
 class Asteroid:
     def __init__(self, pos, size, vel=None):
         self.size = size
@@ -196,10 +215,62 @@ class UFO:
             angle = math.degrees(math.atan2(dy, dx))
         vec = angle_to_vector(angle)
         bullet_vel = [vec[0] * BULLET_SPEED, vec[1] * BULLET_SPEED]
-        return Bullet(self.pos, bullet_vel)
+        return BULLET_POOL.get(self.pos, bullet_vel)
+
+# --- NumPy entity stores ---
+# With --numpy, bullets and asteroids are rows in EntityStores instead of
+# objects, and move and collide in a few array operations. The game plays
+# out the same way; this is for configurations with hundreds of asteroids.
+
+ASTEROID_KINDS = list(ASTEROID_SIZES)  # entity kind -> asteroid size name
+
+def add_asteroid(rocks, a):
+    rocks.add(a.pos, a.vel, a.radius, kind=ASTEROID_KINDS.index(a.size))
+
+def stored_asteroid(rocks, i):
+    """Returns row i of an asteroid store as an Asteroid, e.g. to split it"""
+    pos = tuple(rocks.pos[i].tolist())
+    return Asteroid(pos, ASTEROID_KINDS[rocks.kind[i]], rocks.vel[i].tolist())
+
+def collide_bullets_asteroids(shots, rocks):
+    """Bullets vs asteroids, for the stores. Returns the points scored.
+
+    Like the object version, each bullet in turn destroys the first asteroid
+    it hits, which may be a piece of one destroyed by an earlier bullet.
+    """
+    if not len(shots) or not len(rocks):
+        return 0
+
+    hits = rocks.hits(shots.pos)
+    score = 0
+    dead_shots, dead_rocks, pieces = [], set(), []
+
+    # Pieces are smaller than, and where their asteroid was, so a bullet that
+    # hit nothing at first can't hit a piece either
+    for b in hits.any(axis=1).nonzero()[0].tolist():
+        pos = tuple(shots.pos[b].tolist())
+        target = next((r for r in hits[b].nonzero()[0].tolist() if r not in dead_rocks), None)
+        if target is not None:
+            dead_rocks.add(target)
+            a = stored_asteroid(rocks, target)
+        else:
+            a = next((p for p in pieces if dist(pos, p.pos) < p.radius), None)
+            if a is None:
+                continue
+            pieces.remove(a)
+        dead_shots.append(b)
+        score += ASTEROID_POINTS[a.size]
+        pieces.extend(a.split())
+
+    shots.remove(dead_shots)
+    rocks.remove(list(dead_rocks))
+    for a in pieces:
+        add_asteroid(rocks, a)
+
+    return score
 
 # --- Main Game Loop ---
-def main():
+def main(use_numpy=False, start_asteroids=4):
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Asteroids")
@@ -215,15 +286,29 @@ def main():
     wave = 1
     running = True
 
+    # Broad-phase collision grids, so each collision test only looks at nearby objects
+    rock_grid = SpatialHash(WIDTH, HEIGHT, CELL_SIZE)
+    ufo_grid = SpatialHash(WIDTH, HEIGHT, CELL_SIZE)
+    ufo_bullet_grid = SpatialHash(WIDTH, HEIGHT, CELL_SIZE)
+
+    if use_numpy:
+        shots = EntityStore(WIDTH, HEIGHT, MAX_BULLETS)
+        rocks = EntityStore(WIDTH, HEIGHT, 256)
+
     def spawn_asteroids(n):
         for _ in range(n):
             while True:
                 pos = (random.uniform(0, WIDTH), random.uniform(0, HEIGHT))
                 if dist(pos, ship.pos) > 100:
                     break
-            asteroids.append(Asteroid(pos, 'large'))
+            a = Asteroid(pos, 'large')
+            if use_numpy:
+                add_asteroid(rocks, a)
+            else:
+                asteroids.append(a)
+                rock_grid.insert(a, a.pos, a.radius)
 
-    spawn_asteroids(4)
+    spawn_asteroids(start_asteroids)
 
     while running:
         keys = pygame.key.get_pressed()
@@ -231,27 +316,44 @@ def main():
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and len(bullets) < MAX_BULLETS:
-                    bullets.append(ship.shoot())
+                if event.key == pygame.K_SPACE and len(shots if use_numpy else bullets) < MAX_BULLETS:
+                    b = ship.shoot()
+                    if use_numpy:
+                        shots.add(b.pos, b.vel, life=b.lifetime)
+                        BULLET_POOL.release(b)
+                    else:
+                        bullets.append(b)
                 if event.key == pygame.K_LSHIFT or event.key == pygame.K_RSHIFT:
                     ship.hyperspace()
 
         # Update
         ship.update(keys)
+        if use_numpy:
+            shots.step()
+            shots.expire()
+            rocks.step()
         for b in bullets:
             b.update()
+            if not b.alive():
+                BULLET_POOL.release(b)
         bullets = [b for b in bullets if b.alive()]
         for a in asteroids:
             a.update()
+            rock_grid.move(a, a.pos)
         for u in ufos:
             u.update()
+            ufo_grid.move(u, u.pos, u.radius)
         for b in ufo_bullets:
             b.update()
+            if not b.alive():
+                BULLET_POOL.release(b)
         ufo_bullets = [b for b in ufo_bullets if b.alive()]
 
         # UFO spawn
         if random.random() < 0.002 and not ufos:
-            ufos.append(UFO(random.choice(['large', 'small'])))
+            u = UFO(random.choice(['large', 'small']))
+            ufos.append(u)
+            ufo_grid.insert(u, u.pos, u.radius)
 
         # UFO shooting
         for u in ufos:
@@ -259,19 +361,38 @@ def main():
                 ufo_bullets.append(u.shoot(ship.pos))
                 u.shoot_timer = random.randint(60, 120)
 
+        # UFO bullets live only a second, so file them afresh every frame
+        ufo_bullet_grid.clear()
+        for b in ufo_bullets:
+            ufo_bullet_grid.insert(b, b.pos)
+
+        # The grids return candidates in the order they were added, which is the
+        # order of the lists, so the first hit is the same one a scan would find.
+
         # Collisions: bullets vs asteroids
         for b in bullets[:]:
-            for a in asteroids[:]:
+            for a in rock_grid.query(b.pos):
                 if dist(b.pos, a.pos) < a.radius:
                     bullets.remove(b)
+                    BULLET_POOL.release(b)
                     asteroids.remove(a)
+                    rock_grid.remove(a)
                     score += ASTEROID_POINTS[a.size]
-                    asteroids.extend(a.split())
+                    for child in a.split():
+                        asteroids.append(child)
+                        rock_grid.insert(child, child.pos, child.radius)
                     break
 
+        if use_numpy:
+            score += collide_bullets_asteroids(shots, rocks)
+
         # Collisions: ship vs asteroids
-        if ship.invincible == 0:
-            for a in asteroids:
+        if use_numpy:
+            if ship.invincible == 0 and (rocks.distances(ship.pos) < rocks.radius + SHIP_SIZE / 2).any():
+                ship.lives -= 1
+                ship.respawn()
+        elif ship.invincible == 0:
+            for a in rock_grid.query(ship.pos, SHIP_SIZE / 2):
                 if dist(ship.pos, a.pos) < a.radius + SHIP_SIZE / 2:
                     ship.lives -= 1
                     ship.respawn()
@@ -279,16 +400,29 @@ def main():
 
         # Collisions: bullets vs UFOs
         for b in bullets[:]:
-            for u in ufos[:]:
+            for u in ufo_grid.query(b.pos):
                 if dist(b.pos, u.pos) < u.radius:
                     bullets.remove(b)
+                    BULLET_POOL.release(b)
                     ufos.remove(u)
+                    ufo_grid.remove(u)
                     score += UFO_POINTS[u.size]
                     break
+        if use_numpy:
+            hit_shots = []
+            for i, pos in enumerate(shots.pos.tolist()):
+                for u in ufo_grid.query(pos):
+                    if dist(pos, u.pos) < u.radius:
+                        hit_shots.append(i)
+                        ufos.remove(u)
+                        ufo_grid.remove(u)
+                        score += UFO_POINTS[u.size]
+                        break
+            shots.remove(hit_shots)
 
         # Collisions: ship vs UFOs
         if ship.invincible == 0:
-            for u in ufos:
+            for u in ufo_grid.query(ship.pos, SHIP_SIZE / 2):
                 if dist(ship.pos, u.pos) < u.radius + SHIP_SIZE / 2:
                     ship.lives -= 1
                     ship.respawn()
@@ -296,7 +430,7 @@ def main():
 
         # Collisions: UFO bullets vs ship
         if ship.invincible == 0:
-            for b in ufo_bullets:
+            for b in ufo_bullet_grid.query(ship.pos, SHIP_SIZE / 2):
                 if dist(ship.pos, b.pos) < SHIP_SIZE / 2:
                     ship.lives -= 1
                     ship.respawn()
@@ -306,7 +440,7 @@ def main():
         # (not implemented for simplicity)
 
         # Next wave
-        if not asteroids:
+        if not (len(rocks) if use_numpy else asteroids):
             wave += 1
             spawn_asteroids(3 + wave)
 
@@ -321,6 +455,11 @@ def main():
             b.draw(screen)
         for a in asteroids:
             a.draw(screen)
+        if use_numpy:
+            for x, y in shots.pos.astype(int).tolist():
+                pygame.draw.circle(screen, (255, 255, 0), (x, y), 2)
+            for (x, y), r in zip(rocks.pos.astype(int).tolist(), rocks.radius.astype(int).tolist()):
+                pygame.draw.circle(screen, (180, 180, 180), (x, y), r, 2)
         for u in ufos:
             u.draw(screen)
         for b in ufo_bullets:
@@ -344,4 +483,10 @@ def main():
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Asteroids")
+    parser.add_argument("--numpy", action="store_true", help="Keep bullets and asteroids in NumPy arrays")
+    parser.add_argument("--asteroids", type=int, default=4, help="Asteroids in the first wave")
+    args = parser.parse_args()
+    if args.numpy and EntityStore is None:
+        parser.error("--numpy needs NumPy, pip install numpy")
+    main(args.numpy, args.asteroids)
\ No newline at end of file
@@ -2,10 +2,14 @@ import pygame
 import math
 import random
 
+from jtlgames.loop import fixed_step_loop
+from jtlgames.terrain import ChunkedTerrain
+
 
 # --- Constants ---
 WIDTH, HEIGHT = 600, 600
-FPS = 60
+FPS = 60         # physics steps per second
+RENDER_FPS = 120  # frames drawn per second, at most
 
 GRAVITY = 0.01
 THRUST = 0.15
@@ -18,6 +22,9 @@ SAFE_LANDING_ANGLE = 30  # degrees
 
 START_FUEL = 100
 
+# The surface scrolls by, generated CHUNK_WIDTH pixels at a time
+CHUNK_WIDTH = 300
+
 # --- Colors ---
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 10)
@@ -38,8 +45,12 @@ class LunarModule:
         self.fuel = START_FUEL
         self.alive = True
         self.landed = False
+        self.prev_x, self.prev_y, self.prev_angle = self.x, self.y, self.angle
 
     def update(self, keys):
+        # Remember where the module was, to draw it between steps
+        self.prev_x, self.prev_y, self.prev_angle = self.x, self.y, self.angle
+
         if not self.alive or self.landed:
             return
 
@@ -66,24 +77,25 @@ class LunarModule:
         self.x += self.vx
         self.y += self.vy
 
-        # Keep inside screen
-        self.x = max(0, min(WIDTH, self.x))
+        # Keep between the top and the bottom of the screen; sideways the surface goes on forever
         self.y = max(0, min(HEIGHT, self.y))
 
-    def draw(self, surf):
-        # Draw as a triangle
-        rad = math.radians(self.angle)
+    def draw(self, surf, alpha=1.0, camera_x=0):
+        # Draw as a triangle, alpha of the way from the previous step to the current one
+        x = self.prev_x + (self.x - self.prev_x) * alpha - camera_x
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        rad = math.radians(self.prev_angle + (self.angle - self.prev_angle) * alpha)
         points = []
         for dx, dy in [(0, -20), (-10, 10), (10, 10)]:
-            px = self.x + dx * math.cos(rad) - dy * math.sin(rad)
-            py = self.y + dx * math.sin(rad) + dy * math.cos(rad)
+            px = x + dx * math.cos(rad) - dy * math.sin(rad)
+            py = y + dx * math.sin(rad) + dy * math.cos(rad)
             points.append((px, py))
         pygame.draw.polygon(surf, WHITE, points)
         # Draw flame if thrusting
         if self.alive and self.fuel > 0 and pygame.key.get_pressed()[pygame.K_UP]:
-            fx = self.x + 0 * math.cos(rad) - 18 * math.sin(rad)
-            fy = self.y + 0 * math.sin(rad) + 18 * math.cos(rad)
-            pygame.draw.line(surf, YELLOW, (self.x, self.y+15), (fx, fy+20), 4)
+            fx = x + 0 * math.cos(rad) - 18 * math.sin(rad)
+            fy = y + 0 * math.sin(rad) + 18 * math.cos(rad)
+            pygame.draw.line(surf, YELLOW, (x, y+15), (fx, fy+20), 4)
 
 class LandingZone:
     def __init__(self, x, width, difficulty):
@@ -91,116 +103,94 @@ class LandingZone:
         self.width = width
         self.difficulty = difficulty  # 1=easy, 2=medium, 3=hard
 
-    def draw(self, surf, surface_y):
-        color = GREEN if self.difficulty == 1 else YELLOW if self.difficulty == 2 else RED
-        pygame.draw.rect(surf, color, (self.x, surface_y-5, self.width, 10))
+    @property
+    def color(self):
+        return GREEN if self.difficulty == 1 else YELLOW if self.difficulty == 2 else RED
+
+def make_landing_zone(x, width):
+    # The narrower the zone, the harder it is to land on
+    difficulty = 1 if width == 80 else 2 if width == 50 else 3
+    return LandingZone(x, width, difficulty)
 
 def generate_surface():
-    # Generate a rough surface with 3 landing zones
-    points = []
-    landing_zones = []
-    surface_y = HEIGHT - 80
-    x = 0
-    while x < WIDTH:
-        if len(landing_zones) < 3 and random.random() < 0.2:
-            # Place a landing zone
-            width = random.choice([80, 50, 30])
-            difficulty = 1 if width == 80 else 2 if width == 50 else 3
-            landing_zones.append(LandingZone(x, width, difficulty))
-            for i in range(width):
-                points.append((x+i, surface_y))
-            x += width
-        else:
-            y = surface_y + random.randint(-20, 20)
-            points.append((x, y))
-            x += 10
-    return points, landing_zones, surface_y
-
-def draw_surface(surf, points):
-    pygame.draw.lines(surf, GRAY, False, points, 3)
-
-def get_surface_y_at_x(points, x):
-    # Find the y value of the surface at a given x by linear interpolation
-    for i in range(len(points) - 1):
-        x1, y1 = points[i]
-        x2, y2 = points[i + 1]
-        if x1 <= x <= x2 or x2 <= x <= x1:
-            if x2 != x1:
-                t = (x - x1) / (x2 - x1)
-                return y1 + t * (y2 - y1)
-            else:
-                return y1
-    return HEIGHT  # fallback
+    # A rough surface with landing zones, generated as the module flies over it
+    return ChunkedTerrain(seed=random.randrange(2 ** 32), chunk_width=CHUNK_WIDTH, base_y=HEIGHT - 80,
+                          pad_widths=(80, 50, 30), max_pads=2, pad_factory=make_landing_zone, color=GRAY)
+
+def draw_surface(surf, terrain, camera_x):
+    terrain.draw(surf, camera_x)
 
-def check_landing(module, points, landing_zones, surface_y):
+def get_surface_y_at_x(terrain, x):
+    # Find the y value of the surface at a given x
+    return terrain.height_at(x)
+
+def check_landing(module, terrain):
     # Get the surface y directly under the module
-    surface_y_at_x = get_surface_y_at_x(points, module.x)
+    surface_y_at_x = get_surface_y_at_x(terrain, module.x)
     # Check if module is touching the surface
     if module.y + 10 >= surface_y_at_x:
-        # Check if over a landing zone and on the flat part
-        for zone in landing_zones:
-            if zone.x <= module.x <= zone.x + zone.width:
-                # Check if the surface under the lander is flat (i.e., part of the pad)
-                pad_y = get_surface_y_at_x(points, zone.x)
-                pad_y2 = get_surface_y_at_x(points, zone.x + zone.width - 1)
-                if abs(pad_y - pad_y2) < 1 and abs(surface_y_at_x - pad_y) < 1:
-                    # Check landing conditions
-                    angle = (module.angle + 360) % 360
-                    angle_ok = (angle <= SAFE_LANDING_ANGLE or abs(angle - 360) <= SAFE_LANDING_ANGLE)
-                    if (abs(module.vy) <= SAFE_LANDING_VSPEED and
-                        abs(module.vx) <= SAFE_LANDING_HSPEED and
-                        angle_ok):
-                        module.landed = True
-                        module.y = pad_y - 10  # snap to pad
-                        return "landed", zone.difficulty
-                    else:
-                        module.alive = False
-                        return "crashed", zone.difficulty
-        # Not over a landing zone or not flat
+        # Check if over a landing zone; they are flat all the way across
+        zone = terrain.pad_at(module.x)
+        if zone is not None:
+            # Check landing conditions
+            angle = (module.angle + 360) % 360
+            angle_ok = (angle <= SAFE_LANDING_ANGLE or abs(angle - 360) <= SAFE_LANDING_ANGLE)
+            if (abs(module.vy) <= SAFE_LANDING_VSPEED and
+                abs(module.vx) <= SAFE_LANDING_HSPEED and
+                angle_ok):
+                module.landed = True
+                module.y = surface_y_at_x - 10  # snap to pad
+                return "landed", zone.difficulty
+            else:
+                module.alive = False
+                return "crashed", zone.difficulty
+        # Not over a landing zone
         module.alive = False
         return "crashed", 0
     return None, 0
 
+def nearest_zone(terrain, x):
+    # The closest landing zone within two screens, or None
+    zones = terrain.pads_between(x - 2 * WIDTH, x + 2 * WIDTH)
+    return min(zones, key=lambda zone: abs(zone.x + zone.width / 2 - x), default=None)
+
 def main():
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Lunar Lander")
-    clock = pygame.time.Clock()
 
     module = LunarModule()
-    surface_points, landing_zones, surface_y = generate_surface()
+    terrain = generate_surface()
     score = 0
     font = pygame.font.SysFont(None, 28)
     status = ""
-    running = True
 
-    while running:
+    # The physics runs FPS steps per second, whatever the frame rate
+    for frame in fixed_step_loop(screen, step_rate=FPS, frame_rate=RENDER_FPS):
         keys = pygame.key.get_pressed()
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
+        for event in frame.events:
             if (module.landed or not module.alive) and event.type == pygame.KEYDOWN and event.key == pygame.K_r:
                 # Restart
                 module = LunarModule()
-                surface_points, landing_zones, surface_y = generate_surface()
+                terrain = generate_surface()
                 status = ""
 
-        if module.alive and not module.landed:
-            module.update(keys)
-            result, difficulty = check_landing(module, surface_points, landing_zones, surface_y)
-            if result == "landed":
-                pts = 100 * difficulty
-                score += pts
-                status = f"Successful landing! +{pts} points. Press R to restart."
-            elif result == "crashed":
-                status = "Crashed! Press R to restart."
-
-        # Draw
+        for _ in range(frame.steps):
+            if module.alive and not module.landed:
+                module.update(keys)
+                result, difficulty = check_landing(module, terrain)
+                if result == "landed":
+                    pts = 100 * difficulty
+                    score += pts
+                    status = f"Successful landing! +{pts} points. Press R to restart."
+                elif result == "crashed":
+                    status = "Crashed! Press R to restart."
+
+        # Draw, with the module in the middle of the screen
+        camera_x = module.prev_x + (module.x - module.prev_x) * frame.alpha - WIDTH // 2
         screen.fill(BLACK)
-        draw_surface(screen, surface_points)
-        for zone in landing_zones:
-            zone.draw(screen, surface_y)
-        module.draw(screen)
+        draw_surface(screen, terrain, camera_x)
+        module.draw(screen, frame.alpha, camera_x)
 
         # HUD
         fuel_text = font.render(f"Fuel: {int(module.fuel)}", True, WHITE)
@@ -214,13 +204,15 @@ def main():
             screen.blit(v_text, (10, 70))
             screen.blit(h_text, (10, 100))
             screen.blit(a_text, (10, 130))
+            zone = nearest_zone(terrain, module.x)
+            if zone is not None:
+                dx = zone.x + zone.width / 2 - module.x
+                z_text = font.render(f"Landing zone: {abs(dx):.0f} {'>' if dx > 0 else '<'}", True, zone.color)
+                screen.blit(z_text, (10, 160))
         if status:
             msg = font.render(status, True, YELLOW if module.landed else RED)
             screen.blit(msg, (WIDTH//2 - msg.get_width()//2, HEIGHT//2))
 
-        pygame.display.flip()
-        clock.tick(FPS)
-
     pygame.quit()
 
 if __name__ == "__main__":
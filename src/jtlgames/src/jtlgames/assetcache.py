@@ -0,0 +1,169 @@
+"""Persistent on-disk cache of decoded, preprocessed images.
+
+Decoding a PNG and scaling it is most of what a game does when it starts.
+:func:`load_image` does that work once, stores the resulting pixels as a raw
+buffer in a cache directory and, on later runs, rebuilds the surface with
+``pygame.image.frombuffer`` instead of decoding the file again.
+
+Cache files are keyed by a hash of the source file's contents and the
+transforms applied to it, so editing an image invalidates its entries. The
+cache lives in ``$JTLGAMES_CACHE_DIR`` or ``~/.cache/jtlgames``, under a
+directory named after :data:`CACHE_VERSION`.
+"""
+
+import hashlib
+import logging
+import os
+import struct
+from pathlib import Path
+
+import pygame
+
+_logger = logging.getLogger(__name__)
+
+# Bump this when the file layout or the preprocessing changes
+CACHE_VERSION = 1
+
+_MAGIC = b"JTLC"
+_HEADER = struct.Struct("<4sHII4s?3B")
+
+
+def cache_dir():
+    """Returns the directory the cache files for this CACHE_VERSION live in"""
+
+    base = os.environ.get("JTLGAMES_CACHE_DIR")
+    if base is None:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "jtlgames"
+
+    return Path(base) / f"sprites-v{CACHE_VERSION}"
+
+
+def cache_key(filename, size=None, flip=None, alpha=True):
+    """Returns the cache key for an image file and the transforms applied to it.
+
+    Args:
+        filename (str or Path): The source image.
+        size (tuple, optional): The (width, height) the image is scaled to.
+        flip (tuple, optional): (flip_x, flip_y) booleans.
+        alpha (bool, optional): Whether per-pixel alpha is kept.
+    """
+
+    h = hashlib.sha1(Path(filename).read_bytes())
+    size = tuple(size) if size is not None else None
+    flip = (bool(flip[0]), bool(flip[1])) if flip is not None else None
+    h.update(repr((size, flip, bool(alpha), pygame.version.ver)).encode())
+
+    return h.hexdigest()
+
+
+def _read(path):
+    """Reads a cache file, returning a surface or None if it is missing or stale"""
+
+    try:
+        with open(path, "rb") as f:
+            magic, version, width, height, fmt, keyed, *colorkey = _HEADER.unpack(f.read(_HEADER.size))
+            fmt = fmt.rstrip(b" ").decode()
+            data = f.read()
+    except (OSError, struct.error):
+        return None
+
+    if magic != _MAGIC or version != CACHE_VERSION or len(data) != width * height * len(fmt):
+        return None
+
+    image = pygame.image.frombuffer(data, (width, height), fmt)
+    if keyed:
+        image.set_colorkey(colorkey)
+
+    return image
+
+
+def _write(path, image, fmt):
+    """Writes an image to a cache file. Failing to write is not an error, just a miss next time."""
+
+    colorkey = image.get_colorkey()
+    header = _HEADER.pack(_MAGIC, CACHE_VERSION, *image.get_size(), fmt.encode().ljust(4),
+                          colorkey is not None, *(colorkey or (0, 0, 0))[:3])
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(header)
+            f.write(pygame.image.tobytes(image, fmt))
+        os.replace(tmp, path)
+    except OSError as e:
+        _logger.warning(f"Unable to write sprite cache file {path}: {e}")
+
+
+def _convert(image, alpha):
+    """Converts an image to the display format, if there is a display yet"""
+
+    try:
+        return image.convert_alpha() if alpha else image.convert()
+    except pygame.error:
+        # Probably can't convert because video mode is not set yet.
+        return image
+
+
+def load_image(filename, size=None, flip=None, alpha=True, convert=True):
+    """Loads an image through the disk cache.
+
+    Args:
+        filename (str or Path): The source image.
+        size (tuple, optional): The (width, height) to scale the image to.
+        flip (tuple, optional): (flip_x, flip_y) booleans.
+        alpha (bool, optional): Keep per-pixel alpha. Defaults to True.
+        convert (bool, optional): Convert the image to the display format, with
+            convert_alpha() or convert(), if the display is set. Defaults to True.
+
+    Returns:
+        pygame.Surface: The image.
+
+    Raises:
+        FileNotFoundError: If the image cannot be loaded.
+    """
+
+    fmt = "RGBA" if alpha else "RGB"
+
+    try:
+        path = cache_dir() / (cache_key(filename, size, flip, alpha) + ".raw")
+    except OSError as e:
+        raise FileNotFoundError(e)
+
+    image = _read(path)
+
+    if image is None:
+        try:
+            image = pygame.image.load(filename)
+        except pygame.error as e:
+            print(f'Unable to load image: {filename}')
+            raise FileNotFoundError(e)
+
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+
+        if flip is not None:
+            image = pygame.transform.flip(image, *flip)
+
+        _write(path, image, fmt)
+
+        # Go through the same buffer format as a cache hit, so both give the same surface
+        colorkey = image.get_colorkey()
+        image = pygame.image.frombuffer(pygame.image.tobytes(image, fmt), image.get_size(), fmt)
+        if colorkey is not None:
+            image.set_colorkey(colorkey)
+
+    if convert:
+        image = _convert(image, alpha)
+
+    return image
+
+
+def clear_cache():
+    """Deletes the cache files for this CACHE_VERSION"""
+
+    for path in cache_dir().glob("*.raw"):
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,191 @@
+"""Shared registry of loaded images.
+
+Games tend to load the same image over and over, often once for every sprite
+they spawn. The registry loads each (file, transform) combination once and
+hands every caller the same surface::
+
+    from jtlgames import assets
+
+    class Pipe(pygame.sprite.Sprite):
+        def __init__(self, x):
+            super().__init__()
+            self.image = assets.image('pipe-green.png', size=(80, 500))
+
+Images that are not in use are evicted, least recently used first, when the
+registry holds more than its memory budget. Use :meth:`AssetRegistry.acquire`
+and :meth:`AssetRegistry.release` to pin an image that should survive
+eviction. Loads go through :mod:`jtlgames.assetcache`, so even a reload after
+eviction skips decoding the file.
+"""
+
+import os
+from collections import OrderedDict
+
+import pygame
+
+from . import assetcache
+
+# Default memory budget for the shared registry, in bytes
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+
+class _Entry(object):
+    """A surface held by the registry, with its reference count and size"""
+
+    __slots__ = ("surface", "refs", "nbytes")
+
+    def __init__(self, surface):
+        self.surface = surface
+        self.refs = 0
+        self.nbytes = surface.get_pitch() * surface.get_height()
+
+
+class AssetRegistry(object):
+    """Deduplicating, reference counted image registry with LRU eviction.
+
+    Attributes:
+        budget (int): The number of bytes of pixels to hold before evicting.
+        memory (int): The number of bytes of pixels currently held.
+        hits (int): Requests answered from the registry.
+        misses (int): Requests that had to load a file.
+        evictions (int): Images dropped to stay under the budget.
+    """
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        self.budget = budget
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._keys = {}
+
+    @staticmethod
+    def key(filename, size=None, flip=None, alpha=True, colorkey=None):
+        """Returns the registry key for a file and the transforms applied to it"""
+
+        if size is not None:
+            size = tuple(size)
+        if flip is not None:
+            flip = (bool(flip[0]), bool(flip[1]))
+        if colorkey is not None and colorkey != -1:
+            colorkey = tuple(pygame.Color(colorkey))
+
+        # abspath() rather than resolve(), so a lookup never touches the filesystem
+        return os.path.abspath(filename), size, flip, bool(alpha), colorkey
+
+    def _entry(self, key):
+        """Returns the entry for a key, loading the image if it is not held"""
+
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        filename, size, flip, alpha, colorkey = key
+        surface = assetcache.load_image(filename, size=size, flip=flip, alpha=alpha)
+
+        if colorkey is not None:
+            if colorkey == -1:
+                colorkey = surface.get_at((0, 0))
+            surface.set_colorkey(colorkey, pygame.RLEACCEL)
+
+        entry = _Entry(surface)
+        self._entries[key] = entry
+        self._keys[id(surface)] = key
+        self.memory += entry.nbytes
+        self._evict(keep=key)
+
+        return entry
+
+    def _evict(self, keep=None):
+        """Drops unreferenced images, oldest first, until the registry fits its budget"""
+
+        if self.memory <= self.budget:
+            return
+
+        for key in [k for k, e in self._entries.items() if e.refs == 0 and k != keep]:
+            if self.memory <= self.budget:
+                break
+            entry = self._entries.pop(key)
+            del self._keys[id(entry.surface)]
+            self.memory -= entry.nbytes
+            self.evictions += 1
+
+    def image(self, filename, size=None, flip=None, alpha=True, colorkey=None):
+        """Returns the shared surface for an image file.
+
+        The surface is shared with every other caller, so don't draw on it;
+        copy() it first if you need to change it.
+
+        Args:
+            filename (str or Path): The image file.
+            size (tuple, optional): The (width, height) to scale the image to.
+            flip (tuple, optional): (flip_x, flip_y) booleans.
+            alpha (bool, optional): Keep per-pixel alpha. Defaults to True.
+            colorkey (optional): The transparent color, or -1 to use the color
+                of the top left pixel.
+
+        Raises:
+            FileNotFoundError: If the image cannot be loaded.
+        """
+        return self._entry(self.key(filename, size, flip, alpha, colorkey)).surface
+
+    def acquire(self, filename, size=None, flip=None, alpha=True, colorkey=None):
+        """Like image(), but pins the image until it is release()d"""
+
+        entry = self._entry(self.key(filename, size, flip, alpha, colorkey))
+        entry.refs += 1
+
+        return entry.surface
+
+    def release(self, surface):
+        """Releases a surface returned by acquire(), making it eligible for eviction"""
+
+        key = self._keys.get(id(surface))
+        entry = self._entries.get(key)
+
+        if entry is None or entry.surface is not surface or entry.refs == 0:
+            raise ValueError("Surface was not acquired from this registry")
+
+        entry.refs -= 1
+        self._evict()
+
+    def refs(self, surface):
+        """Returns the number of outstanding acquire()s of a surface"""
+
+        entry = self._entries.get(self._keys.get(id(surface)))
+        return entry.refs if entry is not None and entry.surface is surface else 0
+
+    def clear(self):
+        """Drops every image, pinned or not"""
+
+        self._entries.clear()
+        self._keys.clear()
+        self.memory = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, surface):
+        entry = self._entries.get(self._keys.get(id(surface)))
+        return entry is not None and entry.surface is surface
+
+    def __str__(self) -> str:
+        return (f"AssetRegistry({len(self)} images, {self.memory}/{self.budget} bytes, "
+                f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions)")
+
+
+# The registry shared by everything in the process
+registry = AssetRegistry()
+
+
+def image(filename, size=None, flip=None, alpha=True, colorkey=None):
+    """Returns the shared surface for an image file from the process-wide registry.
+
+    See :meth:`AssetRegistry.image`.
+    """
+    return registry.image(filename, size, flip, alpha, colorkey)
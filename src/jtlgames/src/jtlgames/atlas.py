@@ -0,0 +1,223 @@
+"""Texture atlases: many small images packed into a few large sheets.
+
+:func:`build_atlas` packs a directory of loose images into one or more atlas
+pages and writes a JSON index of where each image ended up. :class:`Atlas`
+reads the index back and hands out each image as a view into its page, so a
+whole scene is drawn from a couple of surfaces that were each decoded once.
+
+From the command line::
+
+    ssinfo pack games/Mars-lander/resources/meteors -o build/meteors
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+
+import pygame
+
+from . import assets
+
+_logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Image types build_atlas() picks up from a directory
+IMAGE_SUFFIXES = (".png", ".gif", ".jpg", ".jpeg", ".bmp", ".tga")
+
+
+def pack_rects(sizes, max_size=(1024, 1024), padding=1):
+    """Packs rectangles onto as few pages as possible, using shelves.
+
+    Rectangles are placed tallest first, left to right in rows ("shelves"),
+    starting a new shelf when a row is full and a new page when a page is full.
+
+    Args:
+        sizes (dict): Maps a name to the (width, height) of its rectangle.
+        max_size (tuple): The largest (width, height) of a page.
+        padding (int): Pixels left empty between rectangles.
+
+    Returns:
+        tuple: (placements, page_sizes) where placements maps each name to
+        (page, pygame.Rect) and page_sizes lists the trimmed size of each page.
+
+    Raises:
+        ValueError: If a rectangle is larger than a page.
+    """
+
+    max_w, max_h = max_size
+    placements = {}
+    page_sizes = []
+    x = y = shelf_h = 0
+
+    for name, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])):
+        if w > max_w or h > max_h:
+            raise ValueError(f"Image {name} ({w}x{h}) does not fit on a {max_w}x{max_h} page")
+
+        if not page_sizes:
+            page_sizes.append([0, 0])
+
+        if x + w > max_w:  # Next shelf
+            x, y, shelf_h = 0, y + shelf_h + padding, 0
+
+        if y + h > max_h:  # Next page
+            x = y = shelf_h = 0
+            page_sizes.append([0, 0])
+
+        placements[name] = (len(page_sizes) - 1, pygame.Rect(x, y, w, h))
+        page = page_sizes[-1]
+        page[0] = max(page[0], x + w)
+        page[1] = max(page[1], y + h)
+
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+
+    return placements, [tuple(size) for size in page_sizes]
+
+
+def find_images(directory, exclude=()):
+    """Returns the image files under a directory, keyed by their path relative
+    to it without the suffix, e.g. 'meteors/spaceMeteors_001'. Files in
+    exclude are skipped."""
+
+    directory = Path(directory)
+    exclude = {Path(path).resolve() for path in exclude}
+    return {
+        path.relative_to(directory).with_suffix("").as_posix(): path
+        for path in sorted(directory.rglob("*"))
+        if path.suffix.lower() in IMAGE_SUFFIXES and path.resolve() not in exclude
+    }
+
+
+def atlas_pages(out_dir, name="atlas"):
+    """Returns the pages a build_atlas() with this out_dir and name wrote before"""
+
+    out_dir = Path(out_dir)
+    if not out_dir.is_dir():
+        return []
+    pattern = re.compile(re.escape(name) + r"\d+\.png")
+    return [path for path in sorted(out_dir.iterdir()) if pattern.fullmatch(path.name)]
+
+
+def build_atlas(directory, out_dir, name="atlas", max_size=(1024, 1024), padding=1):
+    """Packs the images in a directory into atlas pages and writes them with an index.
+
+    Writes ``<name>0.png``, ``<name>1.png``, ... and ``<name>.json`` to out_dir.
+    Pages written there before are not packed, so out_dir can be inside
+    directory, and packing again gives the same atlas. Pages left over
+    from an earlier atlas with more pages are deleted.
+
+    Args:
+        directory (str or Path): The directory of loose images.
+        out_dir (str or Path): Where to write the pages and the index.
+        name (str): The base name of the output files.
+        max_size (tuple): The largest (width, height) of a page.
+        padding (int): Pixels left empty between images.
+
+    Returns:
+        Path: The path of the index file.
+    """
+
+    files = find_images(directory, exclude=atlas_pages(out_dir, name))
+    if not files:
+        raise FileNotFoundError(f"No images found in {directory}")
+
+    images = {key: pygame.image.load(path) for key, path in files.items()}
+    placements, page_sizes = pack_rects(
+        {key: image.get_size() for key, image in images.items()}, max_size, padding)
+
+    pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+    for key, (page, rect) in placements.items():
+        pages[page].blit(images[key], rect)
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    page_files = []
+    for i, page in enumerate(pages):
+        page_file = f"{name}{i}.png"
+        pygame.image.save(page, out_dir / page_file)
+        page_files.append(page_file)
+
+    # Pages left over from an earlier atlas with more of them
+    for path in atlas_pages(out_dir, name):
+        if path.name not in page_files:
+            path.unlink()
+
+    index = {
+        "version": INDEX_VERSION,
+        "pages": page_files,
+        "frames": {key: {"page": page, "rect": list(rect)} for key, (page, rect) in sorted(placements.items())},
+    }
+
+    index_file = out_dir / f"{name}.json"
+    index_file.write_text(json.dumps(index, indent=1))
+
+    _logger.info(f"Packed {len(images)} images onto {len(pages)} pages: {index_file}")
+
+    return index_file
+
+
+class Atlas(object):
+    """A texture atlas loaded from an index written by build_atlas().
+
+    Images are subsurfaces of their page, so they cost no extra pixel memory.
+    Like other shared surfaces, don't draw on them.
+
+    Args:
+        index_file (str or Path): The JSON index.
+        registry (AssetRegistry, optional): The registry to load pages through.
+            Defaults to the process-wide registry.
+    """
+
+    def __init__(self, index_file, registry=None):
+        index_file = Path(index_file)
+        index = json.loads(index_file.read_text())
+
+        if index.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported atlas index version in {index_file}: {index.get('version')}")
+
+        self.registry = registry if registry is not None else assets.registry
+        # Pages are pinned, since every image we hand out is a view into one
+        self.pages = [self.registry.acquire(index_file.parent / page) for page in index["pages"]]
+        self.frames = {key: (frame["page"], pygame.Rect(frame["rect"])) for key, frame in index["frames"].items()}
+        self._images = {}
+
+    def image(self, name):
+        """Returns the image that was packed from the file named name"""
+
+        image = self._images.get(name)
+
+        if image is None:
+            page, rect = self.frames[name]
+            image = self._images[name] = self.pages[page].subsurface(rect)
+
+        return image
+
+    def images(self, names):
+        """Returns a list of images, in the order of names"""
+        return [self.image(name) for name in names]
+
+    def close(self):
+        """Releases the pages back to the registry"""
+
+        for page in self.pages:
+            self.registry.release(page)
+        self.pages = []
+        self._images.clear()
+
+    def __getitem__(self, name):
+        return self.image(name)
+
+    def __contains__(self, name):
+        return name in self.frames
+
+    def __iter__(self):
+        return iter(self.frames)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __str__(self) -> str:
+        return f"Atlas({len(self.frames)} images on {len(self.pages)} pages)"
@@ -0,0 +1,227 @@
+"""Many sprites that share a few images, moved, collided and drawn as arrays.
+
+A ``pygame.sprite.Group`` of thousands of sprites spends its frame calling
+each sprite's ``update()`` and testing each rect in Python. A
+:class:`SpriteBatch` keeps the sprites' positions, velocities and images in
+NumPy arrays instead, so moving all of them is a few array operations, and
+a collision test only looks at the sprites near the rect being tested::
+
+    meteors = SpriteBatch(meteor_images, (WIDTH, HEIGHT))
+    meteors.add(centers, velocities, image_numbers)
+
+    meteors.step()                       # every sprite moves by its velocity
+    hit = meteors.collide_rect(lander.rect)
+    meteors.remove(hit)
+    meteors.draw(screen)
+
+Positions are whole pixels, like a Rect's. Velocities are in pixels per step
+and are accumulated until they add up to more than a pixel, which is then
+moved by, as sprites that call ``rect.move_ip(dx, dy)`` with their
+accumulated motion do.
+
+Collision tests use a grid of the sprites' top left corners, built the
+first time it is needed after the sprites moved. Sprites are addressed by
+index, in the order they were added; removing some moves the later ones
+down, like deleting from a list.
+
+This module needs NumPy, which jtlgames does not require. Install it with
+``pip install jtlgames[numpy]``.
+"""
+
+import numpy as np
+import pygame
+
+
+class SpriteBatch(object):
+    """Positions, velocities and images of many sprites, in NumPy arrays.
+
+    Args:
+        images (list): The images the sprites can have, by number.
+        size (tuple): The size of the area the sprites are in, for the grid.
+            Sprites outside it still work, they just share the edge cells.
+        cell_size (int): The width and height of the grid's cells.
+        capacity (int): The number of sprites to allocate room for. The
+            arrays grow as needed.
+
+    Attributes:
+        pos (numpy.ndarray): (n, 2) integer top left corners.
+        vel (numpy.ndarray): (n, 2) velocities, in pixels per step.
+        frac (numpy.ndarray): (n, 2) motion accumulated but not moved by yet.
+        image (numpy.ndarray): (n,) image numbers.
+        queries (int): The number of collide_rect() calls.
+        candidates (int): The number of sprites collide_rect() looked at, summed.
+
+    The attributes are views of the first n rows of the storage, and are
+    replaced when sprites are added or removed, so don't keep them across
+    those calls.
+    """
+
+    FIELDS = ("pos", "vel", "frac", "image")
+
+    def __init__(self, images, size, cell_size=64, capacity=64):
+        self.images = list(images)
+        self.sizes = np.array([image.get_size() for image in self.images], dtype=np.int64).reshape(-1, 2)
+        self.cell_size = cell_size
+        self.cols = max(1, -(-int(size[0]) // cell_size))
+        self.rows = max(1, -(-int(size[1]) // cell_size))
+        self.queries = 0
+        self.candidates = 0
+        self._count = 0
+        self._pos = np.zeros((capacity, 2), dtype=np.int64)
+        self._vel = np.zeros((capacity, 2))
+        self._frac = np.zeros((capacity, 2))
+        self._image = np.zeros(capacity, dtype=np.int64)
+        self._grid = None
+        self._views()
+
+    def _views(self):
+        n = self._count
+        self.pos = self._pos[:n]
+        self.vel = self._vel[:n]
+        self.frac = self._frac[:n]
+        self.image = self._image[:n]
+        self._grid = None
+
+    def _grow(self, count):
+        capacity = max(1, len(self._image))
+        while capacity < count:
+            capacity *= 2
+        for field in self.FIELDS:
+            old = getattr(self, "_" + field)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, "_" + field, new)
+
+    def add(self, centers, vels, images):
+        """Adds sprites centered on centers, like ``rect.center = center``.
+
+        Args:
+            centers: (k, 2) integer centers.
+            vels: (k, 2) velocities.
+            images: (k,) image numbers.
+
+        Returns:
+            range: The indexes of the new sprites.
+        """
+
+        images = np.asarray(images, dtype=np.int64).reshape(-1)
+        start, end = self._count, self._count + len(images)
+        if end > len(self._image):
+            self._grow(end)
+
+        self._count = end
+        self._views()
+        self.place(slice(start, end), centers, vels, images)
+
+        return range(start, end)
+
+    def place(self, which, centers, vels, images):
+        """Gives sprites new centers, velocities and images, e.g. to reuse ones that left the screen.
+        Their accumulated motion is reset."""
+
+        images = np.asarray(images, dtype=np.int64).reshape(-1)
+        self.image[which] = images
+        self.pos[which] = np.asarray(centers, dtype=np.int64).reshape(-1, 2) - self.sizes[images] // 2
+        self.vel[which] = np.asarray(vels, dtype=float).reshape(-1, 2)
+        self.frac[which] = 0
+        self._grid = None
+
+    def remove(self, which):
+        """Removes sprites, given as indexes or a boolean mask, keeping the order of the rest"""
+
+        keep = np.ones(self._count, dtype=bool)
+        keep[which] = False
+        n = int(keep.sum())
+
+        if n != self._count:
+            for field in self.FIELDS:
+                storage = getattr(self, "_" + field)
+                storage[:n] = storage[:self._count][keep]
+            self._count = n
+            self._views()
+
+    def clear(self):
+        self._count = 0
+        self._views()
+
+    def step(self):
+        """Adds each sprite's velocity to its accumulated motion, and moves it by
+        the whole pixels of that, on the axes where it is more than one pixel"""
+
+        self.frac += self.vel
+        move = np.trunc(self.frac)
+        move[np.abs(self.frac) <= 1] = 0
+        self.frac -= move
+        self.pos += move.astype(np.int64)
+        self._grid = None
+
+    @property
+    def size(self):
+        """(n, 2) widths and heights"""
+        return self.sizes[self.image]
+
+    @property
+    def left(self):
+        return self.pos[:, 0]
+
+    @property
+    def top(self):
+        return self.pos[:, 1]
+
+    @property
+    def right(self):
+        return self.pos[:, 0] + self.sizes[self.image, 0]
+
+    @property
+    def bottom(self):
+        return self.pos[:, 1] + self.sizes[self.image, 1]
+
+    def _cells(self, x, y):
+        cols = np.clip(x // self.cell_size, 0, self.cols - 1)
+        rows = np.clip(y // self.cell_size, 0, self.rows - 1)
+        return cols, rows
+
+    def _build_grid(self):
+        cols, rows = self._cells(self.left, self.top)
+        cells = rows * self.cols + cols
+        order = np.argsort(cells, kind="stable")
+        starts = np.searchsorted(cells[order], np.arange(self.cols * self.rows + 1))
+        self._grid = order, starts
+
+    def collide_rect(self, rect):
+        """Returns the indexes of the sprites whose rects overlap rect, in order,
+        with the same test as ``Rect.colliderect``"""
+
+        if self._grid is None:
+            self._build_grid()
+        order, starts = self._grid
+        x, y, w, h = pygame.Rect(rect)
+        self.queries += 1
+        if not (w and h and self._count):
+            return np.zeros(0, dtype=np.int64)
+
+        # A sprite that overlaps rect has its top left corner less than a sprite's size above and left of it
+        (col0, col1), (row0, row1) = self._cells(np.array([x - self.sizes[:, 0].max() + 1, x + w - 1]),
+                                                 np.array([y - self.sizes[:, 1].max() + 1, y + h - 1]))
+        slices = [order[starts[row * self.cols + col0]:starts[row * self.cols + col1 + 1]]
+                  for row in range(row0, row1 + 1)]
+        near = np.sort(np.concatenate(slices))
+        self.candidates += len(near)
+
+        pos, size = self.pos[near], self.sizes[self.image[near]]
+        hit = ((pos[:, 0] < x + w) & (pos[:, 0] + size[:, 0] > x) &
+               (pos[:, 1] < y + h) & (pos[:, 1] + size[:, 1] > y) & (size[:, 0] > 0) & (size[:, 1] > 0))
+        return near[hit]
+
+    def draw(self, surface):
+        """Blits every sprite onto surface"""
+
+        images = self.images
+        surface.blits([(images[i], pos) for i, pos in zip(self.image.tolist(), self.pos.tolist())], 0)
+
+    def __len__(self):
+        return self._count
+
+    def __str__(self) -> str:
+        mean = self.candidates / self.queries if self.queries else 0
+        return f"SpriteBatch({self._count} sprites, room for {len(self._image)}, {mean:.1f} candidates per query)"
@@ -0,0 +1,125 @@
+"""Dirty rectangle tracking for games that blit straight to the screen.
+
+``pygame.sprite.RenderUpdates`` gives dirty rectangle updates to games built on
+sprite groups. :class:`DirtyScreen` does the same for games whose objects draw
+themselves with ``screen.blit()``: wrap the display surface, and it remembers
+what was drawn where, erases it with the background next frame, and pushes
+only the changed parts of the window to the display::
+
+    screen = DirtyScreen(pygame.display.set_mode((800, 600)), background)
+
+    while running:
+        screen.clear()              # instead of screen.blit(background, (0, 0))
+        for thing in things:
+            screen.blit(thing.image, thing.rect)
+        screen.update()             # instead of pygame.display.update()
+
+A blit of the same surface to the same place as last frame does not count as
+a change, so a scene that is standing still costs no display update at all.
+That means a surface must not be drawn on after it has been blitted; blit a
+new surface instead. Set ``full_frame=True`` to redraw and update the whole
+window every frame, e.g. to compare the two.
+"""
+
+import pygame
+
+
+class DirtyScreen(object):
+    """A display surface wrapper that tracks what changed each frame.
+
+    Anything other than blit() is passed through to the wrapped surface.
+
+    Args:
+        surface (pygame.Surface): The display surface.
+        background (pygame.Surface): What to erase with. Must cover the surface.
+        full_frame (bool): Clear and update the whole window every frame.
+
+    Attributes:
+        frames (int): The number of update() calls.
+        pixels (int): The number of pixels pushed to the display, summed over frames.
+        frame_pixels (int): The number of pixels pushed by the last update().
+    """
+
+    def __init__(self, surface, background, full_frame=False):
+        self.surface = surface
+        self.background = background
+        self.full_frame = full_frame
+        self.frames = 0
+        self.pixels = 0
+        self.frame_pixels = 0
+        # What was drawn on the screen since the last clear(), as (source, rect, area)
+        self._drawn = []
+        # The entries drawn in the previous frame, which hold on to their sources
+        # so a new surface can't be mistaken for an old one with the same id
+        self._previous = set()
+        self._erased = []
+
+        # Start from a clean background, all of which has to be pushed
+        self.surface.blit(self.background, (0, 0))
+        self.invalidate()
+
+    def __getattr__(self, name):
+        return getattr(self.surface, name)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Blits source to the screen and records where it went"""
+
+        rect = self.surface.blit(source, dest, area, special_flags)
+        self._drawn.append((source, tuple(rect), tuple(area) if area is not None else None))
+
+        return rect
+
+    def clear(self):
+        """Erases everything drawn since the last clear() with the background"""
+
+        if self.full_frame:
+            self.surface.blit(self.background, (0, 0))
+        else:
+            for _, rect, _ in self._drawn:
+                self.surface.blit(self.background, rect, rect)
+
+        self._erased.extend(self._drawn)
+        self._drawn = []
+
+    def invalidate(self):
+        """Makes the next update() push the whole window, e.g. after the display was re-created"""
+        self._erased.append((None, tuple(self.surface.get_rect()), None))
+
+    def dirty_rects(self):
+        """Returns the rects that changed since the last update()"""
+
+        current = set(self._drawn)
+        changed = (current - self._previous) | (set(self._erased) - current)
+
+        return [pygame.Rect(rect) for _, rect, _ in changed]
+
+    def update(self):
+        """Pushes the changed parts of the screen to the display.
+
+        Returns:
+            list: The rects that were updated.
+        """
+
+        if self.full_frame:
+            rects = [self.surface.get_rect()]
+            pygame.display.update()
+        else:
+            rects = self.dirty_rects()
+            pygame.display.update(rects)
+
+        self.frames += 1
+        self.frame_pixels = sum(r.width * r.height for r in rects)
+        self.pixels += self.frame_pixels
+
+        self._previous = set(self._drawn)
+        self._erased = []
+
+        return rects
+
+    def stats(self):
+        """Returns a one line summary of the pixels pushed to the display"""
+
+        full = self.surface.get_width() * self.surface.get_height()
+        mean = self.pixels / self.frames if self.frames else 0
+        mode = "full frame" if self.full_frame else "dirty rects"
+        return f"{mode}: {self.frames} frames, {mean:.0f} pixels/frame ({mean / full:.1%} of the window)"
@@ -0,0 +1,149 @@
+"""Structure-of-arrays storage for many simple moving entities.
+
+A game with hundreds of bullets or rocks, each a Python object with its own
+``update()``, spends most of its frame in the interpreter. An
+:class:`EntityStore` keeps the entities of one kind in NumPy arrays, one
+array per field, so moving all of them or testing all of them against a
+point is a handful of array operations::
+
+    rocks = EntityStore(WIDTH, HEIGHT)
+    rocks.add((100, 100), (1.5, -0.5), radius=30, kind=LARGE)
+
+    rocks.step()                        # pos += vel, wrapped to the world
+    hit = rocks.hits(bullet_positions)  # bullets x rocks booleans
+    rocks.remove(dead)                  # keeps the order of the others
+
+Entities are addressed by index, in the order they were added; removing
+some moves the later ones down, like deleting from a list.
+
+This module needs NumPy, which jtlgames does not require. Install it with
+``pip install jtlgames[numpy]``.
+"""
+
+import numpy as np
+
+
+class EntityStore(object):
+    """Positions, velocities, radii, lifetimes and kinds of entities in a wrapping world.
+
+    Args:
+        width (float): World width.
+        height (float): World height.
+        capacity (int): The number of entities to allocate room for. The
+            arrays grow as needed.
+        wrap (bool): Wrap positions around the world's edges in step().
+
+    Attributes:
+        pos (numpy.ndarray): (n, 2) positions.
+        vel (numpy.ndarray): (n, 2) velocities, per step.
+        radius (numpy.ndarray): (n,) radii.
+        life (numpy.ndarray): (n,) steps left to live, inf for no limit.
+        kind (numpy.ndarray): (n,) integer kinds, for the game to use.
+
+    The attributes are views of the first n rows of the storage, and are
+    replaced when entities are added or removed, so don't keep them across
+    those calls.
+    """
+
+    FIELDS = ("pos", "vel", "radius", "life", "kind")
+
+    def __init__(self, width, height, capacity=64, wrap=True):
+        self.size = np.array((width, height), dtype=float)
+        self.wrap = wrap
+        self._count = 0
+        self._pos = np.zeros((capacity, 2))
+        self._vel = np.zeros((capacity, 2))
+        self._radius = np.zeros(capacity)
+        self._life = np.full(capacity, np.inf)
+        self._kind = np.zeros(capacity, dtype=int)
+        self._views()
+
+    def _views(self):
+        n = self._count
+        self.pos = self._pos[:n]
+        self.vel = self._vel[:n]
+        self.radius = self._radius[:n]
+        self.life = self._life[:n]
+        self.kind = self._kind[:n]
+
+    def _grow(self):
+        capacity = max(1, len(self._radius)) * 2
+        for field in self.FIELDS:
+            old = getattr(self, "_" + field)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            if field == "life":
+                new[:] = np.inf
+            new[:len(old)] = old
+            setattr(self, "_" + field, new)
+
+    def add(self, pos, vel=(0, 0), radius=0.0, life=None, kind=0):
+        """Adds an entity at the end and returns its index"""
+
+        if self._count == len(self._radius):
+            self._grow()
+
+        i = self._count
+        self._pos[i] = pos
+        self._vel[i] = vel
+        self._radius[i] = radius
+        self._life[i] = np.inf if life is None else life
+        self._kind[i] = kind
+        self._count += 1
+        self._views()
+
+        return i
+
+    def remove(self, which):
+        """Removes entities, given as indexes or a boolean mask, keeping the order of the rest"""
+
+        keep = np.ones(self._count, dtype=bool)
+        keep[which] = False
+        n = int(keep.sum())
+
+        if n != self._count:
+            for field in self.FIELDS:
+                storage = getattr(self, "_" + field)
+                storage[:n] = storage[:self._count][keep]
+            self._life[n:self._count] = np.inf
+            self._count = n
+            self._views()
+
+    def clear(self):
+        self._life[:self._count] = np.inf
+        self._count = 0
+        self._views()
+
+    def step(self):
+        """Moves every entity by its velocity, wraps it into the world and counts down its life"""
+
+        self.pos += self.vel
+        if self.wrap:
+            np.mod(self.pos, self.size, out=self.pos)
+        self.life -= 1
+
+    def expire(self):
+        """Removes the entities whose life ran out. Returns how many there were."""
+
+        dead = self.life <= 0
+        count = int(dead.sum())
+        if count:
+            self.remove(dead)
+        return count
+
+    def distances(self, point):
+        """Returns the distance from a point to every entity"""
+        return np.hypot(self.pos[:, 0] - point[0], self.pos[:, 1] - point[1])
+
+    def hits(self, points, extra=0.0):
+        """Returns a (len(points), n) boolean array of which points are closer
+        to which entities than the entity's radius plus extra"""
+
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        d = np.hypot(points[:, 0, None] - self.pos[:, 0], points[:, 1, None] - self.pos[:, 1])
+        return d < self.radius + extra
+
+    def __len__(self):
+        return self._count
+
+    def __str__(self) -> str:
+        return f"EntityStore({self._count} entities, room for {len(self._radius)})"
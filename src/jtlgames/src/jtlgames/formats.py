@@ -0,0 +1,152 @@
+"""Pixel format checks, so images are blitted without converting every pixel.
+
+A surface from ``pygame.image.load()`` is in the file's pixel format, which
+is rarely the display's. Blitting it converts every pixel, every time, and
+can be ten times slower than blitting the same image after ``convert()`` or
+``convert_alpha()``. A fully opaque image with per-pixel alpha is blended
+pixel by pixel when it could be copied. Neither changes what is drawn, so
+neither is noticed until a game is slow.
+
+:func:`normalize` converts a surface to the display format, and leaves one
+that already is alone. :class:`BlitAudit` wraps the display surface for a
+frame or two and warns once about each image blitted in the wrong format::
+
+    screen = pygame.display.set_mode((800, 600))
+    audit = BlitAudit(screen)
+    draw_everything(audit)      # instead of draw_everything(screen), on the first frame
+    print(audit.problems)
+
+:func:`blit_rate` measures how fast a surface blits, to see the difference.
+"""
+
+import logging
+from time import perf_counter
+
+import pygame
+
+_logger = logging.getLogger(__name__)
+
+
+def _display(display):
+    display = display if display is not None else pygame.display.get_surface()
+    if display is None:
+        raise pygame.error("No display mode set")
+    return display
+
+
+def has_alpha(surface):
+    """True if the surface has per-pixel alpha"""
+    return bool(surface.get_flags() & pygame.SRCALPHA)
+
+
+def opaque(surface):
+    """True if the surface has per-pixel alpha but not a single pixel that isn't fully opaque"""
+    return has_alpha(surface) and min(pygame.image.tobytes(surface, "RGBA")[3::4], default=255) == 255
+
+
+def is_display_format(surface, display=None):
+    """True if blitting the surface to the display needs no pixel conversion.
+
+    Args:
+        surface (pygame.Surface): The surface.
+        display (pygame.Surface, optional): The display. Defaults to the current one.
+
+    Raises:
+        pygame.error: If no display mode is set.
+    """
+
+    display = _display(display)
+    if surface.get_bitsize() != display.get_bitsize() or surface.get_masks()[:3] != display.get_masks()[:3]:
+        return False
+    # convert_alpha() keeps the display's color layout and adds an alpha channel
+    return not has_alpha(surface) or surface.get_masks()[3] != 0
+
+
+def normalize(surface, display=None):
+    """Returns the surface in the display's format: itself if it already is,
+    else converted with convert_alpha() if it has per-pixel alpha, or convert().
+
+    Raises:
+        pygame.error: If no display mode is set.
+    """
+
+    if is_display_format(surface, display):
+        return surface
+    return surface.convert_alpha() if has_alpha(surface) else surface.convert()
+
+
+def problem(surface, display=None):
+    """Returns why blitting surface to the display is slower than it could be, or None"""
+
+    if not is_display_format(surface, display):
+        return "not in the display's pixel format; convert() or convert_alpha() it"
+    if opaque(surface):
+        return "fully opaque, but has per-pixel alpha; load it without alpha or convert() it"
+    return None
+
+
+class BlitAudit(object):
+    """A display surface wrapper that checks the format of every surface blitted on it.
+
+    Each surface is checked the first time it is blitted, and a warning is
+    logged if it has a problem(). Anything other than blit() and blits() is
+    passed through to the wrapped surface.
+
+    Args:
+        surface (pygame.Surface): The display surface.
+
+    Attributes:
+        checked (int): The number of distinct surfaces checked.
+        problems (list): (surface size, problem) for each surface with one.
+    """
+
+    def __init__(self, surface):
+        self.surface = surface
+        self.checked = 0
+        self.problems = []
+        # The surfaces seen, kept alive so a new surface can't reuse an old one's id
+        self._seen = {}
+
+    def __getattr__(self, name):
+        return getattr(self.surface, name)
+
+    def check(self, source):
+        """Checks a surface, unless it was checked already"""
+
+        if id(source) in self._seen:
+            return
+        self._seen[id(source)] = source
+        self.checked += 1
+
+        reason = problem(source, self.surface)
+        if reason is not None:
+            size = source.get_size()
+            self.problems.append((size, reason))
+            _logger.warning(f"A {size[0]}x{size[1]} surface blitted to the display is {reason}")
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        self.check(source)
+        return self.surface.blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        blit_sequence = list(blit_sequence)
+        for item in blit_sequence:
+            self.check(item[0])
+        return self.surface.blits(blit_sequence, doreturn)
+
+
+def blit_rate(surface, target, seconds=0.2):
+    """Blits surface onto target, at its top left corner, for about seconds seconds.
+
+    Returns:
+        float: The number of blits per second.
+    """
+
+    count = 0
+    start = now = perf_counter()
+    while now - start < seconds:
+        target.blit(surface, (0, 0))
+        count += 1
+        now = perf_counter()
+
+    return count / (now - start)
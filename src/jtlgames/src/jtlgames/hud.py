@@ -0,0 +1,148 @@
+"""Retained-mode HUD panels.
+
+A HUD that renders every one of its values each frame rasterizes the same
+text over and over, since most values don't change from one frame to the
+next. A :class:`Hud` keeps the rendered text of each of its fields and
+re-renders a field only when its formatted value changes. Drawing it is a
+blit of its background, if it has one, and a small blit per field::
+
+    hud = Hud((0, 0, 350, 120), background=panel_image)
+    hud.add("fuel", (70, 30), font, WHITE, "Fuel: {}")
+    hud.add("score", (70, 80), font, WHITE)
+
+    while running:
+        ...
+        hud.set("fuel", lander.fuel)
+        hud.set("score", score)
+        dirty = hud.draw(screen)
+
+:meth:`Hud.draw` returns the parts of the screen the HUD changed since the
+last draw, for games that update the display with dirty rectangles. A game
+that redraws the world under the HUD every frame still has to draw the HUD
+every frame, but it can ignore them.
+
+The fields' text is blitted one surface at a time rather than composited
+onto one layer first: the text is usually a small part of the panel, and
+blitting a panel-sized layer with per-pixel alpha costs more than the few
+small blits do. It also looks exactly like rendering each value and blitting
+it there.
+"""
+
+import pygame
+
+from jtlgames.text import Counter
+
+
+class Field(object):
+    """One value on a Hud.
+
+    Attributes:
+        name (str): Its name.
+        pos (tuple): Where its text goes, relative to the Hud.
+        counter (Counter): Renders its text.
+        rect (pygame.Rect): Where its text is, relative to the Hud. Empty until it is set.
+        surface (pygame.Surface): Its text, or None until it is set.
+        dest (pygame.Rect): Where its text goes on the screen.
+    """
+
+    def __init__(self, name, pos, counter):
+        self.name = name
+        self.pos = pos
+        self.counter = counter
+        self.rect = pygame.Rect(pos, (0, 0))
+        self.surface = None
+        self.dest = None
+
+
+class Hud(object):
+    """A panel of text fields, each rendered again only when its text changes.
+
+    Args:
+        rect: Where the panel goes on the screen. Fields are placed relative to its top left corner.
+        background (pygame.Surface, optional): Drawn under the fields every draw().
+
+    Attributes:
+        fields (dict): The fields, by name.
+        renders (int): The number of times a field's text was re-rendered.
+    """
+
+    def __init__(self, rect, background=None):
+        self.rect = pygame.Rect(rect)
+        self.fields = {}
+        self.renders = 0
+        self._background = background
+        self._dirty = [self.rect.copy()]
+
+    @property
+    def background(self):
+        return self._background
+
+    @background.setter
+    def background(self, image):
+        if image is not self._background:
+            self._background = image
+            self._dirty.append(self.rect.copy())
+
+    def add(self, name, pos, font, color, fmt="{}", glyphs=None):
+        """Adds a field, which shows nothing until it is set.
+
+        Args:
+            name (str): The name to set() it by.
+            pos (tuple): Where its text goes, relative to the Hud.
+            font (pygame.font.Font): The font.
+            color: The text color.
+            fmt (str): A format string for its value, e.g. "Fuel: {}".
+            glyphs (text.GlyphAtlas, optional): Render with these glyphs. See text.Counter.
+
+        Returns:
+            Field: The field.
+        """
+
+        field = self.fields[name] = Field(name, pos, Counter(font, color, fmt, glyphs))
+        return field
+
+    def set(self, name, value):
+        """Sets a field's value, re-rendering its text if the formatted value changed.
+
+        Returns:
+            bool: True if the text changed.
+        """
+
+        field = self.fields[name]
+        surface = field.counter.render(value)
+        if surface is field.surface:
+            return False
+
+        old = field.rect
+        field.surface = surface
+        field.rect = surface.get_rect(topleft=field.pos)
+        field.dest = field.rect.move(self.rect.topleft)
+
+        self.renders += 1
+        self._dirty.append(old.union(field.rect).move(self.rect.topleft))
+        return True
+
+    def update(self, values):
+        """Sets the fields named in a dict of values. Returns True if any text changed."""
+
+        changed = False
+        for name, value in values.items():
+            changed = self.set(name, value) or changed
+        return changed
+
+    def draw(self, surf):
+        """Draws the background and the fields on surf.
+
+        Returns:
+            list: The rects of surf that changed since the last draw(), as far as
+            the Hud knows. All of it the first time.
+        """
+
+        if self._background is not None:
+            surf.blit(self._background, self.rect)
+        for field in self.fields.values():
+            if field.surface is not None:
+                surf.blit(field.surface, field.dest)
+
+        dirty, self._dirty = self._dirty, []
+        return [r for r in dirty if r.width and r.height]
@@ -0,0 +1,139 @@
+"""A sprite group with a spatial index, and collide functions that use it.
+
+``pygame.sprite.spritecollide`` tests a sprite against every sprite in a
+group, and ``groupcollide`` does that for every sprite in another group. An
+:class:`IndexedGroup` files its sprites in a :class:`~jtlgames.spatial.SpatialHash`
+grid, and this module's :func:`spritecollide`, :func:`groupcollide` and
+:func:`spritecollideany` only test the sprites near the one being checked.
+They take the same arguments as pygame's and return the same results, in the
+same order, and fall back to pygame's for ordinary groups::
+
+    from jtlgames import indexed
+
+    blockers = indexed.IndexedGroup()
+    ...
+    indexed.groupcollide(bullets, blockers, True, True)
+
+The index follows sprites as they are added and removed. A group can't see a
+sprite's rect change, so the sprites are re-filed when the group's update()
+runs; call reindex() after moving them some other way. Groups whose sprites
+don't move, like walls and shields, never need re-filing.
+
+The index only narrows the candidates down by rect, so it is used for the
+default collision test, collide_rect and collide_mask. Other ``collided``
+functions test every sprite, as pygame does.
+"""
+
+import pygame
+from pygame.sprite import collide_mask, collide_rect
+
+from .spatial import SpatialHash
+
+
+class IndexedGroup(pygame.sprite.Group):
+    """A Group that keeps its sprites in a spatial hash by rect.
+
+    Args:
+        *sprites: Sprites to add.
+        size (tuple, optional): The size of the area the sprites are in.
+            Defaults to the display surface's size. Sprites outside it still
+            work, they just share the edge cells.
+        cell_size (int): The grid cell size; about the size of the sprites.
+    """
+
+    def __init__(self, *sprites, size=None, cell_size=32):
+        if size is None:
+            screen = pygame.display.get_surface()
+            if screen is None:
+                raise ValueError("IndexedGroup needs a size when there is no display surface")
+            size = screen.get_size()
+
+        self.index = SpatialHash(size[0], size[1], cell_size, wrap=False)
+        # The rect each sprite was filed with
+        self._filed = {}
+        super().__init__(*sprites)
+
+    @staticmethod
+    def _circle(rect):
+        """Returns the center and radius of a circle around a rect"""
+        return rect.center, (rect.width * rect.width + rect.height * rect.height) ** 0.5 / 2
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        rect = sprite.rect
+        self._filed[sprite] = tuple(rect)
+        self.index.insert(sprite, *self._circle(rect))
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        del self._filed[sprite]
+        self.index.remove(sprite)
+
+    def reindex(self):
+        """Re-files the sprites whose rects changed since they were filed"""
+
+        filed = self._filed
+        for sprite in self.spritedict:
+            rect = sprite.rect
+            key = tuple(rect)
+            if filed[sprite] != key:
+                filed[sprite] = key
+                self.index.move(sprite, *self._circle(rect))
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.reindex()
+
+    def candidates(self, rect):
+        """Returns the sprites that may overlap a rect, in the group's order"""
+        return self.index.query(*self._circle(rect))
+
+
+def spritecollide(sprite, group, dokill, collided=None):
+    """Like pygame.sprite.spritecollide(), using the group's index if it has one"""
+
+    if not isinstance(group, IndexedGroup) or collided not in (None, collide_rect, collide_mask):
+        return pygame.sprite.spritecollide(sprite, group, dokill, collided)
+
+    candidates = group.candidates(sprite.rect)
+
+    if collided is None:
+        colliderect = sprite.rect.colliderect
+        crashed = [s for s in candidates if colliderect(s.rect)]
+    else:
+        crashed = [s for s in candidates if collided(sprite, s)]
+
+    if dokill:
+        for s in crashed:
+            s.kill()
+
+    return crashed
+
+
+def groupcollide(groupa, groupb, dokilla, dokillb, collided=None):
+    """Like pygame.sprite.groupcollide(), using groupb's index if it has one"""
+
+    crashed = {}
+
+    for sprite in groupa.sprites():
+        collision = spritecollide(sprite, groupb, dokillb, collided)
+        if collision:
+            crashed[sprite] = collision
+            if dokilla:
+                sprite.kill()
+
+    return crashed
+
+
+def spritecollideany(sprite, group, collided=None):
+    """Like pygame.sprite.spritecollideany(), using the group's index if it has one"""
+
+    if not isinstance(group, IndexedGroup) or collided not in (None, collide_rect, collide_mask):
+        return pygame.sprite.spritecollideany(sprite, group, collided)
+
+    collided = collided or (lambda a, b: a.rect.colliderect(b.rect))
+    for s in group.candidates(sprite.rect):
+        if collided(sprite, s):
+            return s
+
+    return None
@@ -1,23 +1,134 @@
+from collections import namedtuple
+
 import pygame
 
-def main_loop(screen, frame_rate=60):
+from .profiler import FrameProfiler
+
+# What fixed_step_loop() yields each frame: the number of simulation steps to
+# run, how far (0 to 1) the display is between the last step and the next, the
+# length of a step in seconds and the frame's events.
+Frame = namedtuple("Frame", "steps alpha dt events")
+
+
+def main_loop(screen, frame_rate=60, profiler=None, overlay=False):
     """Main loop generator function.
 
     Args:
         screen (pygame.Surface): The display surface.
         frame_rate (int): The frame rate to cap the loop at.
+        profiler (FrameProfiler, optional): Times the phases of every frame:
+            "events", "update" (the caller's code between yields), "overlay",
+            "flip" and "tick" (the time clock.tick() sleeps).
+        overlay (bool): Draw the profiler's frame times on the screen. Makes a
+            profiler if none is given.
     """
     running = True
     clock = pygame.time.Clock()
 
+    if overlay and profiler is None:
+        profiler = FrameProfiler()
+
     while running:
+        if profiler is not None:
+            profiler.begin()
+
         screen.fill((0, 0, 139))  # Clear screen with deep blue
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
 
+        if profiler is not None:
+            profiler.mark("events")
+
         yield
 
+        if profiler is not None:
+            profiler.mark("update")
+            if overlay:
+                profiler.draw(screen)
+                profiler.mark("overlay")
+
         pygame.display.flip()
-        clock.tick(frame_rate)
\ No newline at end of file
+
+        if profiler is not None:
+            profiler.mark("flip")
+
+        clock.tick(frame_rate)
+
+        if profiler is not None:
+            profiler.mark("tick")
+            profiler.end()
+
+
+def fixed_step_loop(screen, step_rate=60, frame_rate=0, max_steps=5, profiler=None, overlay=False):
+    """Main loop generator function that runs the simulation at a fixed rate.
+
+    The simulation advances in steps of 1/step_rate seconds, however fast the
+    frames are drawn: each frame gets as many steps as the time since the last
+    frame covers, and the leftover fraction of a step as alpha, to interpolate
+    drawn positions between the previous and the current step::
+
+        for frame in fixed_step_loop(screen, step_rate=30, frame_rate=120):
+            for _ in range(frame.steps):
+                world.update()
+            world.draw(screen, frame.alpha)
+
+    Unlike main_loop(), the events are passed on to the caller. The loop ends
+    after a frame with a QUIT event.
+
+    Args:
+        screen (pygame.Surface): The display surface.
+        step_rate (int): Simulation steps per second.
+        frame_rate (int): The frame rate to cap the loop at, 0 for no cap.
+        max_steps (int): The most steps to run in one frame. If the
+            simulation can't keep up, it slows down rather than spending ever
+            more time catching up.
+        profiler (FrameProfiler, optional): Times the phases of every frame,
+            see main_loop().
+        overlay (bool): Draw the profiler's frame times on the screen.
+    """
+    running = True
+    clock = pygame.time.Clock()
+    step = 1000 / step_rate
+    accumulator = 0.0
+
+    if overlay and profiler is None:
+        profiler = FrameProfiler()
+
+    while running:
+        if profiler is not None:
+            profiler.begin()
+
+        screen.fill((0, 0, 139))  # Clear screen with deep blue
+
+        events = pygame.event.get()
+        running = not any(event.type == pygame.QUIT for event in events)
+
+        if profiler is not None:
+            profiler.mark("events")
+
+        steps = int(accumulator // step)
+        accumulator -= steps * step
+        if steps > max_steps:
+            # Drop the time the simulation can't catch up on
+            steps = max_steps
+
+        yield Frame(steps, accumulator / step, step / 1000, events)
+
+        if profiler is not None:
+            profiler.mark("update")
+            if overlay:
+                profiler.draw(screen)
+                profiler.mark("overlay")
+
+        pygame.display.flip()
+
+        if profiler is not None:
+            profiler.mark("flip")
+
+        accumulator += clock.tick(frame_rate)
+
+        if profiler is not None:
+            profiler.mark("tick")
+            profiler.end()
@@ -0,0 +1,133 @@
+"""Recycling pools for short-lived objects like bullets and explosions.
+
+Shooting games create and throw away a bullet or an explosion sprite every
+few frames, and each one costs an allocation, an ``__init__`` and later a
+garbage collection. A :class:`SpritePool` keeps the instances that are done
+with and hands them out again, calling their ``reset()`` with the arguments
+a new one would have been constructed with::
+
+    class Bullet(PooledSprite):
+        def __init__(self, pos, speed):
+            super().__init__()
+            self.reset(pos, speed)
+
+        def reset(self, pos, speed):
+            self.rect = self.image.get_rect(midbottom=pos)
+            self.speed = speed
+
+    bullets = SpritePool(Bullet)
+
+    bullets.get(player.rect.midtop, -10, groups=(shots, all_sprites))
+    ...
+    bullet.kill()  # removes it from its groups and returns it to the pool
+
+A :class:`PooledSprite` goes back to its pool when it is killed, which is
+also what ``groupcollide()`` and ``spritecollide()`` do to sprites when
+told to kill them. ``Group.empty()`` doesn't kill its sprites, so sprites
+removed that way are simply not reused. Objects that aren't sprites are
+given back with :meth:`SpritePool.release`.
+
+Whatever still holds a reference to an object after it is released sees it
+change when it is handed out again, so keep no references to dead objects.
+
+The counters show whether a game has reached a steady state: once the pool
+holds as many objects as are ever alive at once, ``created`` stops going up.
+"""
+
+import pygame
+
+
+class SpritePool(object):
+    """A free list of objects made by a factory and recycled with their reset() method.
+
+    Args:
+        factory (callable): Makes a new object, usually a class. It is
+            called with the arguments given to get(), and the objects it
+            makes must have a ``reset()`` method that takes the same ones.
+
+    Attributes:
+        created (int): The number of objects the factory made.
+        reused (int): The number of times get() handed out a free object.
+        released (int): The number of objects given back.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self._free = []
+
+    def get(self, *args, groups=(), **kwargs):
+        """Returns a free object reset with the arguments, or a new one made
+        with them, and adds it to the sprite groups given"""
+
+        if self._free:
+            obj = self._free.pop()
+            obj._pool_free = False
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            obj.pool = self
+            obj._pool_free = False
+            self.created += 1
+
+        if groups:
+            obj.add(*groups)
+
+        return obj
+
+    def release(self, obj):
+        """Gives an object back to the pool. Releasing it again before it is
+        handed out does nothing."""
+
+        if getattr(obj, "_pool_free", False):
+            return
+
+        obj._pool_free = True
+        self._free.append(obj)
+        self.released += 1
+
+    def prefill(self, count, *args, **kwargs):
+        """Makes objects until count of them are free, so the game doesn't have to later"""
+
+        while len(self._free) < count:
+            obj = self.factory(*args, **kwargs)
+            obj.pool = self
+            self.created += 1
+            self.release(obj)
+
+    def clear(self):
+        """Forgets the free objects"""
+        self._free.clear()
+
+    @property
+    def free(self):
+        """The number of objects waiting to be handed out"""
+        return len(self._free)
+
+    @property
+    def in_use(self):
+        """The number of objects handed out and not given back"""
+        return self.created + self.reused - self.released
+
+    def __str__(self) -> str:
+        name = getattr(self.factory, "__name__", "object")
+        return (f"SpritePool({name}: {self.in_use} in use, {self.free} free, "
+                f"{self.created} created, {self.reused} reused)")
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """A Sprite that goes back to the pool it came from when it is killed.
+
+    Subclasses should give it a ``reset()`` method that takes the same
+    arguments as ``__init__()`` and sets everything up for a new life.
+    """
+
+    pool = None
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
@@ -0,0 +1,176 @@
+"""Per-phase frame timing.
+
+A :class:`FrameProfiler` splits each frame into phases, times them with
+``time.perf_counter`` and keeps the last few hundred frames, so a game can
+show where its frame budget goes while it runs and save the numbers for
+later. :func:`jtlgames.loop.main_loop` times its phases when given a
+profiler; a game with its own loop marks the end of each phase itself::
+
+    profiler = FrameProfiler()
+
+    while running:
+        profiler.begin()
+        handle_events()
+        profiler.mark("events")
+        update_and_draw()
+        profiler.mark("update")
+        profiler.draw(screen)
+        profiler.mark("overlay")
+        pygame.display.flip()
+        profiler.mark("flip")
+        clock.tick(60)
+        profiler.mark("tick")
+        profiler.end()
+
+    profiler.export("frames.csv")
+
+A game that spends most of the frame in "tick" has time to spare; one that
+spends it in "update" is CPU bound, and one that spends it in "flip" is
+waiting for the display.
+"""
+
+import csv
+import json
+import math
+from collections import deque
+from pathlib import Path
+from time import perf_counter
+
+import pygame
+
+from . import text
+
+PHASES = ("events", "update", "overlay", "flip", "tick")
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler(object):
+    """Rolling per-phase frame times, in milliseconds.
+
+    Args:
+        phases (tuple): The phase names, in the order they happen in a frame.
+        window (int): How many of the most recent frames to keep.
+        refresh (int): How many frames the overlay shows the same numbers for.
+
+    Attributes:
+        frames (int): The number of frames profiled, including ones that
+            dropped out of the window.
+    """
+
+    def __init__(self, phases=PHASES, window=600, refresh=15):
+        self.phases = tuple(phases)
+        self.window = window
+        self.refresh = refresh
+        self.frames = 0
+        # One row of phase times, then the frame total, per frame
+        self._rows = deque(maxlen=window)
+        self._current = {}
+        self._last = None
+        self._overlay = None
+
+    def begin(self):
+        """Starts timing a frame"""
+
+        self._current = {}
+        self._last = perf_counter()
+
+    def mark(self, phase):
+        """Ends a phase: the time since the last mark (or begin) is added to it"""
+
+        now = perf_counter()
+        self._current[phase] = self._current.get(phase, 0.0) + (now - self._last) * 1000
+        self._last = now
+
+    def end(self):
+        """Finishes the frame and adds it to the window"""
+
+        row = [self._current.get(phase, 0.0) for phase in self.phases]
+        row.append(sum(row))
+        self._rows.append(row)
+        self.frames += 1
+
+    def times(self, phase="total"):
+        """Returns the times of a phase, or of the whole frame, over the window"""
+
+        column = len(self.phases) if phase == "total" else self.phases.index(phase)
+        return [row[column] for row in self._rows]
+
+    def percentile(self, phase, q):
+        """Returns the q-th percentile (nearest rank) of a phase's times over the window"""
+
+        times = sorted(self.times(phase))
+        if not times:
+            return 0.0
+        return times[max(0, math.ceil(q / 100 * len(times)) - 1)]
+
+    def percentiles(self, phase="total"):
+        """Returns {50: p50, 95: p95, 99: p99} for a phase"""
+        return {q: self.percentile(phase, q) for q in PERCENTILES}
+
+    def summary(self):
+        """Returns a dict of phase -> {"p50", "p95", "p99", "share"}, where share
+        is the phase's fraction of the total frame time"""
+
+        total = sum(self.times()) or 1.0
+        result = {}
+        for phase in self.phases + ("total",):
+            stats = {f"p{q}": t for q, t in self.percentiles(phase).items()}
+            stats["share"] = sum(self.times(phase)) / total
+            result[phase] = stats
+        return result
+
+    def lines(self):
+        """Returns the summary as text, one line per phase"""
+
+        return [f"{phase:>7} {s['p50']:6.2f} {s['p95']:6.2f} {s['p99']:6.2f} {s['share']:4.0%}"
+                for phase, s in self.summary().items()]
+
+    def draw(self, surface, pos=(5, 5), color=(255, 255, 0)):
+        """Draws the summary on a surface, e.g. the screen before it is flipped"""
+
+        if self._overlay is None or self.frames % self.refresh == 0:
+            font = text.font(None, 18)
+            lines = [f"{'ms':>7} {'p50':>6} {'p95':>6} {'p99':>6} share"] + self.lines()
+            height = font.get_linesize()
+            self._overlay = pygame.Surface((max(font.size(line)[0] for line in lines) + 6,
+                                            height * len(lines) + 4), pygame.SRCALPHA)
+            self._overlay.fill((0, 0, 0, 160))
+            for i, line in enumerate(lines):
+                self._overlay.blit(font.render(line, True, color), (3, 2 + i * height))
+
+        return surface.blit(self._overlay, pos)
+
+    def export(self, filename):
+        """Writes the frames in the window to a .csv file, or to a .json file
+        along with the summary"""
+
+        path = Path(filename)
+        columns = self.phases + ("total",)
+        first = self.frames - len(self._rows)
+
+        if path.suffix == ".json":
+            data = {
+                "phases": list(columns),
+                "summary": self.summary(),
+                "frames": [[first + i] + row for i, row in enumerate(self._rows)],
+            }
+            path.write_text(json.dumps(data, indent=2))
+        else:
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(("frame",) + columns)
+                for i, row in enumerate(self._rows):
+                    writer.writerow([first + i] + [f"{t:.4f}" for t in row])
+
+        return path
+
+    def clear(self):
+        self._rows.clear()
+        self.frames = 0
+        self._overlay = None
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines())
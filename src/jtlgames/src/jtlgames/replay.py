@@ -0,0 +1,385 @@
+"""Recording a game session's input, and playing it back headless.
+
+A :class:`Recorder` runs a game for real, in a window, and writes down the
+keys held on every frame and the seed of the random module. The game runs
+on the same virtual clock a :class:`~jtlgames.sim.Simulation` uses, paced
+to the wall clock, so when the :class:`Replay` is fed back to a Simulation
+the game sees the same keys at the same times and plays out the same way,
+as fast as the CPU allows::
+
+    jtlreplay record session.jtlr games/Space_Invaders_Classic/main.py
+    jtlreplay play session.jtlr games/Space_Invaders_Classic/main.py --runs 5
+
+A replay played against a changed version of the game is a benchmark of
+exactly the same session. The recorder also keeps a CRC of the last frame
+it drew, and playback reports whether it drew the same one.
+
+From Python::
+
+    with Recorder() as recorder:
+        main()
+    recorder.replay.save("session.jtlr")
+
+    sim = Replay.load("session.jtlr").simulation()
+    sim.run(main)
+
+Only the keyboard and QUIT events are recorded; mouse input is not. Input
+is recorded a frame at a time, so a key pressed and released within a frame
+is held for that frame, and a key pressed again on the next frame stays held.
+
+The file format is a header of struct-packed fields, then the game's
+arguments, a table of the keys used and the held keys as runs of frames
+with the same keys, all in LEB128 varints. Key changes happen every few
+frames at most, so a session is a few bytes a second.
+"""
+
+import argparse
+import os
+import random
+import struct
+import sys
+import time as _time
+from pathlib import Path
+
+import pygame
+
+from .sim import DUMMY_DRIVERS, Simulation
+
+MAGIC = b"JTLR"
+VERSION = 1
+# magic, version, seed, fps (0 for none), frames, frame checked (0 for none), its CRC
+HEADER = struct.Struct("<4sBqHIII")
+
+# Events other than key presses that are recorded. They are replayed without attributes.
+RECORDED_EVENTS = (pygame.QUIT,)
+
+# The real clock, which a Simulation patches
+_perf_counter = _time.perf_counter
+_sleep = _time.sleep
+
+
+def _write_varint(out, n):
+    while n > 0x7F:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(data, pos):
+    n = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Truncated replay")
+        byte = data[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+class Replay(object):
+    """A recorded session: the seed, and the keys held and events on every frame.
+
+    A Replay is an input source for a :class:`~jtlgames.sim.Simulation`, like
+    an :class:`~jtlgames.sim.InputScript`.
+
+    Args:
+        seed (int): The seed of the random module.
+        fps (int, optional): The fixed frame rate the session ran at, if any.
+        argv (list): The arguments the game script was given.
+
+    Attributes:
+        frames (list): The keys held on each frame, as frozensets; frames[0] is frame 1.
+        check (tuple): (frame, CRC) of a frame's display, to check playback
+            against, or None.
+    """
+
+    def __init__(self, seed=0, fps=None, argv=()):
+        self.seed = seed
+        self.fps = fps
+        self.argv = list(argv)
+        self.frames = []
+        self.check = None
+        # frame -> event types
+        self._events = {}
+
+    def add_frame(self, held, events=()):
+        """Adds the next frame's held keys and event types"""
+
+        self.frames.append(frozenset(held))
+        if events:
+            self._events[len(self.frames)] = list(events)
+
+    def keys(self, frame):
+        return self.frames[frame - 1] if 0 < frame <= len(self.frames) else ()
+
+    def events(self, frame):
+        return [pygame.event.Event(type) for type in self._events.get(frame, ())]
+
+    def simulation(self, record=True, on_frame=None):
+        """Returns a Simulation that plays the replay back, for the replay's length"""
+        return Simulation(self.seed, len(self.frames), self, self.fps, record, on_frame)
+
+    def play(self, path, argv=None, record=True):
+        """Plays the replay back on a game script. Returns the finished Simulation."""
+        return self.simulation(record).run_script(path, self.argv if argv is None else argv)
+
+    def matches(self, sim):
+        """True if a recorded playback drew the frame the replay was checked
+        against, False if it drew a different one and None if there is
+        nothing to compare"""
+
+        if self.check is None or not sim.frame_hashes:
+            return None
+        frame, crc = self.check
+        return len(sim.frame_hashes) >= frame and sim.frame_hashes[frame - 1] == crc
+
+    def to_bytes(self):
+        keys = sorted(set().union(*self.frames))
+        bits = {key: 1 << i for i, key in enumerate(keys)}
+        check_frame, check_crc = self.check or (0, 0)
+
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, self.fps or 0, len(self.frames),
+                                    check_frame, check_crc))
+
+        _write_varint(out, len(self.argv))
+        for arg in self.argv:
+            data = arg.encode("utf-8")
+            _write_varint(out, len(data))
+            out += data
+
+        _write_varint(out, len(keys))
+        for key in keys:
+            _write_varint(out, key)
+
+        runs = []
+        for held in self.frames:
+            mask = sum(bits[key] for key in held)
+            if runs and runs[-1][1] == mask:
+                runs[-1][0] += 1
+            else:
+                runs.append([1, mask])
+        _write_varint(out, len(runs))
+        for length, mask in runs:
+            _write_varint(out, length)
+            _write_varint(out, mask)
+
+        events = [(frame, type) for frame, types in sorted(self._events.items()) for type in types]
+        _write_varint(out, len(events))
+        for frame, type in events:
+            _write_varint(out, frame)
+            _write_varint(out, type)
+
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Reads a replay written by to_bytes(). Raises ValueError if it isn't one."""
+
+        if len(data) < HEADER.size or data[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a jtlgames replay")
+        magic, version, seed, fps, count, check_frame, check_crc = HEADER.unpack_from(data)
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+
+        pos = HEADER.size
+        argc, pos = _read_varint(data, pos)
+        argv = []
+        for _ in range(argc):
+            length, pos = _read_varint(data, pos)
+            argv.append(data[pos:pos + length].decode("utf-8"))
+            pos += length
+
+        replay = cls(seed, fps or None, argv)
+        if check_frame:
+            replay.check = (check_frame, check_crc)
+
+        n, pos = _read_varint(data, pos)
+        keys = []
+        for _ in range(n):
+            key, pos = _read_varint(data, pos)
+            keys.append(key)
+
+        n, pos = _read_varint(data, pos)
+        for _ in range(n):
+            length, pos = _read_varint(data, pos)
+            mask, pos = _read_varint(data, pos)
+            held = frozenset(key for i, key in enumerate(keys) if mask >> i & 1)
+            replay.frames.extend([held] * length)
+
+        n, pos = _read_varint(data, pos)
+        for _ in range(n):
+            frame, pos = _read_varint(data, pos)
+            type, pos = _read_varint(data, pos)
+            replay._events.setdefault(frame, []).append(type)
+
+        if len(replay.frames) != count:
+            raise ValueError("Truncated replay")
+
+        return replay
+
+    def save(self, filename):
+        path = Path(filename)
+        path.write_bytes(self.to_bytes())
+        return path
+
+    @classmethod
+    def load(cls, filename):
+        return cls.from_bytes(Path(filename).read_bytes())
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __str__(self) -> str:
+        seconds = len(self.frames) / (self.fps or 60)
+        return f"Replay(seed={self.seed}, {len(self.frames)} frames, about {seconds:.0f}s)"
+
+
+class Recorder(Simulation):
+    """Runs a game with the real display and keyboard, recording its input.
+
+    The game's clock is the simulation's virtual one, held back to real time,
+    so playing the replay back gives the game the same times it had.
+
+    Args:
+        seed (int, optional): Seed for the random module. Defaults to a random seed.
+        fps (int, optional): A fixed frame rate, as for Simulation.
+        record (bool): Keep frame CRCs, and save the last one in the replay
+            to check playback against.
+        realtime (bool): Pace the game to the wall clock. Without it the game
+            runs as fast as it can, which is only useful with scripted input.
+        argv (list): The game script's arguments, saved in the replay.
+
+    Attributes:
+        replay (Replay): The session so far.
+    """
+
+    def __init__(self, seed=None, fps=None, record=True, realtime=True, argv=()):
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 31)
+        super().__init__(seed, fps=fps, record=record)
+        self.realtime = realtime
+        self.argv = list(argv)
+        self.replay = Replay(seed, fps, argv)
+        self._down = set()
+        self._started = 0.0
+
+    def _advance(self, ms):
+        super()._advance(ms)
+        if self.realtime:
+            ahead = self._started + self._time / 1000 - _perf_counter()
+            if ahead > 0:
+                _sleep(ahead)
+
+    def _flip(self):
+        self._real_flip()
+        self._end_frame()
+
+    def _update(self, *args):
+        self._real_update(*args)
+        self._end_frame()
+
+    def _read_input(self, frame):
+        tapped = set()
+        events = []
+
+        # The first frame's input is read before the game has set up the display
+        if pygame.display.get_init():
+            for e in self._real_get():
+                if e.type == pygame.KEYDOWN:
+                    self._down.add(e.key)
+                    tapped.add(e.key)
+                elif e.type == pygame.KEYUP:
+                    self._down.discard(e.key)
+                elif e.type in RECORDED_EVENTS:
+                    events.append(pygame.event.Event(e.type))
+
+        # A key pressed and released within a frame counts as held for that frame
+        held = self._down | tapped
+        self.replay.add_frame(held, [e.type for e in events])
+        return held, events
+
+    def __enter__(self):
+        self._real_flip = pygame.display.flip
+        self._real_update = pygame.display.update
+        self._real_get = pygame.event.get
+        self.replay = Replay(self.seed, self.fps, self.argv)
+        self._down = set()
+
+        # Use the real window and sound, unless the user asked for the dummy drivers
+        for name, value in DUMMY_DRIVERS.items():
+            if os.environ.get(name) == value:
+                del os.environ[name]
+
+        self._started = _perf_counter()
+        return super().__enter__()
+
+    def __exit__(self, exc_type, exc, tb):
+        os.environ.update(DUMMY_DRIVERS)
+        if self.frame_hashes:
+            self.replay.check = (len(self.frame_hashes), self.frame_hashes[-1])
+        return super().__exit__(exc_type, exc, tb)
+
+
+def parse_args(args):
+    """Parse command line parameters
+
+    Args:
+      args (List[str]): command line parameters as list of strings
+
+    Returns:
+      :obj:`argparse.Namespace`: command line parameters namespace
+    """
+    parser = argparse.ArgumentParser(description="Record a game session's input, or play one back headless")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="Play a game and record the session")
+    record.add_argument("replay", help="The file to save the session to", type=str)
+    record.add_argument("script", help="The game's main script", type=str)
+    record.add_argument("-s", "--seed", help="Seed for the random module", type=int, default=None)
+    record.add_argument("--fps", help="Fixed frame rate for the game's clock", type=int, default=None)
+
+    play = commands.add_parser("play", help="Play a recorded session back headless")
+    play.add_argument("replay", help="The recorded session", type=str)
+    play.add_argument("script", help="The game's main script", type=str)
+    play.add_argument("-n", "--runs", help="Number of times to play it", type=int, default=1)
+    return parser.parse_args(args)
+
+
+def main(args):
+    # Anything after -- is for the game. Playback defaults to the recorded arguments.
+    split = args.index("--") if "--" in args else len(args)
+    script_args = args[split + 1:] if "--" in args else None
+    args = parse_args(args[:split])
+
+    if args.command == "record":
+        recorder = Recorder(args.seed, args.fps, argv=script_args or ())
+        try:
+            recorder.run_script(args.script, script_args or ())
+        except KeyboardInterrupt:
+            # Ctrl+C is a fine way to stop recording
+            pass
+        finally:
+            path = recorder.replay.save(args.replay)
+            print(f"{recorder.replay} saved to {path} ({path.stat().st_size} bytes)")
+        return
+
+    replay = Replay.load(args.replay)
+    print(replay)
+    for _ in range(args.runs):
+        start = _perf_counter()
+        sim = replay.play(args.script, script_args)
+        elapsed = _perf_counter() - start
+        check = {True: "same", False: "DIFFERENT", None: "unchecked"}[replay.matches(sim)]
+        print(f"{sim} wall={elapsed:.2f}s ({sim.frame / elapsed if elapsed else 0:.0f} frames/s) "
+              f"last frame {check}")
+
+
+def run():
+    """Calls :func:`main` passing the CLI arguments extracted from :obj:`sys.argv`"""
+    main(sys.argv[1:])
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,95 @@
+"""Cache of rotated and scaled copies of an image.
+
+``pygame.transform.rotozoom`` resamples the whole image every time it is
+called, which adds up when a sprite turns a little every frame. A
+:class:`RotationCache` rounds the angle to a fixed step, renders each
+(angle, scale) variant the first time it is asked for, and after that
+returns the same surface::
+
+    ship_images = RotationCache(ship_image, step=1)
+
+    def update(self):
+        self.image = ship_images.get(self.angle)
+
+With ``step=1`` and a sprite that turns in whole degrees there are at most 360
+variants per scale. Angles are wrapped to [0, 360), so -30 gives the image
+rotozoom renders for 330, which can differ from rotozoom(-30) by rounding.
+"""
+
+import pygame
+
+
+class RotationCache(object):
+    """Lazily rendered, memoized rotozoom() variants of one image.
+
+    Attributes:
+        image (pygame.Surface): The unrotated image.
+        step (float): The angle quantum, in degrees. Angles are rounded to a
+            multiple of it.
+        scale (float): The scale used when get() is not given one.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to render a variant.
+        memory (int): Bytes of pixels held by the cached variants.
+    """
+
+    def __init__(self, image, step=1, scale=1):
+        if step <= 0:
+            raise ValueError("step must be greater than 0")
+
+        self.image = image
+        self.step = step
+        self.scale = scale
+        self.hits = 0
+        self.misses = 0
+        self.memory = 0
+        self._variants = {}
+
+    def quantize(self, angle):
+        """Rounds an angle to the nearest multiple of step, in [0, 360)"""
+        return (round(angle / self.step) * self.step) % 360
+
+    def get(self, angle, scale=None):
+        """Returns the image rotated counterclockwise by angle degrees and scaled by scale"""
+
+        if scale is None:
+            scale = self.scale
+
+        key = (self.quantize(angle), scale)
+        image = self._variants.get(key)
+
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = self._variants[key] = pygame.transform.rotozoom(self.image, key[0], scale)
+        self.memory += image.get_pitch() * image.get_height()
+
+        return image
+
+    def warm(self, scale=None):
+        """Renders every angle for a scale up front, e.g. while a level loads"""
+
+        angle = 0
+        while angle < 360:
+            self.get(angle, scale)
+            angle += self.step
+
+    def clear(self):
+        """Drops every cached variant and resets the statistics"""
+
+        self._variants.clear()
+        self.hits = self.misses = self.memory = 0
+
+    @property
+    def hit_rate(self):
+        """The fraction of lookups answered from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self):
+        return len(self._variants)
+
+    def __str__(self) -> str:
+        return (f"RotationCache({len(self)} variants, step={self.step}, "
+                f"hit rate {self.hit_rate:.1%}, {self.memory / 1024:.0f} KiB)")
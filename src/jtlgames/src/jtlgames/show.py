@@ -5,6 +5,7 @@
 import pygame
 from pathlib import Path
 from .spritesheet import SpriteSheet
+from . import text as text_cache
 
 
 class SpriteShow:
@@ -41,15 +42,13 @@ class SpriteShow:
 
     def draw_text(self, text, index):
         x, y = self.text_pos(index)
-        font = pygame.font.Font(None, 20)
-        text = font.render(text, True, (255, 255, 255))
+        text = text_cache.render(text_cache.font(None, 20), text, (255, 255, 255))
         self.screen.blit(text, (x, y))
 
     def show(self):
         self.screen.fill((0, 0, 0))
         for i in range(self.ss.num_sprites):
-            sprite = self.ss.image_at(i, colorkey=-1)
-            sprite = pygame.transform.scale(sprite, (self.ss.cellsize[0] * 2, self.ss.cellsize[1] * 2))
+            sprite = self.ss.image_at(i, colorkey=-1, scale=2)
             self.draw_sprite(sprite, i)
             self.draw_text(str(i), i)
 
@@ -0,0 +1,455 @@
+"""Headless, deterministic simulation of a game.
+
+A :class:`Simulation` runs an unmodified game with no window, no sound device
+and no real time. While it is active it stands in for the parts of pygame a
+game loop talks to:
+
+* the clock: ``pygame.time.Clock().tick()``, ``get_ticks()``, ``wait()``,
+  ``delay()`` and ``time.sleep()`` advance a virtual clock and return at once;
+* the keyboard: ``pygame.key.get_pressed()`` and the KEYDOWN/KEYUP events come
+  from an input script instead of the keyboard;
+* the display: each ``pygame.display.flip()`` or ``update()`` ends a frame.
+
+The random module is seeded, so a game run twice with the same seed and
+input plays out the same way, as fast as the CPU allows. Run a game's main
+function::
+
+    sim = Simulation(seed=3, frames=5000, inputs=RandomInput([K_LEFT, K_RIGHT, K_SPACE]))
+    sim.run(main)
+    print(sim.frame, sim.ticks, sim.reason)
+
+or a game script, from the command line::
+
+    jtlsim games/Mars-lander/main.py --frames 5000 --runs 100 --random-keys
+    jtlsim lessons/07_Projects/04_Asteroids/main.py --random-keys -- --numpy --asteroids 300
+"""
+
+import argparse
+import logging
+import os
+import random
+import runpy
+import sys
+import time as _time
+import zlib
+from pathlib import Path
+
+# The dummy drivers have to be chosen before pygame's display and mixer start.
+# DUMMY_DRIVERS is what this module set, for code that wants the real ones back.
+DUMMY_DRIVERS = {name: "dummy" for name in ("SDL_VIDEODRIVER", "SDL_AUDIODRIVER") if name not in os.environ}
+os.environ.update(DUMMY_DRIVERS)
+
+import pygame  # noqa: E402  after the drivers above are chosen
+
+_logger = logging.getLogger(__name__)
+
+
+class StopSimulation(Exception):
+    """Raised inside the game to end the simulation, when it has run all its frames"""
+
+
+class KeyState(object):
+    """Stands in for the sequence pygame.key.get_pressed() returns"""
+
+    def __init__(self, held):
+        self.held = frozenset(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+    def __len__(self):
+        return 512
+
+    def __iter__(self):
+        return (k in self.held for k in range(len(self)))
+
+
+class InputScript(object):
+    """Scripted input: which keys are held on which frames, and extra events.
+
+    Frames count from 1, the first frame the game draws.
+    """
+
+    def __init__(self):
+        self._held = {}
+        self._events = {}
+
+    def hold(self, key, start, end=None):
+        """Holds a key down from frame start up to, not including, frame end (one frame if omitted)"""
+
+        for frame in range(start, end if end is not None else start + 1):
+            self._held.setdefault(frame, set()).add(key)
+        return self
+
+    def press(self, key, frame):
+        """Taps a key on one frame"""
+        return self.hold(key, frame)
+
+    def event(self, frame, type, **attrs):
+        """Posts a pygame event on a frame"""
+
+        self._events.setdefault(frame, []).append(pygame.event.Event(type, **attrs))
+        return self
+
+    def keys(self, frame):
+        return self._held.get(frame, ())
+
+    def events(self, frame):
+        return self._events.get(frame, ())
+
+
+class RandomInput(object):
+    """Random keyboard mashing, for soak tests and balancing runs.
+
+    Args:
+        keys (list): The keys that may be pressed.
+        seed (int): Seed for the key choices. The same seed gives the same input.
+        change_every (int): How many frames a combination of keys is held.
+        density (float): The chance of each key being held.
+    """
+
+    def __init__(self, keys, seed=0, change_every=10, density=0.3):
+        self.choices = list(keys)
+        self.change_every = change_every
+        self.density = density
+        self._random = random.Random(seed)
+        self._held = set()
+
+    def keys(self, frame):
+        if frame % self.change_every == 1 or self.change_every == 1:
+            self._held = {k for k in self.choices if self._random.random() < self.density}
+        return self._held
+
+    def events(self, frame):
+        return ()
+
+
+class Simulation(object):
+    """Runs a game headless with a virtual clock and scripted input.
+
+    Args:
+        seed (int): Seed for the random module.
+        frames (int): The number of frames to run, or None to run until the game ends.
+        inputs (InputScript, optional): Where key presses come from. Defaults to no input.
+        fps (int, optional): A fixed frame rate for the virtual clock. By default
+            each Clock.tick(framerate) advances the clock by 1000/framerate ms, so
+            the game sees the timing it asked for; frames without a tick advance
+            it by 1000/60 ms.
+        record (bool): Keep a CRC of the display surface for every frame, in frame_hashes.
+        on_frame (callable, optional): Called with the simulation at the end of every frame.
+
+    Attributes:
+        frame (int): Frames run so far.
+        ticks (int): Virtual milliseconds since the simulation started.
+        reason (str): Why the last run ended: "frames", "exit", "return" or "input".
+        frame_hashes (list): CRCs of the display surface, if record is set.
+    """
+
+    def __init__(self, seed=0, frames=None, inputs=None, fps=None, record=False, on_frame=None):
+        self.seed = seed
+        self.frames = frames
+        self.inputs = inputs if inputs is not None else InputScript()
+        self.fps = fps
+        self.record = record
+        self.on_frame = on_frame
+        self.frame = 0
+        self.ticks = 0
+        self.reason = None
+        self.frame_hashes = []
+        self._time = 0.0
+        self._ticked = False
+        self._held = frozenset()
+        self._queue = []
+        self._patches = []
+
+    # Virtual clock
+
+    def _advance(self, ms):
+        self._time += ms
+        self.ticks = int(self._time)
+
+    def _get_ticks(self):
+        return self.ticks
+
+    def _wait(self, ms):
+        self._advance(ms)
+        return int(ms)
+
+    def _sleep(self, seconds):
+        self._advance(seconds * 1000)
+
+    def _clock_class(self):
+        sim = self
+
+        class Clock(object):
+            """pygame.time.Clock on the simulation's virtual clock"""
+
+            def __init__(self):
+                self._last = sim.ticks
+                self._rawtime = 0
+
+            def tick(self, framerate=0):
+                rate = sim.fps or framerate or 60
+                sim._advance(1000 / rate)
+                sim._ticked = True
+                self._rawtime = sim.ticks - self._last
+                self._last = sim.ticks
+                return self._rawtime
+
+            tick_busy_loop = tick
+
+            def get_time(self):
+                return self._rawtime
+
+            def get_rawtime(self):
+                return self._rawtime
+
+            def get_fps(self):
+                return sim.fps or (1000 / self._rawtime if self._rawtime else 0.0)
+
+        return Clock
+
+    # Frames and input
+
+    def _start_frame(self):
+        """Moves to the next frame, queueing its key changes and events"""
+
+        if self.frames is not None and self.frame >= self.frames:
+            self.reason = "frames"
+            raise StopSimulation()
+
+        self.frame += 1
+        held, events = self._read_input(self.frame)
+        held = frozenset(held)
+
+        for key in sorted(held - self._held):
+            self._queue.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+        for key in sorted(self._held - held):
+            self._queue.append(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0))
+
+        self._held = held
+        self._queue.extend(events)
+
+    def _read_input(self, frame):
+        """Returns the keys held on a frame and the other events that happen on it"""
+        return self.inputs.keys(frame), self.inputs.events(frame)
+
+    def _end_frame(self):
+        """Called from display.flip() and display.update()"""
+
+        # A game that doesn't tick a Clock still gets a fixed timestep. The first
+        # frame is skipped, as a game that does usually ticks after the flip.
+        if self.frame > 1 and not self._ticked:
+            self._advance(1000 / (self.fps or 60))
+        self._ticked = False
+
+        if self.record:
+            screen = pygame.display.get_surface()
+            self.frame_hashes.append(zlib.crc32(pygame.image.tobytes(screen, "RGB")) if screen else 0)
+
+        if self.on_frame is not None:
+            self.on_frame(self)
+
+        self._start_frame()
+
+    def _flip(self):
+        self._end_frame()
+
+    def _update(self, *args):
+        self._end_frame()
+
+    def _get_pressed(self):
+        return KeyState(self._held)
+
+    def _event_get(self, eventtype=None, pump=True, exclude=None):
+        if eventtype is None and exclude is None:
+            events, self._queue = self._queue, []
+            return events
+
+        def wanted(e, types):
+            return e.type in (types if isinstance(types, (list, tuple)) else (types,))
+
+        events = [e for e in self._queue
+                  if (eventtype is None or wanted(e, eventtype)) and (exclude is None or not wanted(e, exclude))]
+        self._queue = [e for e in self._queue if e not in events]
+        return events
+
+    def _event_wait(self, timeout=0):
+        # Nothing happens while a game waits for input, so skip ahead a frame at a time until it comes
+        while not self._queue:
+            if self.inputs_exhausted():
+                self.reason = "input"
+                raise StopSimulation()
+            self._end_frame()
+        return self._queue.pop(0)
+
+    def _event_poll(self):
+        return self._queue.pop(0) if self._queue else pygame.event.Event(pygame.NOEVENT)
+
+    def _event_post(self, event):
+        self._queue.append(event)
+        return True
+
+    def _event_clear(self, eventtype=None, pump=True):
+        self._event_get(eventtype)
+
+    def inputs_exhausted(self):
+        """True if a scripted input has no more events or key presses to come"""
+
+        if not isinstance(self.inputs, InputScript):
+            return False
+        last = max(list(self.inputs._held) + list(self.inputs._events) + [0])
+        return self.frame > last
+
+    # Running
+
+    def _patch(self, obj, name, value):
+        self._patches.append((obj, name, getattr(obj, name)))
+        setattr(obj, name, value)
+
+    def __enter__(self):
+        random.seed(self.seed)
+        self.frame = 0
+        self.ticks = 0
+        self._time = 0.0
+        self._held = frozenset()
+        self._queue = []
+        self.frame_hashes = []
+        self.reason = None
+
+        self._patch(pygame.time, "Clock", self._clock_class())
+        self._patch(pygame.time, "get_ticks", self._get_ticks)
+        self._patch(pygame.time, "wait", self._wait)
+        self._patch(pygame.time, "delay", self._wait)
+        self._patch(_time, "sleep", self._sleep)
+        self._patch(pygame.display, "flip", self._flip)
+        self._patch(pygame.display, "update", self._update)
+        self._patch(pygame.key, "get_pressed", self._get_pressed)
+        self._patch(pygame.event, "get", self._event_get)
+        self._patch(pygame.event, "wait", self._event_wait)
+        self._patch(pygame.event, "poll", self._event_poll)
+        self._patch(pygame.event, "post", self._event_post)
+        self._patch(pygame.event, "clear", self._event_clear)
+        self._patch(pygame.event, "pump", lambda: None)
+
+        self._start_frame()
+
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        while self._patches:
+            obj, name, value = self._patches.pop()
+            setattr(obj, name, value)
+
+        if exc_type is StopSimulation:
+            return True
+        if exc_type is SystemExit:
+            self.reason = "exit"
+            return True
+
+        return False
+
+    def run(self, target, *args, **kwargs):
+        """Runs a game function, or coroutine function, until it returns or the frames run out.
+
+        Returns:
+            Simulation: self, with frame, ticks and reason set.
+        """
+
+        with self:
+            result = target(*args, **kwargs)
+
+            if hasattr(result, "send"):  # A coroutine, like an asyncio main loop
+                try:
+                    while True:
+                        result.send(None)
+                except StopIteration:
+                    pass
+                finally:
+                    result.close()
+
+            self.reason = "return"
+
+        return self
+
+    def run_script(self, path, argv=()):
+        """Runs a game script as __main__, from its own directory, like `python main.py argv...` would.
+
+        Modules the script imports from its directory are forgotten afterwards,
+        so each run starts from freshly imported, freshly seeded state.
+        """
+
+        from . import assets, text
+
+        path = Path(path).resolve()
+        cwd = os.getcwd()
+        saved_argv = sys.argv
+        sys.argv = [str(path)] + list(argv)
+        modules = set(sys.modules)
+        sys.path.insert(0, str(path.parent))
+        os.chdir(path.parent)
+        assets.registry.clear()
+
+        try:
+            return self.run(runpy.run_path, str(path), run_name="__main__")
+        finally:
+            os.chdir(cwd)
+            sys.argv = saved_argv
+            sys.path.remove(str(path.parent))
+            for name in set(sys.modules) - modules:
+                module_file = getattr(sys.modules[name], "__file__", None) or ""
+                if module_file.startswith(str(path.parent)):
+                    del sys.modules[name]
+            pygame.quit()
+            text.clear()
+
+    def __str__(self) -> str:
+        last = f" {self.frame_hashes[-1]:08x}" if self.frame_hashes else ""
+        return f"seed={self.seed} frames={self.frame} ticks={self.ticks} reason={self.reason}{last}"
+
+
+def parse_args(args):
+    """Parse command line parameters
+
+    Args:
+      args (List[str]): command line parameters as list of strings
+
+    Returns:
+      :obj:`argparse.Namespace`: command line parameters namespace
+    """
+    parser = argparse.ArgumentParser(description="Run a game script headless with a virtual clock")
+    parser.add_argument("script", help="The game's main script", type=str)
+    parser.add_argument("-f", "--frames", help="Frames to run each game for", type=int, default=3600)
+    parser.add_argument("-s", "--seed", help="Seed of the first run", type=int, default=0)
+    parser.add_argument("-n", "--runs", help="Number of runs, with consecutive seeds", type=int, default=1)
+    parser.add_argument("--fps", help="Fixed frame rate for the virtual clock", type=int, default=None)
+    parser.add_argument("--random-keys", help="Mash the arrow keys, space, enter and up randomly",
+                        action="store_true")
+    parser.add_argument("--record", help="Print a CRC of the last frame", action="store_true")
+    return parser.parse_args(args)
+
+
+def main(args):
+    # Anything after -- is for the game
+    split = args.index("--") if "--" in args else len(args)
+    script_args = args[split + 1:]
+    args = parse_args(args[:split])
+
+    keys = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_SPACE, pygame.K_RETURN]
+
+    for seed in range(args.seed, args.seed + args.runs):
+        inputs = RandomInput(keys, seed) if args.random_keys else None
+        sim = Simulation(seed, args.frames, inputs, args.fps, args.record)
+        start = _time.perf_counter()
+        sim.run_script(args.script, script_args)
+        elapsed = _time.perf_counter() - start
+        print(f"{sim} wall={elapsed:.2f}s ({sim.frame / elapsed if elapsed else 0:.0f} frames/s)")
+
+
+def run():
+    """Calls :func:`main` passing the CLI arguments extracted from :obj:`sys.argv`"""
+    main(sys.argv[1:])
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,189 @@
+"""Uniform grid spatial hash, for broad-phase collision tests.
+
+Testing every bullet against every asteroid is O(n·m). A :class:`SpatialHash`
+files each object under the grid cells its bounding circle overlaps, so a
+query only looks at the objects near a point::
+
+    rocks = SpatialHash(WIDTH, HEIGHT, cell_size=64)
+    for a in asteroids:
+        rocks.insert(a, a.pos, a.radius)
+
+    for b in bullets:
+        for a in rocks.query(b.pos):
+            if dist(b.pos, a.pos) < a.radius:
+                ...
+
+    # After the objects moved
+    for a in asteroids:
+        rocks.move(a, a.pos, a.radius)
+
+The hash only narrows the candidates down; the caller still does the exact
+test. By default the world wraps around at its edges like a torus, the way
+games that use ``x % WIDTH, y % HEIGHT`` for positions do, so an object near
+the right edge is found by a query near the left edge.
+
+Queries return objects in the order they were first inserted, so a game
+that stops at the first hit gets the same result as scanning its list.
+"""
+
+import math
+
+
+class SpatialHash(object):
+    """A uniform grid of buckets over a width x height world.
+
+    The cell size is adjusted so a whole number of cells covers the world. A
+    good cell size is about the diameter of the largest object.
+
+    Args:
+        width (float): World width.
+        height (float): World height.
+        cell_size (float): Approximate cell width and height.
+        wrap (bool): The world wraps around at its edges. If False, positions
+            outside the world are filed in the edge cells.
+
+    Attributes:
+        queries (int): The number of query() calls.
+        candidates (int): The number of objects returned by query(), summed.
+    """
+
+    def __init__(self, width, height, cell_size=64, wrap=True):
+        self.width = width
+        self.height = height
+        self.wrap = wrap
+        self.cols = max(1, round(width / cell_size))
+        self.rows = max(1, round(height / cell_size))
+        self.cell_width = width / self.cols
+        self.cell_height = height / self.rows
+        self.queries = 0
+        self.candidates = 0
+        # cell index -> {object: None}
+        self._cells = {}
+        # object -> (insertion number, cell indexes, position, radius)
+        self._objects = {}
+        self._next = 0
+
+    def _span(self, lo, hi, size, count):
+        """Returns the cell numbers covered by [lo, hi] on one axis"""
+
+        first = math.floor(lo / size)
+        last = math.floor(hi / size)
+
+        if self.wrap:
+            if last - first + 1 >= count:
+                return range(count)
+            return [c % count for c in range(first, last + 1)]
+
+        return range(max(0, min(first, count - 1)), max(0, min(last, count - 1)) + 1)
+
+    def cells(self, pos, radius=0):
+        """Returns the indexes of the cells a circle overlaps"""
+
+        x, y = pos
+        cols = self._span(x - radius, x + radius, self.cell_width, self.cols)
+        rows = self._span(y - radius, y + radius, self.cell_height, self.rows)
+
+        return tuple(r * self.cols + c for r in rows for c in cols)
+
+    def insert(self, obj, pos, radius=0):
+        """Adds an object with a bounding circle. Objects must be hashable."""
+
+        if obj in self._objects:
+            self.move(obj, pos, radius)
+            return
+
+        cells = self.cells(pos, radius)
+        self._objects[obj] = (self._next, cells, pos, radius)
+        self._next += 1
+
+        for cell in cells:
+            self._cells.setdefault(cell, {})[obj] = None
+
+    def remove(self, obj):
+        """Removes an object. Raises KeyError if it is not in the hash."""
+
+        _, cells, _, _ = self._objects.pop(obj)
+
+        for cell in cells:
+            bucket = self._cells[cell]
+            del bucket[obj]
+            if not bucket:
+                del self._cells[cell]
+
+    def discard(self, obj):
+        """Removes an object if it is in the hash"""
+
+        if obj in self._objects:
+            self.remove(obj)
+
+    def move(self, obj, pos, radius=None):
+        """Updates an object's position, and radius if given. Adds it if it is not in the hash.
+
+        Only objects that moved into different cells are re-filed, which for
+        most objects on most frames is none.
+        """
+
+        entry = self._objects.get(obj)
+
+        if entry is None:
+            self.insert(obj, pos, radius or 0)
+            return
+
+        order, old_cells, _, old_radius = entry
+        radius = old_radius if radius is None else radius
+        cells = self.cells(pos, radius)
+
+        if cells != old_cells:
+            for cell in old_cells:
+                bucket = self._cells[cell]
+                del bucket[obj]
+                if not bucket:
+                    del self._cells[cell]
+            for cell in cells:
+                self._cells.setdefault(cell, {})[obj] = None
+
+        self._objects[obj] = (order, cells, pos, radius)
+
+    def query(self, pos, radius=0):
+        """Returns the objects whose cells overlap a circle, in insertion order.
+
+        This is a superset of the objects the circle actually touches.
+        """
+
+        found = {}
+        for cell in self.cells(pos, radius):
+            bucket = self._cells.get(cell)
+            if bucket:
+                found.update(bucket)
+
+        self.queries += 1
+        self.candidates += len(found)
+
+        if len(found) < 2:
+            return list(found)
+
+        objects = self._objects
+        return sorted(found, key=lambda obj: objects[obj][0])
+
+    def position(self, obj):
+        """Returns the position an object was last inserted or moved at"""
+        return self._objects[obj][2]
+
+    def clear(self):
+        self._cells.clear()
+        self._objects.clear()
+        self._next = 0
+
+    def __contains__(self, obj):
+        return obj in self._objects
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __iter__(self):
+        return iter(self._objects)
+
+    def __str__(self) -> str:
+        mean = self.candidates / self.queries if self.queries else 0
+        return (f"SpatialHash({len(self)} objects in {len(self._cells)}/{self.cols * self.rows} cells, "
+                f"{mean:.1f} candidates per query)")
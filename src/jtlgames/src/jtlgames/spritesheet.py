@@ -4,18 +4,27 @@ from pathlib import Path
 class SpriteSheet(object):
     """Class to handle loading and parsing a sprite sheet image.
     """
-    def __init__(self, filename, cellsize, offset=(0,0)):
+    def __init__(self, filename, cellsize, offset=(0,0), subsurface=False):
         """
         Initializes the SpriteSheet object.
         Args:
             filename (str): The path to the image file containing the spritesheet.
             cellsize (tuple): The size of each cell in the spritesheet (width, height).
             offset (tuple, optional): The offset to start reading the spritesheet from (x, y). Defaults to (0, 0).
+            subsurface (bool, optional): If True, frames without a colorkey, alpha conversion or transform
+                are views into the sheet rather than copies, so the sheet is the only pixel
+                storage. Drawing on such a frame draws on the sheet. Defaults to False.
         Raises:
             FileNotFoundError: If the spritesheet image cannot be loaded.
         """
         self.cellsize = cellsize
-        
+        self.subsurface = subsurface
+
+        # Raw cell slices, transformed frames and composed strips, see image_at()
+        self._cells = {}
+        self._frames = {}
+        self._composed = {}
+
         try:
             
             img = pygame.image.load(filename)
@@ -51,22 +60,99 @@ class SpriteSheet(object):
         return x,y
 
     
-    def image_at(self, index, colorkey=None):
-        """Loads image from a sprite index (x, y grid position)"""
-        
-        x,y = self.index_to_xy(index)
-        rect = pygame.Rect(x * self.cellsize[0], y * self.cellsize[1], *self.cellsize)
-        image = pygame.Surface(rect.size).convert()
-        image.blit(self.sheet, (0, 0), rect)
-        
+    def _frame_key(self, index, colorkey, scale, flip, alpha=False):
+        """Normalizes the arguments of image_at() into a hashable cache key"""
+
+        if not isinstance(index, int):
+            index = self.xy_to_index(*index)
+
+        if colorkey is not None and colorkey != -1:
+            colorkey = tuple(pygame.Color(colorkey))
+
+        if scale is not None and not isinstance(scale, (int, float)):
+            scale = tuple(scale)
+
+        if flip is not None:
+            flip = (bool(flip[0]), bool(flip[1]))
+            if flip == (False, False):
+                flip = None
+
+        return index, colorkey, scale, flip, bool(alpha)
+
+    def _cell(self, index):
+        """Returns the raw, unkeyed slice of the sheet for a cell, slicing it only once"""
+
+        cell = self._cells.get(index)
+
+        if cell is None:
+            x, y = self.index_to_xy(index)
+            rect = pygame.Rect(x * self.cellsize[0], y * self.cellsize[1], *self.cellsize)
+            if self.subsurface:
+                cell = self.sheet.subsurface(rect)
+            else:
+                cell = pygame.Surface(rect.size).convert()
+                cell.blit(self.sheet, (0, 0), rect)
+            self._cells[index] = cell
+
+        return cell
+
+    def image_at(self, index, colorkey=None, scale=None, flip=None, alpha=False):
+        """Loads image from a sprite index (x, y grid position)
+
+        Frames are cached by (index, colorkey, scale, flip, alpha), so repeated
+        calls return the same surface. Don't draw on the returned surface; copy()
+        it first if you need to change it. In subsurface mode a plain frame is a
+        view into the sheet, and a copy is only made for a colorkey or alpha.
+
+        Args:
+            index (int or tuple): The sprite index, or its (x, y) grid position.
+            colorkey (optional): The transparent color, or -1 to use the color
+                of the top left pixel.
+            scale (optional): A factor to multiply the cell size by, or a
+                (width, height) to scale the image to.
+            flip (tuple, optional): (flip_x, flip_y) booleans.
+            alpha (bool, optional): Convert the frame with convert_alpha().
+        """
+
+        key = self._frame_key(index, colorkey, scale, flip, alpha)
+
+        image = self._frames.get(key)
+        if image is not None:
+            return image
+
+        index, colorkey, scale, flip, alpha = key
+        cell = image = self._cell(index)
+
+        if colorkey == -1:
+            colorkey = image.get_at((0, 0))
+
+        if scale is not None:
+            if isinstance(scale, (int, float)):
+                size = (int(self.cellsize[0] * scale), int(self.cellsize[1] * scale))
+            else:
+                size = scale
+            image = pygame.transform.scale(image, size)
+
+        if flip is not None:
+            image = pygame.transform.flip(image, *flip)
+
         if colorkey is not None: # Set the transparency color?
-            if colorkey == -1:
-                colorkey = image.get_at((0, 0))
+            if image is cell:
+                image = image.copy()
             image.set_colorkey(colorkey, pygame.RLEACCEL)
-        
-        return image
 
+        if alpha:
+            image = image.convert_alpha()
 
+        self._frames[key] = image
+
+        return image
+
+    def clear_cache(self):
+        """Drops all cached frames and composed images"""
+        self._cells.clear()
+        self._frames.clear()
+        self._composed.clear()
 
     @property
     def num_sprites(self):
@@ -82,14 +168,20 @@ class SpriteSheet(object):
         
         return x // self.cellsize[0], y // self.cellsize[1]
 
-    def images_at(self, indices, colorkey=None):
+    def images_at(self, indices, colorkey=None, scale=None, flip=None, alpha=False):
         """Loads multiple images, supply a list of (x, y) indices"""
-        return [self.image_at(index, colorkey) for index in indices]
+        return [self.image_at(index, colorkey, scale, flip, alpha) for index in indices]
 
-    def compose_horiz(self, indices, colorkey=None):
+    def compose_horiz(self, indices, colorkey=None, scale=None, flip=None, alpha=False):
         """Creates a composed image of the sprites at the given indices, stacking the spritest from left to right. """
-            
-        images = self.images_at(indices, colorkey)
+
+        key = tuple(self._frame_key(index, colorkey, scale, flip, alpha) for index in indices)
+
+        composed_image = self._composed.get(key)
+        if composed_image is not None:
+            return composed_image
+
+        images = self.images_at(indices, colorkey, scale, flip, alpha)
         width = sum(image.get_width() for image in images)
         height = images[0].get_height()
         
@@ -99,16 +191,18 @@ class SpriteSheet(object):
         for image in images:
             composed_image.blit(image, (x, 0))
             x += image.get_width()
-        
+
+        self._composed[key] = composed_image
+
         return composed_image
 
-    def load_strip(self, start_index, image_count, colorkey=None):
+    def load_strip(self, start_index, image_count, colorkey=None, scale=None, flip=None, alpha=False):
         """Loads a strip of images starting at start_index (x, y) and returns them as a list"""
 
         if not isinstance(start_index, int):
             start_index = self.xy_to_index(*start_index)
 
-        return [self.image_at(start_index+i, colorkey) for i in range(image_count)]
+        return [self.image_at(start_index+i, colorkey, scale, flip, alpha) for i in range(image_count)]
 
     def __str__(self) -> str:
         width, height = self.sheet.get_size()
@@ -10,6 +10,7 @@ from jtlgames import __version__
 import pygame
 from pathlib import Path
 from .show import SpriteShow
+from .atlas import build_atlas
 
 __author__ = "Eric Busboom"
 __copyright__ = "Eric Busboom"
@@ -111,7 +112,51 @@ def parse_args(args):
     parser.add_argument("-y", "--offset-y", help="Y offset", type=int, default=0)
     return parser.parse_args(args)
 
+def parse_pack_args(args):
+    """Parse command line parameters for the pack subcommand
+
+    Args:
+      args (List[str]): command line parameters after ``pack``
+
+    Returns:
+      :obj:`argparse.Namespace`: command line parameters namespace
+    """
+    parser = argparse.ArgumentParser(prog="ssinfo pack",
+                                     description="Pack a directory of images into texture atlas pages and an index")
+    parser.add_argument("directory", help="Directory of images to pack", type=str)
+    parser.add_argument("-o", "--output", help="Output directory (default: the image directory)", type=str, default=None)
+    parser.add_argument("-n", "--name", help="Base name of the atlas files", type=str, default="atlas")
+    parser.add_argument("-s", "--max-size", help="Largest page width and height", type=int, default=1024)
+    parser.add_argument("-p", "--padding", help="Pixels between packed images", type=int, default=1)
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        dest="loglevel",
+        help="set loglevel to INFO",
+        action="store_const",
+        const=logging.INFO,
+    )
+    return parser.parse_args(args)
+
+
+def pack(args):
+    """Builds a texture atlas from the command line, see :func:`jtlgames.atlas.build_atlas`"""
+    args = parse_pack_args(args)
+    setup_logging(args.loglevel)
+
+    directory = Path(args.directory)
+    if not directory.is_dir():
+        raise FileNotFoundError(f"Error: The directory {directory} does not exist.")
+
+    index_file = build_atlas(directory, args.output or directory, args.name,
+                             (args.max_size, args.max_size), args.padding)
+    print(f"Wrote {index_file}")
+
+
 def main(args):
+    if args and args[0] == "pack":
+        return pack(args[1:])
+
     args = parse_args(args)
     file = Path(args.file)
     if not file.exists():
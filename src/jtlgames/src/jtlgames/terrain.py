@@ -0,0 +1,252 @@
+"""Endless, seeded terrain for side-scrolling games, generated a chunk at a time.
+
+A :class:`ChunkedTerrain` splits the x axis into chunks of ``chunk_width``
+pixels and generates each one, its outline and its landing pads, the first
+time something asks about it. Chunk ``i`` is generated from the seed and
+``i`` alone, so the ground under a given x is the same whichever way the
+player got there, and a chunk that was dropped is generated again
+identically when the player comes back::
+
+    ground = ChunkedTerrain(seed=42, chunk_width=300, base_y=520)
+
+    def update(self):
+        if self.y >= ground.height_at(self.x):
+            pad = ground.pad_at(self.x)
+            ...
+
+    def draw(self, screen):
+        ground.draw(screen, camera_x)
+
+:meth:`ChunkedTerrain.height_at` interpolates in a table of the height of
+every column of the chunk, so it costs the same wherever x is. Pads lie
+flat at ``base_y`` and entirely inside one chunk.
+
+Chunks and the images of their outlines are kept in two LRU caches, of
+``max_chunks`` and ``max_images`` entries, so memory stays bounded however
+far the player flies. Images are only rendered for chunks that are drawn.
+"""
+
+import math
+import random
+from collections import OrderedDict
+
+import pygame
+
+
+class Pad(object):
+    """A landing pad: the flat stretch of ground from x to x + width.
+
+    Args:
+        x (int): World x of its left end.
+        width (int): Its width.
+    """
+
+    color = (255, 255, 255)
+
+    def __init__(self, x, width):
+        self.x = x
+        self.width = width
+
+    def __repr__(self):
+        return f"Pad({self.x}, {self.width})"
+
+
+class Chunk(object):
+    """The ground from x to x + width: one chunk of a ChunkedTerrain.
+
+    Attributes:
+        index (int): Its number. Chunk 0 starts at x = 0.
+        x (int): World x of its left edge.
+        points (list): The outline, as (x, y) tuples relative to the chunk.
+            The first is at x = 0 and the last at x = width.
+        heights (list): The height of the ground at each column, 0 to width inclusive.
+        pads (list): Its landing pads, from left to right.
+    """
+
+    def __init__(self, index, x, points, pads):
+        self.index = index
+        self.x = x
+        self.points = points
+        self.pads = pads
+
+        self.heights = []
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            self.heights.extend(y1 + (c - x1) * (y2 - y1) / (x2 - x1) for c in range(x1, x2))
+        self.heights.append(float(points[-1][1]))
+
+        ys = [y for x, y in points]
+        self.top = min(ys)
+        self.bottom = max(ys)
+
+
+class ChunkedTerrain(object):
+    """Rough ground with flat landing pads, generated on demand from a seed.
+
+    Each chunk's outline has a point every ``step`` pixels, at ``base_y``
+    plus or minus up to ``roughness``, and up to ``max_pads`` pads. Walking
+    along the chunk, a pad is placed at each point with probability
+    ``pad_chance``, with its width picked from ``pad_widths``.
+
+    Args:
+        seed: The seed. Any value random.seed() takes.
+        chunk_width (int): The width of a chunk, in pixels.
+        base_y (int): The height of the pads, and the middle of the rough ground.
+        roughness (int): How far the rough ground goes above and below base_y.
+        step (int): The distance between the points of the outline.
+        pad_widths (tuple): The widths a pad can be.
+        pad_chance (float): The chance of a pad at each point.
+        max_pads (int): The most pads in one chunk.
+        pad_factory (callable): Makes a pad, given its world x and its width.
+            Defaults to Pad. A pad with a ``color`` attribute is drawn in that color.
+        color: The color of the outline.
+        line_width (int): The width of the outline.
+        max_chunks (int): The most chunks to keep generated.
+        max_images (int): The most chunk images to keep rendered.
+
+    Attributes:
+        generated (int): Chunks generated, including ones generated again after being dropped.
+        rendered (int): Chunk images rendered.
+    """
+
+    def __init__(self, seed=0, chunk_width=256, base_y=400, roughness=20, step=10,
+                 pad_widths=(80, 50, 30), pad_chance=0.2, max_pads=2, pad_factory=Pad,
+                 color=(100, 100, 100), line_width=3, max_chunks=64, max_images=8):
+        if chunk_width < step + max(pad_widths) + step:
+            raise ValueError("chunk_width must leave room for the widest pad")
+
+        self.seed = seed
+        self.chunk_width = chunk_width
+        self.base_y = base_y
+        self.roughness = roughness
+        self.step = step
+        self.pad_widths = pad_widths
+        self.pad_chance = pad_chance
+        self.max_pads = max_pads
+        self.pad_factory = pad_factory
+        self.color = color
+        self.line_width = line_width
+        self.max_chunks = max_chunks
+        self.max_images = max_images
+        self.generated = 0
+        self.rendered = 0
+        self._chunks = OrderedDict()
+        self._images = OrderedDict()
+
+    def _random(self, kind, index):
+        return random.Random(f"{self.seed}/{kind}/{index}")
+
+    def _edge_height(self, index):
+        """The height of the ground at x = index * chunk_width, shared by the chunks on either side"""
+        return self.base_y + self._random("edge", index).randint(-self.roughness, self.roughness)
+
+    def _generate(self, index):
+        rng = self._random("chunk", index)
+        x0 = index * self.chunk_width
+        end = self.chunk_width - self.step
+
+        points = [(0, self._edge_height(index))]
+        pads = []
+        x = self.step
+        while x < end:
+            if len(pads) < self.max_pads and rng.random() < self.pad_chance:
+                width = rng.choice(self.pad_widths)
+                if x + width <= end:
+                    points += [(x, self.base_y), (x + width, self.base_y)]
+                    pads.append(self.pad_factory(x0 + x, width))
+                    x += width + self.step
+                    continue
+            points.append((x, self.base_y + rng.randint(-self.roughness, self.roughness)))
+            x += self.step
+        points.append((self.chunk_width, self._edge_height(index + 1)))
+
+        self.generated += 1
+        return Chunk(index, x0, points, pads)
+
+    def chunk(self, index):
+        """Returns chunk number index, generating it if it is not in the cache"""
+
+        chunk = self._chunks.get(index)
+        if chunk is not None:
+            self._chunks.move_to_end(index)
+            return chunk
+
+        chunk = self._chunks[index] = self._generate(index)
+        if len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+
+        return chunk
+
+    def index_at(self, x):
+        """The number of the chunk x is in"""
+        return math.floor(x / self.chunk_width)
+
+    def height_at(self, x):
+        """The y of the ground at world x"""
+
+        chunk = self.chunk(self.index_at(x))
+        x -= chunk.x
+        c = int(x)
+        heights = chunk.heights
+        return heights[c] + (x - c) * (heights[c + 1] - heights[c])
+
+    def pad_at(self, x):
+        """Returns the pad whose flat stretch x is on, or None"""
+
+        for pad in self.chunk(self.index_at(x)).pads:
+            if pad.x <= x <= pad.x + pad.width:
+                return pad
+        return None
+
+    def pads_between(self, x1, x2):
+        """Yields the pads that start between x1 and x2, from left to right"""
+
+        for index in range(self.index_at(x1), self.index_at(x2) + 1):
+            for pad in self.chunk(index).pads:
+                if x1 <= pad.x <= x2:
+                    yield pad
+
+    def draw_pad(self, image, pad, rect):
+        """Draws a pad on a chunk's image. rect is where, relative to the image."""
+        pygame.draw.rect(image, getattr(pad, "color", None) or self.color, rect)
+
+    def _render(self, chunk):
+        top = chunk.top - 5 - self.line_width
+        image = pygame.Surface((self.chunk_width, chunk.bottom + 5 + self.line_width - top), pygame.SRCALPHA)
+        pygame.draw.lines(image, self.color, False, [(x, y - top) for x, y in chunk.points], self.line_width)
+        for pad in chunk.pads:
+            self.draw_pad(image, pad, (pad.x - chunk.x, self.base_y - 5 - top, pad.width, 10))
+
+        self.rendered += 1
+        return image, top
+
+    def image(self, index):
+        """Returns the image of chunk number index and the world y of its top,
+        rendering it if it is not in the cache"""
+
+        entry = self._images.get(index)
+        if entry is not None:
+            self._images.move_to_end(index)
+            return entry
+
+        entry = self._images[index] = self._render(self.chunk(index))
+        if len(self._images) > self.max_images:
+            self._images.popitem(last=False)
+
+        return entry
+
+    def draw(self, surf, camera_x=0, camera_y=0):
+        """Draws the chunks in view on surf, whose top left corner is at world (camera_x, camera_y)"""
+
+        for index in range(self.index_at(camera_x), self.index_at(camera_x + surf.get_width() - 1) + 1):
+            image, top = self.image(index)
+            surf.blit(image, (round(index * self.chunk_width - camera_x), round(top - camera_y)))
+
+    def clear(self):
+        """Drops every chunk and image, to be generated again when asked for"""
+
+        self._chunks.clear()
+        self._images.clear()
+
+    def __str__(self) -> str:
+        return (f"terrain: {len(self._chunks)} chunks, {len(self._images)} images; "
+                f"generated {self.generated}, rendered {self.rendered}")
@@ -0,0 +1,243 @@
+"""Cached fonts and text rendering.
+
+Creating a ``pygame.font.Font`` opens and parses the font file, and
+``SysFont`` also searches the system's fonts, so neither belongs in a game
+loop. Rendering a string rasterizes every glyph in it. This module keeps both
+out of the per-frame path:
+
+* :func:`font` and :func:`sysfont` return one shared font object per
+  (font, size, style).
+* :func:`render` keeps the most recently rendered strings in an LRU cache, so
+  text that did not change since the last frame is not rendered again.
+* :class:`GlyphAtlas` renders each character of a small alphabet, like the
+  digits of a score, once and builds strings by blitting the glyphs.
+* :class:`Counter` is a HUD field that only rebuilds its surface when its
+  value changes.
+
+For example::
+
+    from jtlgames import text
+
+    score = text.Counter(text.sysfont('Arial', 20), (255, 255, 255), "Score: {}")
+
+    while running:
+        ...
+        screen.blit(text.render(text.sysfont('Arial', 20), "Lives", (255, 255, 255)), (10, 10))
+        screen.blit(score.render(points), (10, 30))
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+# Characters a numeric counter needs
+DIGITS = "0123456789-+.,:% "
+
+_fonts = {}
+
+
+def font(filename=None, size=20):
+    """Returns the shared Font for a font file, or the default font if filename is None"""
+
+    key = ("file", str(filename) if filename is not None else None, size)
+    f = _fonts.get(key)
+
+    if f is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        f = _fonts[key] = pygame.font.Font(filename, size)
+
+    return f
+
+
+def sysfont(name=None, size=20, bold=False, italic=False):
+    """Returns the shared SysFont for a system font name"""
+
+    key = ("sys", name, size, bold, italic)
+    f = _fonts.get(key)
+
+    if f is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        f = _fonts[key] = pygame.font.SysFont(name, size, bold, italic)
+
+    return f
+
+
+class TextCache(object):
+    """LRU cache of rendered strings.
+
+    Attributes:
+        maxsize (int): The most surfaces to keep.
+        hits (int): Renders answered from the cache.
+        misses (int): Renders that rasterized the string.
+    """
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, color, antialias=True, background=None):
+        """Returns font.render(text, antialias, color, background), rendering it only
+        if it is not in the cache. Don't draw on the returned surface."""
+
+        text = str(text)
+        key = (font, text, tuple(pygame.Color(color)), antialias,
+               tuple(pygame.Color(background)) if background is not None else None)
+        surface = self._surfaces.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = font.render(text, antialias, color, background)
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+# The cache shared by everything in the process
+cache = TextCache()
+
+
+def render(font, text, color, antialias=True, background=None):
+    """Renders text with a font through the process-wide TextCache.
+
+    See :meth:`TextCache.render`.
+    """
+    return cache.render(font, text, color, antialias, background)
+
+
+def clear():
+    """Drops the shared fonts and rendered strings. Call it after pygame.quit(),
+    which invalidates them."""
+
+    _fonts.clear()
+    cache.clear()
+
+
+class GlyphAtlas(object):
+    """Pre-rendered glyphs of a font, for strings drawn from a small alphabet.
+
+    Strings are built by placing the glyphs side by side, so they don't get the
+    font's kerning. That is rarely visible for digits. Characters that are not
+    in the atlas are rendered and added the first time they are used.
+
+    Args:
+        font (pygame.font.Font): The font.
+        color: The text color.
+        chars (str): The characters to render up front. Defaults to DIGITS.
+        antialias (bool): Antialias the glyphs.
+    """
+
+    def __init__(self, font, color, chars=DIGITS, antialias=True):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.height = font.get_linesize()
+        self._glyphs = {}
+        for c in chars:
+            self.glyph(c)
+
+    def glyph(self, c):
+        """Returns the surface for one character"""
+
+        g = self._glyphs.get(c)
+
+        if g is None:
+            g = self.font.render(c, self.antialias, self.color)
+            if pygame.display.get_surface() is not None:
+                g = g.convert_alpha()
+            self._glyphs[c] = g
+
+        return g
+
+    def size(self, text):
+        """Returns the (width, height) render() would make text"""
+        return sum(self.glyph(c).get_width() for c in text), self.height
+
+    def render(self, text, surface=None):
+        """Renders text from the glyphs.
+
+        Args:
+            text (str): The text.
+            surface (pygame.Surface, optional): A surface of at least size(text) to
+                render into, which is cleared first. A new one is made if omitted.
+
+        Returns:
+            pygame.Surface: The surface the text was rendered into.
+        """
+
+        text = str(text)
+        if surface is None:
+            surface = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        else:
+            surface.fill((0, 0, 0, 0))
+
+        x = 0
+        for c in text:
+            g = self.glyph(c)
+            # The glyphs don't overlap, so max blending onto the cleared surface copies them exactly
+            surface.blit(g, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += g.get_width()
+
+        return surface
+
+
+class Counter(object):
+    """A HUD field that only re-renders when its value changes.
+
+    Args:
+        font (pygame.font.Font): The font.
+        color: The text color.
+        fmt (str): A format string for the value, e.g. "Score: {}".
+        glyphs (GlyphAtlas, optional): Render with these glyphs, instead of
+            rendering the whole string with the font.
+
+    Attributes:
+        changed (bool): True if the last render() call made a new surface.
+    """
+
+    def __init__(self, font, color, fmt="{}", glyphs=None):
+        self.font = font
+        self.color = color
+        self.fmt = fmt
+        self.glyphs = glyphs
+        self.changed = False
+        self._text = None
+        self._surface = None
+
+    @property
+    def text(self):
+        """The text of the last rendered value"""
+        return self._text
+
+    def render(self, value):
+        """Returns the surface for value, re-rendering only if its text changed.
+
+        The text is compared rather than the value, since equal values can
+        format differently: 0.0 == -0.0 and 1 == True.
+        """
+
+        text = self.fmt.format(value)
+        self.changed = text != self._text
+
+        if self.changed:
+            self._text = text
+            if self.glyphs is not None:
+                self._surface = self.glyphs.render(text)
+            else:
+                self._surface = self.font.render(text, True, self.color)
+
+        return self._surface
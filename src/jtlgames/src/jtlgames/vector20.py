@@ -1,6 +1,8 @@
 import pygame
 import math
 
+from . import text
+
 # Constants for colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -55,13 +57,13 @@ def Vector20Factory(screen_width=800, screen_height=600, scale=20):
         mid_y = (start.y + end.y) / 2
 
         # Create a font object
-        font = pygame.font.SysFont(None, 24)
+        font = text.sysfont(None, 24)
       
         disp_x = end_o.x // scale
         disp_y = end_o.y // scale
         
         # Render the text with white background
-        text_surface = font.render(f"({disp_x:.1f}, {disp_y:.1f})", True, BLUE, WHITE)
+        text_surface = text.render(font, f"({disp_x:.1f}, {disp_y:.1f})", BLUE, background=WHITE)
         text_rect = text_surface.get_rect(center=(mid_x, mid_y))
         
         # Draw the text on the screen at the midpoint of the line
@@ -91,13 +93,13 @@ def Vector20Factory(screen_width=800, screen_height=600, scale=20):
         center_x = screen_width // 2
         center_y = screen_height // 2
 
-        font = pygame.font.SysFont(None, 16)
+        font = text.sysfont(None, 16)
 
         # Label vertical lines at y=0
         for x in range(0, screen_width, scale):
             line_number = (x - center_x) // scale
             if line_number != 0:  # Skip the center line label
-                label = font.render(str(line_number), True, GREEN)
+                label = text.render(font, line_number, GREEN)
                 label_rect = label.get_rect()
                 # Draw the label with white background buffer
                 pygame.draw.rect(screen, WHITE, (x - label_rect.width // 2, center_y + 5, label_rect.width, label_rect.height))
@@ -107,7 +109,7 @@ def Vector20Factory(screen_width=800, screen_height=600, scale=20):
         for y in range(0, screen_height, scale):
             line_number = (center_y - y) // scale
             if line_number != 0:  # Skip the center line label
-                label = font.render(str(line_number), True, GREEN)
+                label = text.render(font, line_number, GREEN)
                 label_rect = label.get_rect()
                 # Draw the label with white background buffer
                 pygame.draw.rect(screen, WHITE, (center_x + 5, y - label_rect.height // 2, label_rect.width, label_rect.height))
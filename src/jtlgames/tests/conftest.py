@@ -1,10 +1,22 @@
-"""
-    Dummy conftest.py for jtlgames.
+"""Shared setup for the jtlgames tests: pygame runs on its headless dummy drivers."""
 
-    If you don't know what this is for, just leave it empty.
-    Read more about conftest.py under:
-    - https://docs.pytest.org/en/stable/fixture.html
-    - https://docs.pytest.org/en/stable/writing_plugins.html
-"""
+import os
 
-# import pytest
+# Run the pygame tests without opening a window or an audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402  after the drivers above are chosen
+import pytest  # noqa: E402
+
+from jtlgames import text  # noqa: E402
+
+
+@pytest.fixture
+def display():
+    """Initializes pygame with a 64x64 display, and quits it after the test"""
+    pygame.init()
+    yield pygame.display.set_mode((64, 64))
+    pygame.quit()
+    # Fonts don't survive pygame.quit()
+    text.clear()
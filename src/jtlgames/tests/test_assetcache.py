@@ -0,0 +1,52 @@
+import pygame
+import pytest
+from pathlib import Path
+
+from jtlgames import assetcache
+
+images = Path(__file__).parent / 'images'
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch, display):
+    """Points the cache at an empty directory and sets up a display"""
+    monkeypatch.setenv("JTLGAMES_CACHE_DIR", str(tmp_path))
+    return assetcache.cache_dir()
+
+
+def test_cold_and_warm_loads_match(cache):
+    """A cache hit gives the same pixels as the decoded file"""
+    cold = assetcache.load_image(images / 'spritesheet.png', size=(64, 128))
+    files = list(cache.glob("*.raw"))
+    assert len(files) == 1
+
+    warm = assetcache.load_image(images / 'spritesheet.png', size=(64, 128))
+    assert warm.get_size() == (64, 128)
+    assert pygame.image.tobytes(warm, "RGBA") == pygame.image.tobytes(cold, "RGBA")
+
+
+def test_keyed_by_transform(cache):
+    """Each distinct transform gets its own cache entry"""
+    assetcache.load_image(images / 'spritesheet.png')
+    assetcache.load_image(images / 'spritesheet.png', flip=(True, False))
+    assetcache.load_image(images / 'spritesheet.png', alpha=False)
+    assert len(list(cache.glob("*.raw"))) == 3
+
+    assetcache.clear_cache()
+    assert not list(cache.glob("*.raw"))
+
+
+def test_stale_file_is_ignored(cache):
+    """A cache file from another version is treated as a miss and rewritten"""
+    assetcache.load_image(images / 'spritesheet.png')
+    path, = cache.glob("*.raw")
+    path.write_bytes(b"JUNK")
+
+    image = assetcache.load_image(images / 'spritesheet.png')
+    assert image.get_size() == (128, 256)
+    assert path.read_bytes()[:4] == b"JTLC"
+
+
+def test_missing_file(cache):
+    with pytest.raises(FileNotFoundError):
+        assetcache.load_image(images / 'no_such_image.png')
@@ -0,0 +1,61 @@
+import pytest
+from pathlib import Path
+
+from jtlgames.assets import AssetRegistry
+
+images = Path(__file__).parent / 'images'
+sheet = images / 'spritesheet.png'
+
+# Size in bytes of spritesheet.png loaded as a 32 bit surface
+SHEET_BYTES = 128 * 256 * 4
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch, display):
+    monkeypatch.setenv("JTLGAMES_CACHE_DIR", str(tmp_path))
+    return AssetRegistry()
+
+
+def test_loads_are_deduplicated(registry):
+    first = registry.image(sheet)
+    assert registry.image(str(sheet)) is first
+    assert registry.image(sheet, flip=(True, False)) is not first
+    assert registry.image(sheet, size=(16, 16)).get_size() == (16, 16)
+    assert (registry.hits, registry.misses) == (1, 3)
+    assert first in registry
+
+
+def test_colorkey(registry):
+    keyed = registry.image(sheet, alpha=False, colorkey=-1)
+    assert keyed.get_colorkey() == keyed.get_at((0, 0))
+    assert registry.image(sheet, alpha=False).get_colorkey() is None
+
+
+def test_lru_eviction(registry):
+    registry.budget = 2 * SHEET_BYTES
+    a = registry.image(sheet)
+    b = registry.image(sheet, flip=(True, False))
+    registry.image(sheet)  # a is now the most recently used
+    c = registry.image(sheet, flip=(False, True))
+
+    assert registry.evictions == 1
+    assert a in registry and c in registry
+    assert b not in registry
+    assert registry.memory == 2 * SHEET_BYTES
+
+
+def test_pinned_images_survive_eviction(registry):
+    registry.budget = SHEET_BYTES
+    pinned = registry.acquire(sheet)
+    assert registry.refs(pinned) == 1
+
+    other = registry.image(sheet, flip=(True, False))
+    assert pinned in registry and other in registry
+
+    registry.release(pinned)
+    assert registry.refs(pinned) == 0
+    assert pinned not in registry
+    assert registry.memory == SHEET_BYTES
+
+    with pytest.raises(ValueError):
+        registry.release(pinned)
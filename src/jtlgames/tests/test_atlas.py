@@ -0,0 +1,96 @@
+import json
+
+import pygame
+import pytest
+
+from jtlgames.atlas import Atlas, build_atlas, pack_rects
+from jtlgames.assets import AssetRegistry
+from jtlgames.ssinfo import main
+
+
+def test_pack_rects_no_overlap():
+    sizes = {f"img{i}": (10 + i * 3, 40 - i) for i in range(20)}
+    placements, page_sizes = pack_rects(sizes, max_size=(128, 128), padding=1)
+
+    assert set(placements) == set(sizes)
+    for name, (page, rect) in placements.items():
+        assert rect.size == sizes[name]
+        assert rect.right <= page_sizes[page][0] and rect.bottom <= page_sizes[page][1]
+        for other, (other_page, other_rect) in placements.items():
+            if other != name and other_page == page:
+                assert not rect.colliderect(other_rect)
+
+
+def test_pack_rects_pages():
+    placements, page_sizes = pack_rects({c: (60, 60) for c in "abcde"}, max_size=(128, 128))
+    assert len(page_sizes) == 2
+    assert sorted(page for page, _ in placements.values()) == [0, 0, 0, 0, 1]
+
+    with pytest.raises(ValueError):
+        pack_rects({"big": (200, 10)}, max_size=(128, 128))
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    """A directory of small solid colored images, one in a subdirectory"""
+    colors = {"red": (255, 0, 0), "green": (0, 255, 0), "sub/blue": (0, 0, 255)}
+    for name, color in colors.items():
+        image = pygame.Surface((8 + len(name), 8))
+        image.fill(color)
+        path = tmp_path / "images" / f"{name}.png"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pygame.image.save(image, path)
+    return tmp_path / "images", colors
+
+
+def test_build_and_load(image_dir, tmp_path, monkeypatch, display):
+    monkeypatch.setenv("JTLGAMES_CACHE_DIR", str(tmp_path / "cache"))
+    directory, colors = image_dir
+
+    index_file = build_atlas(directory, tmp_path / "out", name="test")
+    index = json.loads(index_file.read_text())
+    assert index["pages"] == ["test0.png"]
+    assert set(index["frames"]) == set(colors)
+
+    registry = AssetRegistry()
+    atlas = Atlas(index_file, registry)
+
+    for name, color in colors.items():
+        image = atlas[name]
+        assert image.get_size() == (8 + len(name), 8)
+        assert image.get_at((1, 1))[:3] == color
+        assert image.get_parent() is atlas.pages[0]
+        assert atlas[name] is image
+
+    assert registry.refs(atlas.pages[0]) == 1
+    page = atlas.pages[0]
+    atlas.close()
+    assert registry.refs(page) == 0
+
+
+def test_cli_pack(image_dir, tmp_path, capsys):
+    directory, colors = image_dir
+    main(["pack", str(directory), "-o", str(tmp_path / "cli"), "-n", "sheet"])
+    assert "sheet.json" in capsys.readouterr().out
+    assert (tmp_path / "cli" / "sheet0.png").exists()
+
+
+def test_pack_twice_into_the_image_directory(image_dir):
+    directory, colors = image_dir
+    main(["pack", str(directory)])
+    main(["pack", str(directory)])
+
+    index = json.loads((directory / "atlas.json").read_text())
+    assert set(index["frames"]) == set(colors)
+    assert index["pages"] == ["atlas0.png"]
+
+
+def test_pack_again_onto_fewer_pages(image_dir, tmp_path):
+    directory, colors = image_dir
+    out_dir = tmp_path / "out"
+    build_atlas(directory, out_dir, max_size=(16, 8))
+    assert len(list(out_dir.glob("atlas*.png"))) == 3
+
+    index = json.loads(build_atlas(directory, out_dir).read_text())
+    assert index["pages"] == ["atlas0.png"]
+    assert sorted(path.name for path in out_dir.glob("atlas*.png")) == ["atlas0.png"]
@@ -0,0 +1,104 @@
+import random
+
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from jtlgames.batch import SpriteBatch  # noqa: E402
+
+
+def images():
+    result = []
+    for i, size in enumerate([(40, 40), (25, 26), (12, 13)]):
+        image = pygame.Surface(size)
+        image.fill((80 * i + 50, 255, 0))
+        result.append(image)
+    return result
+
+
+def random_batch(rnd, n=300):
+    batch = SpriteBatch(images(), (400, 300), cell_size=32, capacity=4)
+    batch.add([(rnd.randrange(-50, 450), rnd.randrange(-50, 350)) for _ in range(n)],
+              [(rnd.uniform(-3, 3), rnd.uniform(0, 3)) for _ in range(n)],
+              [rnd.randrange(3) for _ in range(n)])
+    return batch
+
+
+def test_moves_like_move_ip_with_accumulated_motion():
+    rnd = random.Random(1)
+    batch = random_batch(rnd, 50)
+    rects = [pygame.Rect(pos, size) for pos, size in zip(batch.pos.tolist(), batch.size.tolist())]
+    moves = [[vx, vy, 0.0, 0.0] for vx, vy in batch.vel.tolist()]
+
+    for _ in range(100):
+        batch.step()
+        for rect, m in zip(rects, moves):
+            m[2] += m[0]
+            m[3] += m[1]
+            if abs(m[2]) > 1:
+                rect.move_ip(m[2], 0)
+                m[2] -= int(m[2])
+            if abs(m[3]) > 1:
+                rect.move_ip(0, m[3])
+                m[3] -= int(m[3])
+
+    assert [tuple(r.topleft) for r in rects] == [tuple(p) for p in batch.pos.tolist()]
+
+
+def test_centers_like_rect_center():
+    batch = SpriteBatch(images(), (100, 100))
+    batch.add([(10, 10)], [(0, 0)], [1])
+    rect = pygame.Rect(0, 0, 25, 26)
+    rect.center = (10, 10)
+    assert tuple(batch.pos[0]) == rect.topleft
+
+
+def test_collide_rect_matches_colliderect():
+    rnd = random.Random(2)
+    batch = random_batch(rnd)
+    for _ in range(10):
+        batch.step()
+    rects = [pygame.Rect(pos, size) for pos, size in zip(batch.pos.tolist(), batch.size.tolist())]
+
+    for _ in range(200):
+        target = pygame.Rect(rnd.randrange(-80, 480), rnd.randrange(-80, 380), rnd.randrange(0, 120),
+                             rnd.randrange(0, 60))
+        expected = [i for i, r in enumerate(rects) if r.colliderect(target)]
+        assert batch.collide_rect(target).tolist() == expected
+
+    assert batch.candidates < batch.queries * len(batch) / 4
+
+
+def test_place_and_remove():
+    rnd = random.Random(3)
+    batch = random_batch(rnd, 10)
+    batch.step()
+    kept = batch.pos[[0, 2, 4, 5, 6, 7, 8, 9]].copy()
+
+    batch.place([5], [(100, 100)], [(1, 1)], [0])
+    assert tuple(batch.pos[5]) == (80, 80) and tuple(batch.frac[5]) == (0, 0)
+    assert batch.collide_rect((95, 95, 2, 2)).tolist() == [5]
+
+    batch.remove([1, 3])
+    assert len(batch) == 8
+    assert batch.collide_rect((95, 95, 2, 2)).tolist() == [3]
+    kept[3] = (80, 80)
+    assert (batch.pos == kept).all()
+
+
+def test_draw_matches_a_group():
+    pygame.init()
+    rnd = random.Random(4)
+    batch = random_batch(rnd, 100)
+    group = pygame.sprite.Group()
+    for pos, i in zip(batch.pos.tolist(), batch.image.tolist()):
+        sprite = pygame.sprite.Sprite(group)
+        sprite.image = batch.images[i]
+        sprite.rect = sprite.image.get_rect(topleft=pos)
+
+    expected, screen = pygame.Surface((400, 300)), pygame.Surface((400, 300))
+    group.draw(expected)
+    batch.draw(screen)
+    assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(expected, "RGB")
+    pygame.quit()
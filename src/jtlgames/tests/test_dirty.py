@@ -0,0 +1,63 @@
+import random
+
+import pygame
+import pytest
+
+from jtlgames.dirty import DirtyScreen
+
+
+@pytest.fixture
+def screen(display):
+    display = pygame.display.set_mode((200, 150))
+    background = pygame.Surface((200, 150))
+    background.fill((0, 0, 80))
+    pygame.draw.line(background, (200, 200, 0), (0, 0), (200, 150), 3)
+    return DirtyScreen(display, background)
+
+
+def test_dirty_rects_keep_display_in_sync(screen):
+    """Copying only the dirty rects each frame gives the same picture as a full redraw"""
+    rnd = random.Random(7)
+    sprites = []
+    for i in range(8):
+        image = pygame.Surface((rnd.randint(5, 30), rnd.randint(5, 30)))
+        image.fill((rnd.randint(0, 255), 255, i * 30))
+        sprites.append([image, [rnd.randint(0, 190), rnd.randint(0, 140)]])
+    mirror = pygame.Surface((200, 150))
+
+    for frame in range(60):
+        screen.clear()
+        for i, (image, pos) in enumerate(sprites):
+            if i % 3 == 0:  # Some sprites move
+                pos[0] = (pos[0] + rnd.randint(-4, 4)) % 200
+            if i % 4 == 1 and frame % 5 == 0:  # Some blink
+                continue
+            if i == 2 and frame % 7 == 0:  # And one gets a new image
+                sprites[i][0] = image = image.copy()
+            screen.blit(image, pos)
+
+        for rect in screen.update():
+            mirror.blit(screen.surface, rect, rect)
+
+        assert pygame.image.tobytes(mirror, "RGB") == pygame.image.tobytes(screen.surface, "RGB")
+
+
+def test_still_scene_updates_nothing(screen):
+    image = pygame.Surface((10, 10))
+    for _ in range(3):
+        screen.clear()
+        screen.blit(image, (20, 20))
+        rects = screen.update()
+    assert rects == []
+    assert screen.frame_pixels == 0
+
+    screen.clear()
+    rects = screen.update()
+    assert rects == [pygame.Rect(20, 20, 10, 10)]
+
+
+def test_full_frame(screen):
+    screen.full_frame = True
+    screen.clear()
+    assert screen.update() == [pygame.Rect(0, 0, 200, 150)]
+    assert "full frame" in screen.stats()
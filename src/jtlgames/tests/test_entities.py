@@ -0,0 +1,64 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from jtlgames.entities import EntityStore  # noqa: E402
+
+
+def test_add_grow_and_views():
+    store = EntityStore(100, 100, capacity=2)
+    for i in range(5):
+        assert store.add((i, i), (1, 0), radius=i, kind=i) == i
+
+    assert len(store) == 5
+    assert store.pos.shape == (5, 2)
+    assert store.kind.tolist() == [0, 1, 2, 3, 4]
+    assert np.isinf(store.life).all()
+
+
+def test_step_wraps_like_modulo():
+    store = EntityStore(800, 600)
+    positions = [(799.5, 10.0), (0.2, 599.9), (400.0, 300.0)]
+    velocities = [(1.5, -0.3), (-2.5, 3.7), (0.1, 0.2)]
+    for p, v in zip(positions, velocities):
+        store.add(p, v)
+
+    for _ in range(100):
+        store.step()
+        positions = [((x + vx) % 800, (y + vy) % 600) for (x, y), (vx, vy) in zip(positions, velocities)]
+
+    assert store.pos.tolist() == [list(p) for p in positions]
+
+
+def test_remove_keeps_order_and_expire():
+    store = EntityStore(100, 100)
+    for i in range(6):
+        store.add((i, 0), life=3 if i % 2 else None, kind=i)
+
+    store.remove([0, 3])
+    assert store.kind.tolist() == [1, 2, 4, 5]
+
+    store.step()
+    store.step()
+    assert store.expire() == 0
+    store.step()
+    assert store.expire() == 2
+    assert store.kind.tolist() == [2, 4]
+
+    store.remove(store.kind == 2)
+    assert store.kind.tolist() == [4]
+    store.clear()
+    assert len(store) == 0
+
+
+def test_hits_and_distances():
+    store = EntityStore(100, 100)
+    store.add((10, 10), radius=5)
+    store.add((50, 50), radius=20)
+
+    hits = store.hits([(12, 12), (60, 60), (90, 90)])
+    assert hits.tolist() == [[True, False], [False, True], [False, False]]
+    assert store.hits([(16, 10)], extra=2).tolist() == [[True, False]]
+    assert store.distances((10, 13)).tolist() == [3.0, math.hypot(40, 37)]
@@ -0,0 +1,65 @@
+import logging
+
+import pygame
+import pytest
+
+from jtlgames import formats
+
+
+def loaded(alpha=True, opaque=False):
+    """A surface like pygame.image.load() gives for a PNG: RGBA bytes, not in the display's order"""
+    image = pygame.Surface((8, 8), pygame.SRCALPHA if alpha else 0, 32)
+    image.fill((200, 100, 50, 255 if opaque else 128))
+    fmt = "RGBA" if alpha else "RGB"
+    return pygame.image.frombuffer(pygame.image.tobytes(image, fmt), (8, 8), fmt)
+
+
+def test_normalize(display):
+    image = loaded()
+    assert not formats.is_display_format(image)
+
+    converted = formats.normalize(image)
+    assert converted is not image and formats.is_display_format(converted)
+    assert formats.has_alpha(converted) and converted.get_at((1, 1)) == image.get_at((1, 1))
+    assert formats.normalize(converted) is converted
+
+    opaque = formats.normalize(loaded(alpha=False))
+    assert formats.is_display_format(opaque) and not formats.has_alpha(opaque)
+
+
+def test_problems(display):
+    assert "pixel format" in formats.problem(loaded())
+    assert "opaque" in formats.problem(loaded(opaque=True).convert_alpha())
+    assert formats.problem(loaded(opaque=True).convert()) is None
+    assert formats.problem(loaded().convert_alpha()) is None
+
+
+def test_no_display():
+    pygame.init()
+    with pytest.raises(pygame.error):
+        formats.is_display_format(pygame.Surface((4, 4)))
+    pygame.quit()
+
+
+def test_blit_audit_warns_once(display, caplog):
+    audit = formats.BlitAudit(display)
+    slow, fast = loaded(), loaded().convert_alpha()
+    sprites = pygame.sprite.Group()
+    for image in (slow, fast):
+        sprite = pygame.sprite.Sprite(sprites)
+        sprite.image, sprite.rect = image, image.get_rect()
+
+    with caplog.at_level(logging.WARNING, logger="jtlgames.formats"):
+        for _ in range(3):
+            audit.fill((0, 0, 0))
+            audit.blit(slow, (10, 10))
+            sprites.draw(audit)
+
+    assert audit.checked == 2
+    assert audit.problems == [((8, 8), formats.problem(slow))]
+    assert len(caplog.records) == 1 and "8x8" in caplog.records[0].getMessage()
+    assert display.get_at((12, 12)) != (0, 0, 0, 255)
+
+
+def test_blit_rate(display):
+    assert formats.blit_rate(loaded().convert_alpha(), display, seconds=0.01) > 0
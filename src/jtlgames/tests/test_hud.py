@@ -0,0 +1,73 @@
+import pygame
+import pytest
+
+from jtlgames import text
+from jtlgames.hud import Hud
+
+WHITE = (255, 255, 255)
+
+
+pytestmark = pytest.mark.usefixtures("display")
+
+
+def scene():
+    """A backdrop with something in it, and a translucent panel"""
+    surf = pygame.Surface((300, 100))
+    surf.fill((20, 40, 60))
+    pygame.draw.circle(surf, (200, 50, 0), (120, 50), 40)
+
+    panel = pygame.Surface((200, 80), pygame.SRCALPHA)
+    panel.fill((90, 90, 90, 102))
+    return surf, panel
+
+
+def test_same_pixels_as_blitting_the_text():
+    font = text.font(None, 24)
+    expected, panel = scene()
+    expected.blit(panel, (10, 10))
+    expected.blit(font.render("Fuel: 480", True, WHITE), (20, 15))
+    expected.blit(font.render("12.5", True, (100, 255, 100)), (20, 45))
+
+    hud = Hud((10, 10, 200, 80), panel)
+    hud.add("fuel", (10, 5), font, WHITE, "Fuel: {}")
+    hud.add("speed", (10, 35), font, (100, 255, 100))
+    hud.set("fuel", 500)
+    hud.update({"fuel": 480, "speed": 12.5})
+
+    surf, _ = scene()
+    hud.draw(surf)
+    assert pygame.image.tobytes(surf, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def test_only_changes_are_rendered_and_reported():
+    font = text.font(None, 24)
+    hud = Hud((100, 0, 150, 60))
+    hud.add("lives", (0, 0), font, WHITE, "Lives: {}")
+    hud.add("score", (0, 30), font, WHITE)
+    surf = pygame.Surface((300, 100))
+
+    hud.update({"lives": 3, "score": 0})
+    assert hud.draw(surf) == [pygame.Rect(100, 0, 150, 60)] + [f.rect.move(100, 0) for f in hud.fields.values()]
+
+    assert not hud.set("lives", 3)
+    assert hud.draw(surf) == []
+
+    before = hud.fields["score"].rect.move(100, 0)
+    assert hud.set("score", 12345)
+    assert hud.draw(surf) == [before.union(hud.fields["score"].rect.move(100, 0))]
+    assert hud.renders == 3
+
+    hud.background = pygame.Surface((150, 60))
+    assert hud.draw(surf) == [hud.rect]
+
+
+def test_shorter_text_is_erased():
+    font = text.font(None, 24)
+    hud = Hud((0, 0, 200, 40))
+    hud.add("status", (0, 0), font, WHITE)
+    hud.set("status", "UNCONTROLLABLE")
+    hud.set("status", "")
+
+    surf = pygame.Surface((200, 40), pygame.SRCALPHA)
+    hud.draw(surf)
+    assert surf.get_bounding_rect().width == 0
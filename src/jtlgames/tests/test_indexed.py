@@ -0,0 +1,85 @@
+import random
+
+import pygame
+import pytest
+
+from jtlgames import indexed
+from jtlgames.indexed import IndexedGroup
+
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, x, y, w, h):
+        super().__init__()
+        self.image = pygame.Surface((w, h))
+        self.rect = pygame.Rect(x, y, w, h)
+
+    def update(self, dx=0):
+        self.rect.x += dx
+
+
+def boxes(rng, n, size=(5, 20)):
+    return [Box(rng.randrange(-20, 400), rng.randrange(-20, 300), rng.randint(*size), rng.randint(*size))
+            for _ in range(n)]
+
+
+def test_matches_pygame():
+    rng = random.Random(2)
+    walls = boxes(rng, 200)
+    plain, fast = pygame.sprite.Group(walls), IndexedGroup(walls, size=(400, 300))
+
+    for probe in boxes(rng, 100, (1, 40)):
+        assert indexed.spritecollide(probe, fast, False) == pygame.sprite.spritecollide(probe, plain, False)
+        assert indexed.spritecollideany(probe, fast) == pygame.sprite.spritecollideany(probe, plain)
+
+    assert fast.index.candidates < fast.index.queries * len(walls) / 5
+
+
+def test_groupcollide_and_kill():
+    rng = random.Random(3)
+    walls = boxes(rng, 150)
+    shots = boxes(rng, 40, (2, 6))
+    expected_walls = pygame.sprite.Group(walls)
+    expected = pygame.sprite.groupcollide(pygame.sprite.Group(shots), expected_walls, False, True)
+    survivors = expected_walls.sprites()
+
+    for s in walls + shots:
+        s.kill()
+    fast = IndexedGroup(walls, size=(400, 300))
+    shot_group = pygame.sprite.Group(shots)
+    crashed = indexed.groupcollide(shot_group, fast, True, True)
+
+    assert crashed == expected
+    assert fast.sprites() == survivors
+    assert len(fast.index) == len(fast)
+    assert len(shot_group) == len(shots) - len(crashed)
+
+
+def test_moves_need_update_or_reindex():
+    box = Box(10, 10, 10, 10)
+    group = IndexedGroup(box, size=(400, 300))
+    probe = Box(200, 10, 5, 5)
+
+    group.update(190)
+    assert indexed.spritecollide(probe, group, False) == [box]
+
+    box.rect.x = 300
+    group.reindex()
+    assert indexed.spritecollide(probe, group, False) == []
+
+
+def test_collided_functions():
+    a, b = Box(0, 0, 10, 10), Box(5, 5, 10, 10)
+    a.mask = pygame.mask.Mask((10, 10))  # Empty, so the masks don't overlap
+    b.mask = pygame.mask.Mask((10, 10), fill=True)
+    group = IndexedGroup(b, size=(100, 100))
+
+    assert indexed.spritecollide(a, group, False, pygame.sprite.collide_mask) == []
+    assert indexed.spritecollide(a, group, False, pygame.sprite.collide_rect) == [b]
+    # Not index-aware, so every sprite is tested
+    assert indexed.spritecollide(a, group, False, pygame.sprite.collide_circle) == [b]
+
+
+def test_needs_size_without_display():
+    pygame.display.quit()
+    with pytest.raises(ValueError):
+        IndexedGroup()
@@ -0,0 +1,55 @@
+import pygame
+import pytest
+
+from jtlgames.loop import fixed_step_loop, main_loop
+from jtlgames.sim import InputScript, Simulation
+
+
+def run(screen, frames, fps=None, **kwargs):
+    """Returns the Frames fixed_step_loop yields on a virtual clock"""
+
+    yielded = []
+
+    def game():
+        for frame in fixed_step_loop(screen, **kwargs):
+            yielded.append(frame)
+
+    Simulation(frames=frames, fps=fps).run(game)
+    return yielded
+
+
+def test_fixed_step_faster_frames(display):
+    frames = run(display, 121, step_rate=30, frame_rate=120)
+
+    # 120 frames cover one second: 30 steps, one every 4 frames
+    assert sum(f.steps for f in frames) == pytest.approx(30, abs=1)
+    assert max(f.steps for f in frames) == 1
+    assert all(0 <= f.alpha < 1 for f in frames)
+    assert frames[0].dt == pytest.approx(1 / 30)
+
+
+def test_fixed_step_slower_frames(display):
+    frames = run(display, 31, step_rate=60, frame_rate=30)
+    assert sum(f.steps for f in frames) == pytest.approx(60, abs=1)
+    assert {f.steps for f in frames[2:]} == {2}
+
+
+def test_spiral_of_death_cap(display):
+    # A frame takes 100 ms, which would need 6 steps
+    frames = run(display, 10, fps=10, step_rate=60, max_steps=3)
+    assert {f.steps for f in frames[1:]} == {3}
+
+
+def test_quit_ends_loop(display):
+    count = []
+
+    def game():
+        for frame in fixed_step_loop(display):
+            count.append(frame)
+        for _ in main_loop(display):
+            count.append(None)
+
+    sim = Simulation(inputs=InputScript().event(5, pygame.QUIT).event(8, pygame.QUIT)).run(game)
+    assert sim.reason == "return"
+    assert len(count) == 8
+    assert any(e.type == pygame.QUIT for e in count[4].events)
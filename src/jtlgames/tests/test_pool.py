@@ -0,0 +1,100 @@
+import pygame
+
+from jtlgames.pool import PooledSprite, SpritePool
+
+
+class Shot(PooledSprite):
+    def __init__(self, x, speed=-5):
+        super().__init__()
+        self.image = pygame.Surface((2, 6))
+        self.reset(x, speed)
+
+    def reset(self, x, speed=-5):
+        self.rect = self.image.get_rect(midbottom=(x, 100))
+        self.speed = speed
+
+    def update(self):
+        self.rect.y += self.speed
+        if self.rect.bottom < 0:
+            self.kill()
+
+
+class Spark(object):
+    def __init__(self, life):
+        self.reset(life)
+
+    def reset(self, life):
+        self.life = life
+
+
+def test_kill_recycles():
+    pool = SpritePool(Shot)
+    shots, everything = pygame.sprite.Group(), pygame.sprite.Group()
+
+    first = pool.get(10, groups=(shots, everything))
+    assert first in shots and first in everything
+    assert (pool.created, pool.in_use, pool.free) == (1, 1, 0)
+
+    first.kill()
+    assert not first.alive()
+    assert (pool.released, pool.in_use, pool.free) == (1, 0, 1)
+
+    # A second kill, like a sprite hit twice in one frame, doesn't release it twice
+    first.kill()
+    assert pool.free == 1
+
+    second = pool.get(50, speed=-9, groups=(shots,))
+    assert second is first
+    assert second.rect.midbottom == (50, 100) and second.speed == -9
+    assert second.groups() == [shots]
+    assert (pool.created, pool.reused) == (1, 1)
+
+
+def test_steady_state():
+    pool = SpritePool(Shot)
+    shots = pygame.sprite.Group()
+
+    def play(frames):
+        for frame in range(frames):
+            if frame % 4 == 0:
+                pool.get(frame % 200, groups=(shots,))
+            shots.update()
+
+    play(200)
+    created = pool.created
+    play(1000)
+
+    assert pool.created == created
+    assert pool.in_use == len(shots)
+    assert pool.reused > 200
+
+
+def test_collide_kill_releases():
+    pool = SpritePool(Shot)
+    shots = pygame.sprite.Group()
+    for x in range(0, 100, 10):
+        pool.get(x, groups=(shots,))
+
+    wall = pygame.sprite.Sprite()
+    wall.rect = pygame.Rect(0, 50, 35, 100)
+    assert len(pygame.sprite.spritecollide(wall, shots, True)) == 4
+    assert pool.free == 4 and len(shots) == 6
+
+
+def test_plain_objects_and_prefill():
+    pool = SpritePool(Spark)
+    pool.prefill(3, 0)
+    assert (pool.created, pool.free, pool.in_use) == (3, 3, 0)
+
+    sparks = [pool.get(10) for _ in range(4)]
+    assert all(s.life == 10 for s in sparks)
+    assert (pool.created, pool.reused) == (4, 3)
+
+    for s in sparks:
+        pool.release(s)
+    pool.release(sparks[0])
+    assert pool.free == 4 and pool.in_use == 0
+    assert "4 created" in str(pool)
+
+    pool.clear()
+    assert pool.free == 0
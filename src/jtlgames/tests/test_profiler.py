@@ -0,0 +1,64 @@
+import csv
+import json
+import time
+
+import pygame
+import pytest
+
+from jtlgames.loop import main_loop
+from jtlgames.profiler import FrameProfiler
+
+
+def test_phases_and_percentiles():
+    profiler = FrameProfiler(phases=("a", "b"), window=100)
+
+    for i in range(150):
+        profiler.begin()
+        profiler.mark("a")
+        if i % 10 == 0:
+            time.sleep(0.002)
+        profiler.mark("b")
+        profiler.end()
+
+    assert profiler.frames == 150
+    assert len(profiler) == 100
+    p = profiler.percentiles("b")
+    assert p[50] < 1 <= p[95] <= p[99]
+    assert profiler.percentile("a", 100) < 1
+    summary = profiler.summary()
+    assert summary["b"]["share"] + summary["a"]["share"] == pytest.approx(1)
+    assert summary["total"]["p99"] >= p[99]
+
+
+def test_export(tmp_path):
+    profiler = FrameProfiler(window=3)
+    for _ in range(5):
+        profiler.begin()
+        profiler.mark("update")
+        profiler.end()
+
+    with open(profiler.export(tmp_path / "frames.csv")) as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["frame", "events", "update", "overlay", "flip", "tick", "total"]
+    assert [row[0] for row in rows[1:]] == ["2", "3", "4"]
+
+    data = json.loads(profiler.export(tmp_path / "frames.json").read_text())
+    assert data["phases"][-1] == "total"
+    assert len(data["frames"]) == 3
+    assert set(data["summary"]["update"]) == {"p50", "p95", "p99", "share"}
+
+
+def test_main_loop():
+    pygame.init()
+    screen = pygame.display.set_mode((200, 200))
+    profiler = FrameProfiler()
+
+    for frame, _ in enumerate(main_loop(screen, frame_rate=200, profiler=profiler, overlay=True)):
+        time.sleep(0.001)
+        if frame == 10:
+            break
+
+    assert profiler.frames == 10
+    assert profiler.percentile("update", 50) >= 1
+    assert all(t > 0 for t in profiler.times("overlay"))
+    pygame.quit()
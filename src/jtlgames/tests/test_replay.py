@@ -0,0 +1,110 @@
+import random
+
+import pygame
+import pytest
+
+from jtlgames.replay import Recorder, Replay
+
+# The real event queue, which a Recorder reads while the game's calls are patched
+post = pygame.event.post
+
+
+def game(log):
+    """Moves a dot with the arrow keys, jitters it randomly, and counts space presses"""
+
+    pygame.init()
+    screen = pygame.display.set_mode((60, 60))
+    clock = pygame.time.Clock()
+    x = 30
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                log.append(pygame.time.get_ticks())
+
+        keys = pygame.key.get_pressed()
+        x += 2 * (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) + random.randint(-1, 1)
+        screen.fill((0, 0, 0))
+        screen.set_at((x % 60, 30), (255, 255, 255))
+        pygame.display.flip()
+        clock.tick(60)
+
+
+def press(key, up=True):
+    post(pygame.event.Event(pygame.KEYDOWN, key=key))
+    if up:
+        post(pygame.event.Event(pygame.KEYUP, key=key))
+
+
+def typing(sim):
+    """Stands in for a player, on the real event queue"""
+
+    if sim.frame == 10:
+        press(pygame.K_RIGHT, up=False)
+    elif sim.frame == 40:
+        post(pygame.event.Event(pygame.KEYUP, key=pygame.K_RIGHT))
+    elif sim.frame in (50, 60, 70):
+        press(pygame.K_SPACE)
+    elif sim.frame == 90:
+        post(pygame.event.Event(pygame.QUIT))
+
+
+def test_record_and_play():
+    recorded = []
+    recorder = Recorder(seed=7, realtime=False)
+    recorder.on_frame = typing
+    recorder.run(game, recorded)
+
+    replay = recorder.replay
+    assert recorder.reason == "return"
+    assert len(replay) == 91
+    assert replay.keys(20) == {pygame.K_RIGHT} and replay.keys(45) == frozenset()
+    assert len(recorded) == 3
+
+    replayed = []
+    sim = Replay.from_bytes(replay.to_bytes()).simulation().run(game, replayed)
+
+    assert sim.reason == "return"
+    assert replayed == recorded
+    assert sim.frame_hashes == recorder.frame_hashes
+    assert replay.matches(sim)
+
+
+def test_divergence_detected():
+    recorder = Recorder(seed=1, realtime=False)
+    recorder.on_frame = typing
+    recorder.run(game, [])
+
+    replay = recorder.replay
+    replay.seed = 2
+    assert replay.matches(replay.simulation().run(game, [])) is False
+
+
+def test_file_round_trip(tmp_path):
+    replay = Replay(seed=-5, fps=30, argv=["--numpy", "--asteroids", "300"])
+    for frame in range(1000):
+        held = {pygame.K_LEFT} if frame % 100 < 30 else set()
+        if frame % 7 == 0:
+            held.add(pygame.K_SPACE)
+        replay.add_frame(held, [pygame.QUIT] if frame == 999 else ())
+    replay.check = (998, 0xDEADBEEF)
+
+    path = replay.save(tmp_path / "session.jtlr")
+    loaded = Replay.load(path)
+
+    assert loaded.frames == replay.frames
+    assert (loaded.seed, loaded.fps, loaded.argv, loaded.check) == (-5, 30, replay.argv, (998, 0xDEADBEEF))
+    assert [e.type for e in loaded.events(1000)] == [pygame.QUIT]
+    assert path.stat().st_size < 1000
+
+
+def test_bad_files():
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b"not a replay")
+
+    replay = Replay()
+    replay.add_frame({pygame.K_UP})
+    with pytest.raises(ValueError):
+        Replay.from_bytes(replay.to_bytes()[:-3])
@@ -0,0 +1,48 @@
+import pygame
+import pytest
+
+from jtlgames.rotation import RotationCache
+
+
+@pytest.fixture
+def image():
+    image = pygame.Surface((20, 10), pygame.SRCALPHA)
+    image.fill((255, 0, 0, 255))
+    pygame.draw.rect(image, (0, 0, 255, 255), (0, 0, 5, 10))
+    return image
+
+
+def test_matches_rotozoom(image):
+    cache = RotationCache(image)
+    for angle in (0, 1, 45, 90, 330, 359):
+        expected = pygame.transform.rotozoom(image, angle, 1)
+        rotated = cache.get(angle)
+        assert rotated.get_size() == expected.get_size()
+        assert pygame.image.tobytes(rotated, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+
+    # Angles outside [0, 360) share the variant of the equivalent angle
+    assert cache.get(-30) is cache.get(330)
+
+
+def test_memoized(image):
+    cache = RotationCache(image, step=5)
+    first = cache.get(44)
+    assert cache.get(46) is first
+    assert cache.get(45 + 360) is first
+    assert cache.get(45, scale=2) is not first
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert cache.hit_rate == 0.5
+    assert cache.memory > 0
+
+
+def test_quantize_and_warm(image):
+    cache = RotationCache(image, step=15)
+    assert cache.quantize(-7) == 0
+    assert cache.quantize(-8) == 345
+    cache.warm()
+    assert len(cache) == 24
+    cache.clear()
+    assert len(cache) == 0 and cache.memory == 0
+
+    with pytest.raises(ValueError):
+        RotationCache(image, step=0)
@@ -0,0 +1,99 @@
+import asyncio
+import random
+import sys
+import time
+
+import pygame
+import pytest
+
+from jtlgames.sim import InputScript, RandomInput, Simulation
+
+
+def game(log):
+    """A tiny game: a dot that moves with the arrow keys and jitters randomly"""
+
+    pygame.init()
+    screen = pygame.display.set_mode((50, 50))
+    clock = pygame.time.Clock()
+    x = 25
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return
+            if event.type == pygame.KEYDOWN:
+                log.append(("down", event.key, pygame.time.get_ticks()))
+
+        keys = pygame.key.get_pressed()
+        x += keys[pygame.K_RIGHT] - keys[pygame.K_LEFT] + random.randint(-1, 1)
+        screen.fill((0, 0, 0))
+        screen.set_at((x % 50, 25), (255, 255, 255))
+        pygame.display.flip()
+        clock.tick(50)
+
+
+def test_frames_and_clock():
+    start = time.perf_counter()
+    sim = Simulation(frames=500).run(game, [])
+
+    assert sim.frame == 500
+    assert sim.reason == "frames"
+    assert sim.ticks == 499 * 20
+    assert time.perf_counter() - start < 10
+
+
+def test_input_and_events():
+    log = []
+    inputs = InputScript().hold(pygame.K_RIGHT, 10, 20).press(pygame.K_LEFT, 30).event(40, pygame.QUIT)
+    sim = Simulation(inputs=inputs).run(game, log)
+
+    assert sim.reason == "return"
+    assert sim.frame == 40
+    assert log == [("down", pygame.K_RIGHT, 9 * 20), ("down", pygame.K_LEFT, 29 * 20)]
+
+
+def test_deterministic():
+    def play(seed):
+        inputs = RandomInput([pygame.K_LEFT, pygame.K_RIGHT], seed=seed)
+        return Simulation(seed, frames=200, inputs=inputs, record=True).run(game, []).frame_hashes
+
+    assert play(1) == play(1)
+    assert play(1) != play(2)
+
+
+def test_patches_restored():
+    get_pressed, clock = pygame.key.get_pressed, pygame.time.Clock
+    Simulation(frames=5).run(game, [])
+    assert pygame.key.get_pressed is get_pressed
+    assert pygame.time.Clock is clock
+
+
+def test_wait_and_exit():
+    def paused():
+        pygame.display.flip()
+        event = pygame.event.wait()
+        assert event.key == pygame.K_RETURN
+        pygame.time.wait(1000)
+        sys.exit()
+
+    sim = Simulation(inputs=InputScript().press(pygame.K_RETURN, 100)).run(paused)
+    assert sim.reason == "exit"
+    assert sim.frame == 100
+
+    sim = Simulation(inputs=InputScript()).run(paused)
+    assert sim.reason == "input"
+
+
+def test_coroutine():
+    async def main():
+        clock = pygame.time.Clock()
+        while True:
+            pygame.display.update()
+            clock.tick(60)
+            await asyncio.sleep(0)
+
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    sim = Simulation(frames=30).run(main)
+    assert sim.frame == 30
+    assert sim.ticks == pytest.approx(29 * 1000 / 60, abs=1)
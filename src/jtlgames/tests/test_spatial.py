@@ -0,0 +1,74 @@
+import math
+import random
+
+import pytest
+
+from jtlgames.spatial import SpatialHash
+
+
+class Thing(object):
+    def __init__(self, pos, radius):
+        self.pos = pos
+        self.radius = radius
+
+
+def test_query_matches_brute_force():
+    rng = random.Random(1)
+    grid = SpatialHash(800, 600, cell_size=64)
+    things = [Thing((rng.uniform(0, 800), rng.uniform(0, 600)), rng.choice([10, 20, 30])) for _ in range(300)]
+    for t in things:
+        grid.insert(t, t.pos, t.radius)
+
+    for _ in range(200):
+        p = (rng.uniform(0, 800), rng.uniform(0, 600))
+        hits = [t for t in things if math.hypot(p[0] - t.pos[0], p[1] - t.pos[1]) < t.radius + 15]
+        candidates = grid.query(p, 15)
+        assert set(hits) <= set(candidates)
+        # Insertion order, so the first hit is the same as a scan's
+        assert [t for t in candidates if t in hits] == hits
+
+    assert grid.candidates < grid.queries * len(things) / 10
+
+
+def test_wrap():
+    grid = SpatialHash(800, 600, cell_size=64)
+    right = Thing((795, 300), 10)
+    grid.insert(right, right.pos, right.radius)
+
+    assert grid.query((2, 300)) == [right]
+    assert grid.query((400, 300)) == []
+    assert right not in SpatialHash(800, 600, wrap=False).query((2, 300))
+
+
+def test_no_wrap_clamps():
+    grid = SpatialHash(100, 100, cell_size=10, wrap=False)
+    outside = Thing((150, -20), 1)
+    grid.insert(outside, outside.pos)
+    assert grid.query((99, 0)) == [outside]
+
+
+def test_move_and_remove():
+    grid = SpatialHash(800, 600, cell_size=64)
+    a, b = Thing((100, 100), 5), Thing((500, 500), 5)
+    grid.insert(a, a.pos, a.radius)
+    grid.insert(b, b.pos, b.radius)
+
+    grid.move(a, (500, 505))
+    assert grid.query((500, 500)) == [a, b]
+    assert grid.query((100, 100)) == []
+    assert grid.position(a) == (500, 505)
+
+    grid.remove(a)
+    assert a not in grid and len(grid) == 1
+    with pytest.raises(KeyError):
+        grid.remove(a)
+    grid.discard(a)
+
+    grid.clear()
+    assert len(grid) == 0 and grid.query((500, 500)) == []
+
+
+def test_cells_cover_world():
+    grid = SpatialHash(800, 600, cell_size=64)
+    assert grid.cols * grid.cell_width == pytest.approx(800)
+    assert len(grid.cells((400, 300), 1000)) == grid.cols * grid.rows
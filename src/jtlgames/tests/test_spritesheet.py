@@ -1,6 +1,6 @@
 import unittest
 import pygame
-from spritesheet import SpriteSheet
+from jtlgames.spritesheet import SpriteSheet
 from pathlib import Path
 
 images  = Path(__file__).parent / 'images'
@@ -59,6 +59,57 @@ class TestSpriteSheet(unittest.TestCase):
         self.assertIsInstance(images[1], pygame.Surface)
         self.assertIsInstance(images[2], pygame.Surface)
 
+    def test_image_at_is_cached(self):
+        """Test that image_at returns the same surface for the same arguments."""
+        image = self.spritesheet.image_at(9, colorkey=-1)
+        self.assertIs(self.spritesheet.image_at((1, 1), colorkey=-1), image)
+        self.assertIsNot(self.spritesheet.image_at(9), image)
+        self.assertIsNotNone(image.get_colorkey())
+        self.assertIsNone(self.spritesheet.image_at(9).get_colorkey())
+
+    def test_image_at_scale_and_flip(self):
+        """Test the scale and flip arguments of image_at."""
+        image = self.spritesheet.image_at(0, scale=2)
+        self.assertEqual(image.get_size(), (32, 32))
+        self.assertEqual(self.spritesheet.image_at(0, scale=(8, 24)).get_size(), (8, 24))
+        self.assertIs(self.spritesheet.image_at(0, flip=(False, False)), self.spritesheet.image_at(0))
+
+        flipped = self.spritesheet.image_at(0, flip=(True, False))
+        plain = self.spritesheet.image_at(0)
+        self.assertEqual(flipped.get_at((0, 0)), plain.get_at((15, 0)))
+
+    def test_strip_and_compose_share_frames(self):
+        """Test that load_strip and compose_horiz reuse cached frames."""
+        strip = self.spritesheet.load_strip(0, 3, colorkey=-1)
+        self.assertIs(strip[1], self.spritesheet.image_at(1, colorkey=-1))
+
+        composed = self.spritesheet.compose_horiz([0, 1, 2], colorkey=-1)
+        self.assertEqual(composed.get_size(), (48, 16))
+        self.assertIs(self.spritesheet.compose_horiz([0, 1, 2], colorkey=-1), composed)
+
+        with_alpha = self.spritesheet.compose_horiz([0, 1, 2], alpha=True)
+        self.assertIsNot(with_alpha, self.spritesheet.compose_horiz([0, 1, 2]))
+        self.assertIs(self.spritesheet.compose_horiz([0, 1, 2], alpha=True), with_alpha)
+
+        self.spritesheet.clear_cache()
+        self.assertIsNot(self.spritesheet.image_at(1, colorkey=-1), strip[1])
+
+    def test_subsurface_mode(self):
+        """Test that subsurface mode returns views into the sheet."""
+        ss = SpriteSheet(self.filename, self.cellsize, subsurface=True)
+
+        strip = ss.load_strip(0, 3)
+        self.assertIs(strip[1].get_parent(), ss.sheet)
+        self.assertEqual(strip[1].get_offset(), (16, 0))
+
+        keyed = ss.image_at(1, colorkey=-1)
+        self.assertIsNone(keyed.get_parent())
+        self.assertIsNone(strip[1].get_colorkey())
+
+        converted = ss.image_at(1, alpha=True)
+        self.assertIsNone(converted.get_parent())
+        self.assertTrue(converted.get_flags() & pygame.SRCALPHA)
+
     def tearDown(self):
         """Clean up after tests."""
         pygame.quit()
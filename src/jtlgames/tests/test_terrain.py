@@ -0,0 +1,93 @@
+import pygame
+import pytest
+
+from jtlgames.terrain import ChunkedTerrain
+
+
+def test_chunks_are_generated_from_the_seed():
+    terrain = ChunkedTerrain(seed=3, max_chunks=2)
+    first = terrain.chunk(5)
+    assert terrain.chunk(5) is first
+
+    terrain.chunk(6)
+    terrain.chunk(7)  # Drops chunk 5
+    again = terrain.chunk(5)
+    assert again is not first
+    assert again.points == first.points and [p.x for p in again.pads] == [p.x for p in first.pads]
+    assert terrain.generated == 4
+
+    assert ChunkedTerrain(seed=4).chunk(5).points != first.points
+
+
+def test_chunks_join_up():
+    terrain = ChunkedTerrain(seed=1, chunk_width=200)
+    for index in range(-3, 3):
+        left, right = terrain.chunk(index), terrain.chunk(index + 1)
+        assert left.points[-1] == (200, right.points[0][1])
+        assert terrain.height_at(right.x) == right.points[0][1]
+
+
+def test_height_at_interpolates_the_outline():
+    terrain = ChunkedTerrain(seed=2, chunk_width=200, base_y=300)
+    chunk = terrain.chunk(-2)
+    for (x1, y1), (x2, y2) in zip(chunk.points, chunk.points[1:]):
+        for x in (x1, x1 + 0.25, (x1 + x2) / 2, x2 - 0.5):
+            expected = y1 + (x - x1) / (x2 - x1) * (y2 - y1)
+            assert terrain.height_at(chunk.x + x) == pytest.approx(expected)
+
+
+def test_pads():
+    terrain = ChunkedTerrain(seed=5, chunk_width=300, base_y=400, pad_chance=0.5, max_pads=2)
+    pads = list(terrain.pads_between(0, 3000))
+    assert pads and all(0 <= pad.x <= 3000 for pad in pads)
+    assert [pad.x for pad in pads] == sorted(pad.x for pad in pads)
+
+    for pad in pads:
+        index = terrain.index_at(pad.x)
+        assert index == terrain.index_at(pad.x + pad.width)
+        assert len(terrain.chunk(index).pads) <= 2
+        assert terrain.pad_at(pad.x + pad.width / 2) is pad
+        assert terrain.height_at(pad.x) == terrain.height_at(pad.x + pad.width) == 400
+        assert terrain.pad_at(pad.x - 1) is None
+
+
+def test_pad_factory():
+    class Zone(object):
+        def __init__(self, x, width):
+            self.x, self.width = x, width
+            self.color = (0, 255, 0)
+
+    pygame.init()
+    terrain = ChunkedTerrain(seed=5, chunk_width=300, base_y=100, pad_chance=1, pad_factory=Zone)
+    zone = terrain.chunk(0).pads[0]
+    assert isinstance(zone, Zone) and terrain.pad_at(zone.x + 1) is zone
+
+    screen = pygame.Surface((300, 200))
+    terrain.draw(screen)
+    assert screen.get_at((zone.x + zone.width // 2, 100))[:3] == (0, 255, 0)
+    pygame.quit()
+
+
+def test_draw_keeps_a_bounded_number_of_images():
+    pygame.init()
+    screen = pygame.Surface((600, 600))
+    terrain = ChunkedTerrain(seed=6, chunk_width=256, base_y=500, max_chunks=16, max_images=4)
+
+    for camera_x in range(0, 20000, 50):
+        terrain.draw(screen, camera_x)
+        terrain.height_at(camera_x + 300)
+
+    assert len(terrain._images) == 4 and len(terrain._chunks) == 16
+    assert terrain.rendered == 20000 // 256 + 3
+
+    # The outline is drawn where the terrain says it is
+    screen.fill((0, 0, 0))
+    terrain.draw(screen, 1000, 100)
+    x = next(x for x in range(1100, 1600) if terrain.pad_at(x) is None)
+    assert screen.get_at((x - 1000, round(terrain.height_at(x)) - 100))[:3] == terrain.color
+    pygame.quit()
+
+
+def test_chunk_width_must_fit_a_pad():
+    with pytest.raises(ValueError):
+        ChunkedTerrain(chunk_width=90, pad_widths=(80,))
@@ -0,0 +1,58 @@
+import pytest
+
+from jtlgames import text
+
+WHITE = (255, 255, 255)
+
+
+pytestmark = pytest.mark.usefixtures("display")
+
+
+def test_fonts_are_shared():
+    assert text.font(None, 20) is text.font(None, 20)
+    assert text.font(None, 20) is not text.font(None, 21)
+    assert text.sysfont(None, 16) is text.sysfont(None, 16)
+
+
+def test_render_cache():
+    cache = text.TextCache(maxsize=2)
+    f = text.font(None, 20)
+    first = cache.render(f, 42, WHITE)
+    assert cache.render(f, "42", (255, 255, 255)) is first
+    assert cache.render(f, "42", (255, 0, 0)) is not first
+    cache.render(f, "43", WHITE)
+    assert len(cache) == 2
+    assert cache.render(f, 42, WHITE) is not first  # Evicted
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_glyph_atlas():
+    f = text.font(None, 20)
+    glyphs = text.GlyphAtlas(f, WHITE)
+    image = glyphs.render("1234")
+    assert image.get_size() == glyphs.size("1234")
+    assert image.get_height() == f.get_linesize()
+    assert image.get_width() == sum(f.size(c)[0] for c in "1234")
+
+    # The pixels of each glyph are copied unchanged
+    one = f.render("1", True, WHITE)
+    assert image.get_at((one.get_width() // 2, one.get_height() // 2)) == \
+        one.get_at((one.get_width() // 2, one.get_height() // 2))
+
+    # Characters outside the atlas are added on demand
+    assert glyphs.render("x").get_width() == f.size("x")[0]
+
+
+def test_counter_only_renders_changes():
+    counter = text.Counter(text.font(None, 20), WHITE, "Score: {}")
+    first = counter.render(10)
+    assert counter.changed and counter.text == "Score: 10"
+    assert counter.render(10) is first and not counter.changed
+    assert counter.render(11) is not first and counter.changed
+
+    # Equal values that format differently
+    zero = text.Counter(text.font(None, 20), WHITE)
+    assert zero.render(-0.0) is not zero.render(0.0) and zero.text == "0.0"
+
+    glyph_counter = text.Counter(None, WHITE, glyphs=text.GlyphAtlas(text.font(None, 20), WHITE))
+    assert glyph_counter.render(1.5).get_width() == glyph_counter.glyphs.size("1.5")[0]